@@ -0,0 +1,75 @@
+'''Time and memory of construction of small objects.
+
+Objects of 10 samples are created from an existing axis and y, so
+the result shows the overhead of the instance itself. Time is the best of
+`--repeat` runs of `--number` constructions (timeit), memory is measured by
+tracemalloc and excludes y (and the cached array of the axis).
+
+Run from the root of repository:
+
+    python benchmarks/construction.py
+'''
+import argparse
+import gc
+import timeit
+import tracemalloc
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+from sweep_design.axis import ArrayAxis
+from sweep_design.relation import Relation
+from sweep_design.signal import Signal
+from sweep_design.spectrum import Spectrum
+
+SIZE = 10
+
+
+def _get_cases() -> List[Tuple[str, Callable[[], object]]]:
+    axis = ArrayAxis(0., SIZE - 1., 1.)
+    y = np.arange(SIZE, dtype=float)
+    return [
+        ("ArrayAxis", lambda: ArrayAxis(0., SIZE - 1., 1.)),
+        ("Relation", lambda: Relation(axis, y, copy=False)),
+        ("Signal", lambda: Signal(axis, y, copy=False)),
+        ("Spectrum", lambda: Spectrum(axis, y, copy=False)),
+    ]
+
+
+def measure_time(
+    create: Callable[[], object], number: int, repeat: int
+) -> float:
+    '''Best time of one construction in nanoseconds.'''
+    times = timeit.repeat(create, number=number, repeat=repeat)
+    return min(times) / number * 1e9
+
+
+def measure_memory(create: Callable[[], object], count: int = 1000) -> float:
+    '''Memory of one instance in bytes (mean over `count` instances).'''
+    # The list is allocated before tracing, so it is not counted.
+    instances: List[object] = [None] * count
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for index in range(count):
+        instances[index] = create()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=200000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'class':10} {'time, ns':>10} {'memory, B':>10}")
+    for name, create in _get_cases():
+        time = measure_time(create, args.number, args.repeat)
+        memory = measure_memory(create)
+        print(f"{name:10} {time:10.0f} {memory:10.0f}")
+
+
+if __name__ == "__main__":
+    main()
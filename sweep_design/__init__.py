@@ -7,12 +7,14 @@ from .axis import ArrayAxis as ArrayAxis
 from .relation import Relation as Relation
 
 from .spectrum import Spectrum as Spectrum
+from .spectrum import SparseSpectrum as SparseSpectrum
 from .signal import Signal as Signal
 from .sweep import Sweep as Sweep
 
 from .uncalculated_sweep import UncalculatedSweep as UncalculatedSweep
 from .uncalculated_sweep import ApriorUncalculatedSweep as ApriorUncalculatedSweep
 from .spectrogram import Spectrogram as Spectrogram
+from .spectrogram import SpectrogramPyramid as SpectrogramPyramid
 
 from .config.base_config import Config as Config
 from .config.sweep_config import SweepConfig as SweepConfig
@@ -1,5 +1,5 @@
 from copy import copy
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -8,6 +8,8 @@ from .help_types import ArrayLike, RealNumber
 
 class ArrayAxis:
 
+    __slots__ = ("_start", "_end", "_sample", "_array", "_actual_sample")
+
     def __init__(self, start: RealNumber, end: RealNumber,
                  sample: RealNumber) -> None:
         '''The representation of some array axis.
@@ -38,10 +40,7 @@ class ArrayAxis:
             np.ndarray: numpy array
         '''
         if self._array is None:
-            self._array = np.linspace(
-                self._start, self._end,
-                round(abs((self._end - self._start) / self._sample)) + 1
-            )
+            self._array = np.linspace(self._start, self._end, self.size)
 
         return self._array
 
@@ -80,7 +79,9 @@ class ArrayAxis:
 
     @property
     def size(self) -> int:
-        return self.array.size
+        if self._array is not None:
+            return self._array.size
+        return round(abs((self._end - self._start) / self._sample)) + 1
 
     def copy(self) -> 'ArrayAxis':
         '''Copy of array axis.
@@ -90,6 +91,35 @@ class ArrayAxis:
         '''
         return copy(self)
 
+    def __copy__(self) -> 'ArrayAxis':
+        # The cached array is shared with the copy (it is not changed in
+        # place, setters reset it).
+        new = ArrayAxis.__new__(type(self))
+        new.__setstate__(get_slots_state(self))
+        return new
+
+    def __getstate__(self) -> Dict[str, Any]:
+        '''Get state of array axis for pickling.
+
+        Only start, end and sample are pickled, the cached array is not.
+
+        Returns:
+            Dict[str, Any]: state of array axis.
+        '''
+        state = get_slots_state(self)
+        state["_array"] = None
+        state["_actual_sample"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        '''Restore array axis from pickled state.
+
+        Args:
+            state (Dict[str, Any]): state of array axis.
+        '''
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def __str__(self):
         result = f"start: {self._start}\n" \
             f"end: {self._end}\n" \
@@ -116,6 +146,34 @@ def get_actual_sample(x: np.ndarray) -> RealNumber:
     return common_sample
 
 
+def get_slots_state(
+    instance: Any, exclude: Tuple[str, ...] = ()
+) -> Dict[str, Any]:
+    '''Get attributes of instance declared by `__slots__` of its class and
+    bases (and `__dict__` of subclasses without `__slots__`).
+
+    Args:
+        instance (Any): instance of class with `__slots__`.
+        exclude (Tuple[str, ...], optional): names of attributes which are
+            not collected. Defaults to ().
+
+    Returns:
+        Dict[str, Any]: attributes, which are set, by names.
+    '''
+    names: List[str] = []
+    for base in type(instance).__mro__:
+        slots = base.__dict__.get("__slots__", ())
+        slots = (slots,) if isinstance(slots, str) else slots
+        names.extend(name for name in slots
+                     if name not in ("__dict__", "__weakref__"))
+
+    state = dict(getattr(instance, "__dict__", {}))
+    for name in names:
+        if name not in exclude and hasattr(instance, name):
+            state[name] = getattr(instance, name)
+    return state
+
+
 def get_array_axis_from_array(
         x: ArrayLike, round_dx: bool = True) -> ArrayAxis:
     '''Create instance of Axis from some array of numbers.
@@ -1,5 +1,8 @@
+from typing import Optional
+
 from ..defaults import methods as dfm
 from ..axis import get_array_axis_from_array
+from ..precision import Precision
 
 
 class Config:
@@ -132,6 +135,103 @@ class Config:
 
     ---
 
+    `spectral_derivative_method`:
+
+    The method by which differentiation and integration in the frequency
+    domain are performed. The size of the result is equal to the input size.
+    Method derived from default function:
+    `sweep_design.defaults.methods.spectral_derivative`
+
+    Args:
+        y (np.ndarray): real array or arrays of signals (along the last axis).
+        sample (float): sample of time.
+        order (int, optional): order of the derivative. Negative order
+            is integration. Defaults to 1.
+        low_frequency (float, optional): frequency below which integration
+            is suppressed. Defaults to 0.0.
+
+    Returns:
+        np.ndarray: result of differentiation or integration.
+
+    ---
+
+    `band_spectrum_method`:
+
+    The method by which the spectrum is calculated only in the band of
+    frequency (zoom FFT).
+    Method derived from default function:
+    `sweep_design.defaults.methods.band_spectrum`
+
+    Args:
+        y (np.ndarray): array or arrays of signals (along the last axis).
+        sample (float): sample of time.
+        time_start (float): time of the first element of y.
+        frequency (ArrayAxis): frequencies of the result.
+
+    Returns:
+        np.ndarray: spectrum for frequencies of `frequency`.
+
+    ---
+
+    `sparse_spectrum_method`:
+
+    The method by which the spectrum is calculated at a few arbitrary
+    frequencies (dot products with complex exponentials).
+    Method derived from default function:
+    `sweep_design.defaults.methods.sparse_spectrum`
+
+    Args:
+        y (np.ndarray): array or arrays of signals (along the last axis).
+        sample (float): sample of time.
+        time_start (float): time of the first element of y.
+        frequency (np.ndarray): frequencies of the result.
+
+    Returns:
+        np.ndarray: spectrum for each frequency along the last axis.
+
+    ---
+
+    `cross_spectral_density_method`:
+
+    The method by which cross spectral density averaged by Welch's method
+    is calculated.
+    Method derived from default function:
+    `sweep_design.defaults.methods.cross_spectral_density`
+
+    Args:
+        x (np.ndarray): array or arrays of signals (along the last axis).
+        y (np.ndarray): array or arrays of signals (along the last axis).
+        sample (float): sample of time.
+        nperseg (int, optional): length of each segment. Defaults to 256.
+        hop (int, optional): step between segments. Defaults to None.
+        window (Any, optional): window. Defaults to "hann".
+        nfft (int, optional): length of FFT. Defaults to None.
+
+    Returns:
+        Tuple[FrequencyAxis, np.ndarray]: frequency and density.
+
+    ---
+
+    `power_spectral_density_method`:
+
+    The method by which power spectral density averaged by Welch's method
+    is calculated.
+    Method derived from default function:
+    `sweep_design.defaults.methods.power_spectral_density`
+
+    Args:
+        x (np.ndarray): array or arrays of signals (along the last axis).
+        sample (float): sample of time.
+        nperseg (int, optional): length of each segment. Defaults to 256.
+        hop (int, optional): step between segments. Defaults to None.
+        window (Any, optional): window. Defaults to "hann".
+        nfft (int, optional): length of FFT. Defaults to None.
+
+    Returns:
+        Tuple[FrequencyAxis, np.ndarray]: frequency and density.
+
+    ---
+
     `correlate_method`:
 
     The method by which the correlation is performed.
@@ -148,6 +248,25 @@ class Config:
 
     ---
 
+    `block_correlate_method`:
+
+    The method by which the correlation of long signal with short reference
+    is calculated block by block (`Signal.block_correlate`).
+    Method derived from default function:
+    `sweep_design.defaults.methods.block_correlate`
+
+    Args:
+        y (np.ndarray): long array.
+        reference (np.ndarray): reference array (not longer than y).
+        out (np.ndarray): array of size of y for the result.
+        block_size (int, optional): number of lags calculated at once.
+            Defaults to 2**16.
+
+    Returns:
+        np.ndarray: array out with correlation for non-negative lags.
+
+    ---
+
     `convolve_method`:
 
     The method by which the convolution is performed.
@@ -212,6 +331,37 @@ class Config:
 
     ---
 
+    `precision`:
+
+    Precision of data of all new instances of `Relation` and inherited
+    classes: "single" (float32 and complex64), "double" (float64 and
+    complex128) or None. Defaults to None.
+
+    If None, then the data type of input data is kept. The precision of each
+    instance can be changed by method `astype`. The default methods keep
+    the precision of input data through FFTs, interpolation, integration,
+    differentiation and spectrogram (single precision data is calculated in
+    single precision). If an operation has two instances with different
+    precisions, the result has double precision. Python numbers do not change
+    precision.
+
+    If not None, then data of each new instance (including the results of
+    all operations and spectra, spectral densities and sparse spectra of
+    signals) is converted to this precision. Integer data is converted too.
+    Only instances created with option `precision` of the constructor
+    (as by `astype`) have another precision.
+
+    ---
+
+    `chunk_size`:
+
+    Number of elements processed at once by the methods, which calculate
+    large (for example, memory-mapped) arrays chunk by chunk
+    (`Relation.map_chunks`, `Relation.operate`, `Signal.block_correlate`).
+    Defaults to 2**20.
+
+    ---
+
     The above methods can be overridden with your own here, or you can import the
     class `Config` somewhere and override it there.
     (They must be written according to the rules corresponding to
@@ -227,10 +377,20 @@ class Config:
     integrate_method = dfm.integrate
     integrate_function_method = dfm.integrate_function
     differentiate_method = dfm.differentiate
+    spectral_derivative_method = dfm.spectral_derivative
+    band_spectrum_method = dfm.band_spectrum
+    sparse_spectrum_method = dfm.sparse_spectrum
+    cross_spectral_density_method = dfm.cross_spectral_density
+    power_spectral_density_method = dfm.power_spectral_density
     correlate_method = dfm.correlate
+    block_correlate_method = dfm.block_correlate
     convolve_method = dfm.convolve
     get_common_x = dfm.get_common_x
 
     # Methods for Spectrum and Signal.
     spectrum2signal_method = dfm.spectrum2signal
     signal2spectrum_method = dfm.signal2spectrum
+
+    # Parameters.
+    precision: Optional[Precision] = None
+    chunk_size = 2**20
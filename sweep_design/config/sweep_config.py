@@ -1,4 +1,5 @@
 from ..defaults import sweep_methods as dfsm
+from ..defaults.stft import STFTSpectrogram
 
 
 class SweepConfig:
@@ -7,18 +8,23 @@ class SweepConfig:
 
     Several methods are defined for default calculations:
 
-    `spectrogram_method_default`:
+    `spectrogram_method`:
 
     The method by which the spectrogram will be calculated.
-    Method derived from default function:
-    `sweep_design.defaults.sweep_methods.get_spectrogram`
+    Default is instance of `sweep_design.defaults.stft.STFTSpectrogram`
+    with default parameters (the same result as
+    `sweep_design.defaults.sweep_methods.get_spectrogram`). Create the instance
+    with other parameters (window, hop, nfft, dtype, scaling) to change
+    the spectrogram.
 
     Args:
         sweep (relation.Relation): instance of sweep signal.
 
     Returns:
-        Spectrogram: tuple of np.ndarray. The first element is time.
-            The second is frequency. The third is matrix M x N of spectrogram.
+        Union[sweep_design.spectrogram.Spectrogram, Spectrogram]:
+            spectrogram with time and frequency axes, or tuple of np.ndarray.
+            The first element is time. The second is frequency.
+            The third is matrix M x N of spectrogram.
 
     ---
 
@@ -26,7 +32,10 @@ class SweepConfig:
 
     The method by which frequency versus time will be calculated.
     Method derived from default function:
-    `sweep_design.defaults.sweep_methods.get_f_t`
+    `sweep_design.defaults.sweep_methods.get_f_t`. For long sweeps use
+    the method `get_f_t` of an instance of
+    `sweep_design.defaults.hilbert.StreamingHilbert`, which calculates
+    the Hilbert transformation in overlapped blocks.
 
     Args:
         sweep (Relation): instance of sweep signal.
@@ -40,7 +49,10 @@ class SweepConfig:
 
     The method by which the time envelope of the signal will be calculated.
     Method derived from default function:
-    `sweep_design.defaults.sweep_methods.get_a_t`
+    `sweep_design.defaults.sweep_methods.get_a_t`. For long sweeps use
+    the method `get_a_t` of an instance of
+    `sweep_design.defaults.hilbert.StreamingHilbert`, which calculates
+    the Hilbert transformation in overlapped blocks.
 
     Args:
         sweep (Relation): instance of sweep signal.
@@ -73,7 +85,7 @@ class SweepConfig:
     """
 
     # Methods for Sweep.
-    spectrogram_method = dfsm.get_spectrogram
+    spectrogram_method = STFTSpectrogram()
     get_f_t = dfsm.get_f_t
     get_a_t = dfsm.get_a_t
 
@@ -12,6 +12,8 @@ class RelationProtocol(ABC):
 
     '''
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def array(self) -> np.ndarray:
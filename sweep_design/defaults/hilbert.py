@@ -0,0 +1,215 @@
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+from scipy import fft as sp_fft  # type: ignore
+
+from .. import relation
+from ..axis import ArrayAxis
+from ..exc import BadInputError
+from ..precision import get_dtype, get_precision
+
+
+class HilbertChunk(NamedTuple):
+    '''Instantaneous frequency and envelope of a piece of signal.'''
+    time: ArrayAxis
+    frequency: np.ndarray
+    envelope: np.ndarray
+
+
+class StreamingHilbert:
+    '''Instantaneous frequency and envelope calculated block by block.
+
+    The signal is split into blocks of `block_size` samples. The Hilbert
+    transformation of each block is calculated with `overlap` samples of
+    the neighbouring blocks on both sides. These samples are tapered by
+    a half of the Hann window and discarded afterwards, so the edge effects
+    of the short FFT do not get into the result.
+    The phase is continued from block to block, so the instantaneous
+    frequency has no jumps on the borders of blocks. The memory used by
+    intermediate arrays depends on `block_size` and `overlap` only.
+
+    Use `iter_chunks` to get the result of a long signal piece by piece.
+    Methods `get_f_t` and `get_a_t` can be set as `SweepConfig.get_f_t` and
+    `SweepConfig.get_a_t`. If the whole signal is one block, the result is
+    equal to the result of `sweep_methods.get_f_t` and `sweep_methods.get_a_t`.
+
+    The overlap should be about ten periods of the lowest frequency
+    of signal. Signal of single precision is calculated in single precision.
+    '''
+
+    def __init__(
+        self,
+        block_size: int = 2**16,
+        overlap: int = 2**12,
+        decimation: int = 1,
+    ) -> None:
+        '''Initialize the analyzer.
+
+        Args:
+            block_size (int, optional): number of samples of result calculated
+                at once. Defaults to 2**16.
+
+            overlap (int, optional): number of samples added to each side of
+                block. Defaults to 2**12.
+
+            decimation (int, optional): only each `decimation`-th sample
+                of the result is returned. Defaults to 1.
+
+        Raises:
+            BadInputError: raise exception if sizes are not positive.
+        '''
+        if block_size < 1 or decimation < 1 or overlap < 0:
+            raise BadInputError(
+                "Block size and decimation must be positive and overlap must "
+                "not be negative")
+
+        self.block_size = block_size
+        self.overlap = overlap
+        self.decimation = decimation
+
+    def __call__(
+        self, sweep: "relation.Relation"
+    ) -> Tuple["relation.Relation", "relation.Relation"]:
+        '''Calculate instantaneous frequency and envelope of signal.
+
+        Args:
+            sweep (relation.Relation): instance of sweep signal.
+
+        Returns:
+            Tuple[relation.Relation, relation.Relation]: frequency versus
+                time and envelope.
+        '''
+        frequencies: List[np.ndarray] = []
+        envelopes: List[np.ndarray] = []
+        for chunk in self.iter_chunks(sweep):
+            frequencies.append(chunk.frequency)
+            envelopes.append(chunk.envelope)
+
+        time = self.get_time(sweep)
+        return (relation.Relation(time, np.concatenate(frequencies)),
+                relation.Relation(time, np.concatenate(envelopes)))
+
+    def get_f_t(self, sweep: "relation.Relation") -> "relation.Relation":
+        '''Get Time-Frequency function from sweep signal.
+
+        Args:
+            sweep (relation.Relation): instance of sweep signal.
+
+        Returns:
+            relation.Relation: instance `Relation`
+        '''
+        return self._join(sweep, 1)
+
+    def get_a_t(self, sweep: "relation.Relation") -> "relation.Relation":
+        '''Get envelop from sweep signal.
+
+        Args:
+            sweep (relation.Relation): instance of sweep signal.
+
+        Returns:
+            relation.Relation: instance `Relation`
+        '''
+        return self._join(sweep, 2)
+
+    def get_time(self, sweep: "relation.Relation") -> ArrayAxis:
+        '''Get time axis of result.
+
+        Args:
+            sweep (relation.Relation): instance of sweep signal.
+
+        Returns:
+            ArrayAxis: time axis.
+        '''
+        sample = sweep.sample * self.decimation
+        size = (sweep.size - 1) // self.decimation + 1
+        return ArrayAxis(sweep.start, sweep.start + (size - 1) * sample,
+                         sample)
+
+    def iter_chunks(self, sweep: "relation.Relation") -> Iterator[HilbertChunk]:
+        '''Calculate instantaneous frequency and envelope in blocks.
+
+        Args:
+            sweep (relation.Relation): instance of sweep signal.
+
+        Raises:
+            BadInputError: raise exception if the signal is complex.
+
+        Yields:
+            Iterator[HilbertChunk]: time, frequency and envelope of
+                consecutive pieces of signal.
+        '''
+        y = sweep.y
+        if np.iscomplexobj(y):
+            raise BadInputError("Hilbert transformation of complex signal "
+                                "is not supported")
+
+        dtype = get_dtype(y.dtype, get_precision(y.dtype))
+        sample = sweep.sample
+        last_phase: Optional[float] = None
+        for first in range(0, y.size, self.block_size):
+            last = min(first + self.block_size, y.size)
+            segment_first = max(first - self.overlap, 0)
+            segment_last = min(last + self.overlap, y.size)
+
+            segment = np.array(y[segment_first:segment_last], dtype=dtype)
+            _taper(segment, first - segment_first, segment_last - last)
+            real, imag = _analytic(segment)
+            block = slice(first - segment_first, last - segment_first)
+            real, imag = real[block], imag[block]
+
+            phase = np.arctan2(imag, real)
+            if last_phase is None:
+                frequency = np.concatenate(
+                    (np.zeros(1, dtype=dtype), _wrap(np.diff(phase))))
+            else:
+                frequency = _wrap(np.diff(phase, prepend=last_phase))
+            frequency /= 2.0 * np.pi * sample
+            last_phase = phase[-1]
+
+            offset = -first % self.decimation
+            if offset >= last - first:
+                continue
+            step = self.decimation
+            start = sweep.start + (first + offset) * sample
+            size = (last - first - offset - 1) // step + 1
+            yield HilbertChunk(
+                ArrayAxis(start, start + (size - 1) * step * sample,
+                          step * sample),
+                frequency[offset::step],
+                np.hypot(real, imag)[offset::step],
+            )
+
+    def _join(
+        self, sweep: "relation.Relation", index: int
+    ) -> "relation.Relation":
+        return relation.Relation(
+            self.get_time(sweep),
+            np.concatenate([chunk[index] for chunk in self.iter_chunks(sweep)])
+        )
+
+
+def _taper(segment: np.ndarray, left: int, right: int) -> None:
+    if left:
+        segment[:left] *= 0.5 - 0.5 * np.cos(np.pi * np.arange(left) / left)
+    if right:
+        segment[-right:] *= 0.5 + 0.5 * np.cos(
+            np.pi * np.arange(1, right + 1) / right)
+
+
+def _analytic(segment: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # The analytic signal is segment + 1j * imag. The Hilbert transformation
+    # is calculated by the real FFT, so the complex spectrum of full length
+    # (as in `scipy.signal.hilbert`) is not created.
+    spectrum = sp_fft.rfft(segment)
+    spectrum[0] = 0.0
+    if segment.size % 2 == 0:
+        spectrum[-1] = 0.0
+    spectrum *= -1j
+    return segment, sp_fft.irfft(spectrum, segment.size)
+
+
+def _wrap(phase_difference: np.ndarray) -> np.ndarray:
+    # Same as the difference of phase unwrapped by `np.unwrap`.
+    wrapped = np.mod(phase_difference + np.pi, 2 * np.pi) - np.pi
+    wrapped[(wrapped == -np.pi) & (phase_difference > 0)] = np.pi
+    return wrapped
@@ -1,10 +1,13 @@
 """This is where default methods are defined."""
-from typing import TYPE_CHECKING, Callable, Optional, Tuple, Type, Union
+from typing import TYPE_CHECKING, Any, Callable, Optional, Tuple, Type, Union
 
 import numpy as np
 import scipy  # type: ignore
 from packaging import version
+from scipy import fft as sp_fft  # type: ignore
+from scipy.fftpack import next_fast_len  # type: ignore
 from scipy.interpolate import interp1d  # type: ignore
+from scipy.signal import csd, welch  # type: ignore
 
 from sweep_design import exc  # type: ignore
 
@@ -12,7 +15,8 @@ from ..axis import ArrayAxis, get_array_axis_from_array
 from ..help_types import X, Y
 from ..core import MathOperation
 from ..help_types import Number
-from ..exc import TypeFuncError
+from ..exc import BadInputError, TypeFuncError
+from ..precision import get_dtype, get_precision, keep_precision
 
 if version.parse(scipy.__version__) < version.parse("1.6.0"):
     from scipy.integrate import cumtrapz, quad, trapz  # type: ignore
@@ -39,6 +43,12 @@ if TYPE_CHECKING:
     from ..relation import Relation
 
 
+def _get_fft(array: np.ndarray) -> Any:
+    # `numpy.fft` always calculates in double precision,
+    # `scipy.fft` keeps single precision.
+    return sp_fft if get_precision(array.dtype) == "single" else np.fft
+
+
 def math_operation(
     y1: np.ndarray,
     y2: Union[np.ndarray, Number],
@@ -102,7 +112,8 @@ def integrate(relation: 'Relation') -> Tuple[XAxis, Y]:
     array_axis = relation.x.copy()
     dx = array_axis.sample
     array_axis.start = array_axis.start + array_axis.sample
-    return array_axis, cumulative_integration(relation.y) * (dx)
+    return array_axis, keep_precision(
+        cumulative_integration(relation.y) * (dx), relation.y)
 
 
 def differentiate(relation: 'Relation') -> Tuple[XAxis, Y]:
@@ -121,7 +132,294 @@ def differentiate(relation: 'Relation') -> Tuple[XAxis, Y]:
     dx = array_axis.sample
     array_axis.start = array_axis.start + array_axis.sample / 2
     array_axis.end = array_axis.end - array_axis.sample / 2
-    return array_axis, np.diff(relation.y) / (dx)
+    return array_axis, keep_precision(np.diff(relation.y) / (dx), relation.y)
+
+
+def spectral_derivative(
+    y: np.ndarray, sample: float, order: int = 1, low_frequency: float = 0.0
+) -> np.ndarray:
+    '''Differentiation and integration in the frequency domain.
+
+    The spectrum of y is multiplied by (2πif)^order in one forward and
+    one inverse Fourier transform. If the order is negative, then
+    the result is the integral of y. To avoid division by zero,
+    the integration uses regularization:
+    (2πif)^order -> conj(D) / (|D|^2 + (2π low_frequency)^(-2 order)),
+    where D = (2πif)^(-order). The zero frequency is always suppressed.
+
+    The size of the result is equal to the size of y. The transformation
+    is applied along the last axis, so y can contain many signals
+    (2D array, each row is a signal).
+
+    Args:
+        y (np.ndarray): real array or arrays of signals.
+
+        sample (float): sample of time.
+
+        order (int, optional): order of the derivative. Negative order
+            is integration. Defaults to 1.
+
+        low_frequency (float, optional): frequency below which integration
+            is suppressed. Defaults to 0.0.
+
+    Returns:
+        np.ndarray: result of differentiation or integration.
+    '''
+    size = y.shape[-1]
+    fft = _get_fft(y)
+    spectrum = fft.rfft(y, axis=-1)
+    operator = 2j * np.pi * np.fft.rfftfreq(size, d=sample)
+
+    if order >= 0:
+        kernel = operator ** order
+    else:
+        derivative = operator ** (-order)
+        regularization = (2 * np.pi * low_frequency) ** (-2 * order)
+        denominator = np.abs(derivative) ** 2 + regularization
+        kernel = np.divide(
+            np.conj(derivative), denominator,
+            out=np.zeros_like(derivative), where=denominator != 0
+        )
+
+    if order % 2 == 1 and size % 2 == 0:
+        kernel[-1] = 0.0
+
+    return fft.irfft(spectrum * keep_precision(kernel, y), size, axis=-1)
+
+
+def band_spectrum(
+    y: np.ndarray, sample: float, time_start: float, frequency: ArrayAxis
+) -> np.ndarray:
+    '''Spectrum of signal in the band of frequency (zoom FFT).
+
+    Evaluate X(f) = sum(y_n exp(-2πi f t_n)), t_n = time_start + n sample
+    only for frequencies of `frequency` using the chirp-z transform
+    (Bluestein algorithm). Cost is one FFT of size about
+    `y.size + frequency.size`, instead of FFT with resolution `frequency.sample`
+    over the whole band up to the Nyquist frequency. On the frequencies of
+    `numpy.fft.rfftfreq` the result is equal to `signal2spectrum`.
+
+    The transformation is applied along the last axis, so y can contain many
+    signals (2D array, each row is a signal).
+
+    Args:
+        y (np.ndarray): array or arrays of signals.
+
+        sample (float): sample of time.
+
+        time_start (float): time of the first element of y.
+
+        frequency (ArrayAxis): frequencies of the result.
+
+    Returns:
+        np.ndarray: spectrum (complex) for frequencies of `frequency`.
+    '''
+    size = y.shape[-1]
+    frequency_size = frequency.size
+    fft_size = next_fast_len(size + frequency_size - 1)
+
+    frequency_sample = (frequency.end - frequency.start) / \
+        (frequency_size - 1) if frequency_size > 1 else 0.0
+
+    # Phases grow as n^2, so the chirp is reduced modulo 2π before exp.
+    step = frequency_sample * sample
+    n = np.arange(max(size, frequency_size), dtype=float)
+    chirp = np.exp(-1j * np.pi * np.mod(step * n**2, 2.0))
+
+    factor = chirp[:size] * \
+        np.exp(-2j * np.pi * np.mod(frequency.start * sample * n[:size], 1.0))
+    kernel = np.zeros(fft_size, dtype=complex)
+    kernel[:frequency_size] = np.conj(chirp[:frequency_size])
+    kernel[fft_size - size + 1:] = np.conj(chirp[1:size][::-1])
+
+    # Phases are calculated in double precision, FFTs in precision of y.
+    fft = _get_fft(y)
+    result = fft.ifft(
+        fft.fft(y * keep_precision(factor, y), fft_size, axis=-1) *
+        fft.fft(keep_precision(kernel, y)),
+        axis=-1
+    )[..., :frequency_size]
+
+    shift = np.exp(-2j * np.pi * frequency.array * time_start)
+    return result * keep_precision(chirp[:frequency_size] * shift, y)
+
+
+def sparse_spectrum(
+    y: np.ndarray,
+    sample: float,
+    time_start: float,
+    frequency: np.ndarray,
+    chunk_size: int = 65536,
+) -> np.ndarray:
+    '''Spectrum of signal at a few arbitrary frequencies.
+
+    Evaluate X(f) = sum(y_n exp(-2πi f t_n)), t_n = time_start + n sample
+    as dot products of y with the complex exponentials of each frequency.
+    Cost is O(N K) for N samples and K frequencies, so it is faster than
+    the full FFT when K is small. On the frequencies of `numpy.fft.rfftfreq`
+    the result is equal to `signal2spectrum`.
+
+    The transformation is applied along the last axis, so y can contain many
+    signals (2D array, each row is a signal). The exponentials are calculated
+    once for all signals, in chunks of `chunk_size` samples.
+
+    Args:
+        y (np.ndarray): array or arrays of signals.
+
+        sample (float): sample of time.
+
+        time_start (float): time of the first element of y.
+
+        frequency (np.ndarray): frequencies of the result.
+
+        chunk_size (int, optional): number of samples processed at once.
+            Defaults to 65536.
+
+    Returns:
+        np.ndarray: spectrum (complex) for each frequency of `frequency`
+            along the last axis.
+    '''
+    frequency = np.asarray(frequency, dtype=float)
+    step = frequency * sample
+    result = np.zeros(y.shape[:-1] + frequency.shape,
+                      dtype=get_dtype(complex, get_precision(y.dtype)))
+
+    # Phases are calculated in double precision, products in precision of y.
+    for first in range(0, y.shape[-1], chunk_size):
+        n = np.arange(first, min(first + chunk_size, y.shape[-1]))
+        phase = 2 * np.pi * np.mod(np.outer(n, step), 1.0)
+        chunk = y[..., first:first + chunk_size]
+        if np.iscomplexobj(chunk):
+            result += chunk @ keep_precision(np.exp(-1j * phase), y)
+        else:
+            result.real += chunk @ keep_precision(np.cos(phase), y)
+            result.imag -= chunk @ keep_precision(np.sin(phase), y)
+
+    return result * keep_precision(
+        np.exp(-2j * np.pi * frequency * time_start), y)
+
+
+def cross_spectral_density(
+    x: np.ndarray,
+    y: np.ndarray,
+    sample: float,
+    nperseg: int = 256,
+    hop: Optional[int] = None,
+    window: Any = "hann",
+    nfft: Optional[int] = None,
+) -> Tuple[FrequencyAxis, np.ndarray]:
+    '''Cross spectral density of signals averaged by Welch's method.
+
+    Using the `scipy.signal.csd` function (one-sided density, segments are
+    detrended by the mean). For power spectral density pass the same
+    array as x and y.
+
+    The density is calculated along the last axis, so x and y can contain
+    many signals (2D arrays, each row is a signal, or one of them is 1D).
+
+    Args:
+        x (np.ndarray): array or arrays of signals.
+
+        y (np.ndarray): array or arrays of signals.
+
+        sample (float): sample of time.
+
+        nperseg (int, optional): length of each segment. If signal is
+            shorter, the length of signal is used. Defaults to 256.
+
+        hop (int, optional): number of samples between the starts of
+            neighbouring segments. If None, then `nperseg // 2`.
+            Defaults to None.
+
+        window (Any, optional): window, any value accepted by
+            `scipy.signal.get_window`. Defaults to "hann".
+
+        nfft (int, optional): length of FFT. If None, then equal to
+            `nperseg`. Defaults to None.
+
+    Raises:
+        BadInputError: raise exception if hop is not from 1 to nperseg.
+
+    Returns:
+        Tuple[FrequencyAxis, np.ndarray]: frequency and density (complex)
+            along the last axis.
+    '''
+    nperseg, noverlap, nfft = _get_welch_sizes(
+        min(x.shape[-1], y.shape[-1]), nperseg, hop, nfft)
+
+    _, density = csd(x, y, fs=1 / sample, window=window, nperseg=nperseg,
+                     noverlap=noverlap, nfft=nfft, return_onesided=True,
+                     axis=-1)
+    return _get_welch_frequency(nfft, sample), density
+
+
+def power_spectral_density(
+    x: np.ndarray,
+    sample: float,
+    nperseg: int = 256,
+    hop: Optional[int] = None,
+    window: Any = "hann",
+    nfft: Optional[int] = None,
+) -> Tuple[FrequencyAxis, np.ndarray]:
+    '''Power spectral density of signals averaged by Welch's method.
+
+    Using the `scipy.signal.welch` function (one-sided density, segments are
+    detrended by the mean). The result is equal to the real part of
+    `cross_spectral_density` of x with itself.
+
+    The density is calculated along the last axis, so x can contain many
+    signals (2D array, each row is a signal).
+
+    Args:
+        x (np.ndarray): array or arrays of signals.
+
+        sample (float): sample of time.
+
+        nperseg (int, optional): length of each segment. If signal is
+            shorter, the length of signal is used. Defaults to 256.
+
+        hop (int, optional): number of samples between the starts of
+            neighbouring segments. If None, then `nperseg // 2`.
+            Defaults to None.
+
+        window (Any, optional): window, any value accepted by
+            `scipy.signal.get_window`. Defaults to "hann".
+
+        nfft (int, optional): length of FFT. If None, then equal to
+            `nperseg`. Defaults to None.
+
+    Raises:
+        BadInputError: raise exception if hop is not from 1 to nperseg.
+
+    Returns:
+        Tuple[FrequencyAxis, np.ndarray]: frequency and density (real)
+            along the last axis.
+    '''
+    nperseg, noverlap, nfft = _get_welch_sizes(x.shape[-1], nperseg, hop, nfft)
+
+    _, density = welch(x, fs=1 / sample, window=window, nperseg=nperseg,
+                       noverlap=noverlap, nfft=nfft, return_onesided=True,
+                       axis=-1)
+    return _get_welch_frequency(nfft, sample), density
+
+
+def _get_welch_sizes(
+    size: int, nperseg: int, hop: Optional[int], nfft: Optional[int]
+) -> Tuple[int, int, int]:
+    if hop is not None and not 1 <= hop <= nperseg:
+        raise BadInputError(
+            f"Hop must be from 1 to nperseg ({nperseg}), got {hop}")
+
+    # If the signal is shorter than nperseg, there is only one segment.
+    nperseg = min(nperseg, size)
+    noverlap = nperseg // 2 if hop is None else max(nperseg - hop, 0)
+    nfft = nperseg if nfft is None else max(nfft, nperseg)
+    return nperseg, noverlap, nfft
+
+
+def _get_welch_frequency(nfft: int, sample: float) -> ArrayAxis:
+    frequency_sample = 1 / (nfft * sample)
+    return ArrayAxis(0.0, (nfft // 2) * frequency_sample, frequency_sample)
 
 
 def interpolate_extrapolate(
@@ -153,7 +451,7 @@ def interpolate_extrapolate(
 
     def wrapper(new_x: XAxis) -> Y:
         new_y = interpolate_extrapolate(new_x.array)
-        return new_y
+        return keep_precision(new_y, np.asarray(y))
 
     return wrapper
 
@@ -203,6 +501,51 @@ def correlate(cls: Type["Relation"], r1: "Relation",
     return x_axis, np.correlate(r1.y, r2.y, "full")
 
 
+def block_correlate(
+    y: np.ndarray, reference: np.ndarray, out: np.ndarray,
+    block_size: int = 2**16
+) -> np.ndarray:
+    '''Correlation of long array with short reference array by blocks.
+
+    The correlation is calculated for non-negative lags
+    (out[k] = sum(y[n + k] * conj(reference[n]))), that is the second half of
+    `numpy.correlate(y, reference, "full")` for arrays of equal size.
+    Blocks of `block_size` lags are calculated by the overlap-save method,
+    so only a block of y is read at once and y can be memory-mapped.
+
+    Args:
+        y (np.ndarray): long array.
+
+        reference (np.ndarray): reference array (not longer than y).
+
+        out (np.ndarray): array of size of y for the result.
+
+        block_size (int, optional): number of lags calculated at once.
+            Defaults to 2**16.
+
+    Returns:
+        np.ndarray: array out.
+    '''
+    size, reference_size = y.shape[-1], reference.shape[-1]
+    fft_size = next_fast_len(block_size + reference_size - 1)
+    fft = _get_fft(out)
+    if np.iscomplexobj(out):
+        kernel = np.conj(fft.fft(reference, fft_size))
+        for first in range(0, size, block_size):
+            last = min(first + block_size, size)
+            segment = y[first:last + reference_size - 1]
+            out[first:last] = fft.ifft(
+                fft.fft(segment, fft_size) * kernel)[:last - first]
+    else:
+        kernel = np.conj(fft.rfft(reference, fft_size))
+        for first in range(0, size, block_size):
+            last = min(first + block_size, size)
+            segment = y[first:last + reference_size - 1]
+            out[first:last] = fft.irfft(
+                fft.rfft(segment, fft_size) * kernel, fft_size)[:last - first]
+    return out
+
+
 def convolve(cls: Type["Relation"], r1: "Relation",
              r2: "Relation") -> Tuple[XAxis, np.ndarray]:
     '''Convolution.
@@ -239,7 +582,7 @@ def _calculate_spectrum(
 
     amplitude = np.append(
         amplitude[time.array >= 0.0], amplitude[time.array < 0.0])
-    spectrum = np.fft.rfft(amplitude, size)
+    spectrum = _get_fft(amplitude).rfft(amplitude, size)
 
     if frequency is None or isinstance(frequency, int):
         np_frequency = np.fft.rfftfreq(
@@ -280,7 +623,7 @@ def signal2spectrum(
     if new_time.start > 0.0:
         new_time.start = 0.0
         amplitude = np.append(
-            np.zeros(new_time.size - amplitude.size),
+            np.zeros(new_time.size - amplitude.size, dtype=amplitude.dtype),
             amplitude)
 
     elif new_time.end < 0.0:
@@ -288,7 +631,7 @@ def signal2spectrum(
         new_time.end = 0.0
         amplitude = np.append(
             amplitude, np.zeros(
-                new_time.size - amplitude.size))
+                new_time.size - amplitude.size, dtype=amplitude.dtype))
 
     return _calculate_spectrum(new_time, amplitude, frequency)
 
@@ -324,7 +667,7 @@ def spectrum2signal(
     else:
         size = time.size
 
-    amplitude = np.fft.irfft(spectrum, size)  # type: np.ndarray
+    amplitude = _get_fft(spectrum).irfft(spectrum, size)  # type: np.ndarray
 
     if time is None or isinstance(time, int):
 
@@ -0,0 +1,217 @@
+from typing import Any, Iterator, Optional, Tuple
+
+import numpy as np
+from scipy import fft as sp_fft  # type: ignore
+from scipy.signal import get_window  # type: ignore
+
+from .. import relation
+from ..axis import ArrayAxis
+from ..exc import BadInputError
+from ..help_types import Literal
+from ..precision import get_dtype, get_precision
+from ..spectrogram import Spectrogram
+
+SpectrogramScaling = Literal["magnitude", "power", "db"]
+'''Values of image of spectrogram.
+
+"power" is power spectral density (as `scipy.signal.spectrogram`),
+"magnitude" is amplitude of the harmonic components,
+"db" is power spectral density in decibels.'''
+
+
+class STFTSpectrogram:
+    '''Spectrogram calculated by the short-time Fourier transform (STFT).
+
+    The instance is a callable object, so it can be set as
+    `SweepConfig.spectrogram_method`. The result is `Spectrogram` with
+    time and frequency axes defined by the parameters of STFT. As in
+    `get_spectrogram`, the rows of image of spectrogram go from the highest
+    frequency to the lowest.
+
+    Segments are processed in chunks of `chunk_size` segments, so the memory
+    used by intermediate arrays does not depend on the length of signal.
+    Use `iter_chunks` to get the spectrogram of a long signal piece by piece.
+
+    With default parameters the image is equal to the image of
+    `get_spectrogram` (`scipy.signal.spectrogram` with `nperseg=256`).
+    '''
+
+    def __init__(
+        self,
+        nperseg: int = 256,
+        hop: Optional[int] = None,
+        window: Any = ("tukey", 0.25),
+        nfft: Optional[int] = None,
+        scaling: SpectrogramScaling = "power",
+        dtype: Any = None,
+        detrend: bool = True,
+        chunk_size: int = 512,
+    ) -> None:
+        '''Initialize the spectrogram engine.
+
+        Args:
+            nperseg (int, optional): length of each segment. If the signal is
+                shorter, the length of signal is used. Defaults to 256.
+
+            hop (int, optional): number of samples between the starts of
+                neighbouring segments. If None, then
+                `nperseg - nperseg // 8`. Defaults to None.
+
+            window (Any, optional): window, any value accepted by
+                `scipy.signal.get_window`. Defaults to ("tukey", 0.25).
+
+            nfft (int, optional): length of FFT. If None, then equal to
+                `nperseg`. Defaults to None.
+
+            scaling (Literal[&quot;magnitude&quot;, &quot;power&quot;, &quot;db&quot;], optional):
+                values of image. Defaults to "power".
+
+            dtype (Any, optional): data type of image. If None, then float32
+                for signal of single precision, otherwise float64.
+                Signal of single precision is calculated in single precision.
+                Defaults to None.
+
+            detrend (bool, optional): If True, the mean of each segment is
+                subtracted. Defaults to True.
+
+            chunk_size (int, optional): number of segments processed at
+                once. Defaults to 512.
+
+        Raises:
+            BadInputError: raise exception if scaling is unknown or hop is
+                not from 1 to `nperseg`.
+        '''
+        if scaling not in ("magnitude", "power", "db"):
+            raise BadInputError(f"Unknown scaling of spectrogram: {scaling}")
+        if hop is not None and not 1 <= hop <= nperseg:
+            raise BadInputError(
+                f"Hop must be from 1 to nperseg ({nperseg}), got {hop}")
+
+        self.nperseg = nperseg
+        self.hop = hop
+        self.window = window
+        self.nfft = nfft
+        self.scaling = scaling
+        self.dtype = None if dtype is None else np.dtype(dtype)
+        self.detrend = detrend
+        self.chunk_size = chunk_size
+
+    def __call__(self, sweep: "relation.Relation") -> Spectrogram:
+        '''Calculate spectrogram of signal.
+
+        Args:
+            sweep (relation.Relation): instance of sweep signal.
+
+        Returns:
+            Spectrogram: time axis, frequency axis and image of spectrogram.
+        '''
+        time, frequency = self.get_axes(sweep)
+        image = np.empty((frequency.size, time.size),
+                         dtype=self._get_dtype(sweep))
+        for first, chunk in self._iter_images(sweep):
+            image[:, first:first + chunk.shape[1]] = chunk
+        return Spectrogram(time, frequency, image)
+
+    def iter_chunks(self, sweep: "relation.Relation") -> Iterator[Spectrogram]:
+        '''Calculate spectrogram of signal in chunks of `chunk_size` segments.
+
+        Args:
+            sweep (relation.Relation): instance of sweep signal.
+
+        Yields:
+            Iterator[Spectrogram]: spectrogram of consecutive pieces of signal.
+        '''
+        time, frequency = self.get_axes(sweep)
+        for first, chunk in self._iter_images(sweep):
+            start = time.start + first * time.sample
+            chunk_time = ArrayAxis(
+                start, start + (chunk.shape[1] - 1) * time.sample, time.sample)
+            yield Spectrogram(chunk_time, frequency,
+                              chunk.astype(self._get_dtype(sweep), copy=False))
+
+    def get_axes(
+        self, sweep: "relation.Relation"
+    ) -> Tuple[ArrayAxis, ArrayAxis]:
+        '''Get time and frequency axes of spectrogram of signal.
+
+        Time is the centre of each segment.
+
+        Args:
+            sweep (relation.Relation): instance of sweep signal.
+
+        Returns:
+            Tuple[ArrayAxis, ArrayAxis]: time axis and frequency axis.
+        '''
+        nperseg, hop, nfft = self._get_sizes(sweep.size)
+        sample = sweep.sample
+        segments = (sweep.size - nperseg) // hop + 1
+
+        time_start = sweep.start + nperseg / 2 * sample
+        time = ArrayAxis(time_start,
+                         time_start + (segments - 1) * hop * sample,
+                         hop * sample)
+
+        frequency_sample = 1 / (nfft * sample)
+        frequency = ArrayAxis(0.0, (nfft // 2) * frequency_sample,
+                              frequency_sample)
+        return time, frequency
+
+    def _get_sizes(self, size: int) -> Tuple[int, int, int]:
+        nperseg = min(self.nperseg, size)
+        hop = nperseg - nperseg // 8 if self.hop is None else self.hop
+        nfft = nperseg if self.nfft is None else max(self.nfft, nperseg)
+        return nperseg, hop, nfft
+
+    def _iter_images(
+        self, sweep: "relation.Relation"
+    ) -> Iterator[Tuple[int, np.ndarray]]:
+        if np.iscomplexobj(sweep.y):
+            raise BadInputError("Spectrogram of complex signal is not supported")
+
+        nperseg, hop, nfft = self._get_sizes(sweep.size)
+        dtype = get_dtype(sweep.y.dtype, get_precision(sweep.y.dtype))
+        y = np.ascontiguousarray(sweep.y, dtype=dtype)
+        segments = (y.size - nperseg) // hop + 1
+        frames = np.lib.stride_tricks.as_strided(
+            y, (segments, nperseg), (hop * y.strides[0], y.strides[0]),
+            writeable=False)
+
+        window = get_window(self.window, nperseg)
+        scale = self._get_scale(window, nfft, sweep.sample).astype(dtype)
+        window = window.astype(dtype)
+
+        for first in range(0, segments, self.chunk_size):
+            chunk = frames[first:first + self.chunk_size]
+            if self.detrend:
+                chunk = chunk - chunk.mean(axis=1, keepdims=True)
+            spectrum = sp_fft.rfft(chunk * window, n=nfft)
+
+            if self.scaling == "magnitude":
+                image = np.abs(spectrum)
+            else:
+                image = spectrum.real**2 + spectrum.imag**2
+            image *= scale
+
+            if self.scaling == "db":
+                np.maximum(image, np.finfo(image.dtype).tiny, out=image)
+                image = 10 * np.log10(image)
+
+            yield first, image.T[::-1]
+
+    def _get_dtype(self, sweep: "relation.Relation") -> np.dtype:
+        if self.dtype is not None:
+            return self.dtype
+        return get_dtype(sweep.y.dtype, get_precision(sweep.y.dtype))
+
+    def _get_scale(
+        self, window: np.ndarray, nfft: int, sample: float
+    ) -> np.ndarray:
+        if self.scaling == "magnitude":
+            scale = np.full(nfft // 2 + 1, 2 / window.sum())
+        else:
+            scale = np.full(nfft // 2 + 1, 2 * sample / (window**2).sum())
+
+        scale[0] /= 2
+        if nfft % 2 == 0:
+            scale[-1] /= 2
+        return scale
@@ -1,4 +1,6 @@
-from typing import Any, Callable, Optional, Tuple, Union
+import hashlib
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, NamedTuple, Optional, Tuple, Union
 
 import numpy as np
 from scipy.signal import hilbert, spectrogram  # type: ignore
@@ -6,8 +8,10 @@ from scipy.signal import hilbert, spectrogram  # type: ignore
 from .. import relation, signal, spectrum
 from ..axis import ArrayAxis
 from ..config import base_config
+from .methods import interpolate_extrapolate
 from ..exc import BadInputError
 from ..help_types import ArrayLike, Frequency, Time, Envelope, Spectrogram, Ftat
+from ..precision import keep_precision
 
 Ftatr = Union["relation.Relation", Ftat]
 '''The Representation of object from which will be extracted frequency
@@ -48,8 +52,15 @@ class InterpolateArray:
     '''Class to interpolate array.
 
     Use to stretch data to new axis.
+
+    The result is memoized for the last `memo_size` axes (compared by start,
+    end and sample) and interpolation methods of `Config`, so calling the instance again with an equal axis costs
+    nothing. **The returned array is read-only and shared between calls.**
     '''
 
+    memo_size = 8
+    '''Number of results kept for different axes.'''
+
     def __init__(
         self,
         x: Union[relation.Relation, ArrayAxis, ArrayLike],
@@ -67,6 +78,9 @@ class InterpolateArray:
             BadInputError: raise exception if will be not enough data.
         '''
 
+        self._memo: "OrderedDict[Tuple[Any, ...], np.ndarray]" = \
+            OrderedDict()
+
         if isinstance(x, relation.Relation):
             self._x = x.x.array.copy()
             self._y = x.y.copy()
@@ -86,20 +100,42 @@ class InterpolateArray:
         '''Get new array of y.
 
         Stretch and interpolate old array y to get new array y.
+        If the default interpolation method of `Config` is used and the old
+        x is increasing, linear interpolation is calculated directly by
+        `numpy.interp`.
+
         Args:
             new_x (ArrayAxis): new array of x.
 
         Returns:
-            np.ndarray: new array of y.
+            np.ndarray: new array of y (read-only).
         '''
+        interpolate_method = base_config.Config.interpolate_extrapolate_method
+        key = (new_x.start, new_x.end, new_x.sample, interpolate_method)
+        new_y = self._memo.get(key)
+        if new_y is not None:
+            self._memo.move_to_end(key)
+            return new_y
+
         stretch_old_x = self._x * \
             ((new_x.end - new_x.start) /
              self._x[-1]) - self._x[0] + new_x.start
 
-        new_y = base_config.Config. \
-            interpolate_extrapolate_method(stretch_old_x, self._y)
+        if interpolate_method is interpolate_extrapolate and \
+                np.all(stretch_old_x[1:] > stretch_old_x[:-1]):
+            new_y = np.interp(new_x.array, stretch_old_x, self._y,
+                              left=0.0, right=0.0)
+        else:
+            new_y = np.asarray(
+                interpolate_method(stretch_old_x, self._y)(new_x))
+
+        new_y = keep_precision(new_y, self._y)
+        new_y.setflags(write=False)
+        self._memo[key] = new_y
+        if len(self._memo) > self.memo_size:
+            self._memo.popitem(last=False)
 
-        return new_y(new_x)
+        return new_y
 
 
 def convert_freq2time(
@@ -127,12 +163,62 @@ def convert_freq2time(
     return InterpolateArray(nT, f), InterpolateArray(nT, a_t)
 
 
-def get_info_from_a_prior_data(
+class APriorAnalysis(NamedTuple):
+    '''Result of the analysis of a prior data.
+
+    `frequency_time` and `amplitude_time` are used to create sweep signal,
+    `norm` is the norm of `signal` (see `Relation.get_norm`).
+    '''
+    frequency_time: InterpolateArray
+    amplitude_time: InterpolateArray
+    signal: "signal.Signal"
+    norm: float
+
+
+A_PRIOR_CACHE_SIZE = 32
+'''Maximum number of a prior analyses kept by `get_a_prior_analysis`.'''
+
+_a_prior_cache: "OrderedDict[Hashable, APriorAnalysis]" = OrderedDict()
+
+
+def clear_a_prior_cache() -> None:
+    '''Remove all analyses cached by `get_a_prior_analysis`.'''
+    _a_prior_cache.clear()
+
+
+def _get_config_key() -> Hashable:
+    # Methods of `Config` used by the analysis are taken at call time,
+    # so the analysis depends on them.
+    config = base_config.Config
+    return (config.signal2spectrum_method, config.spectrum2signal_method,
+            config.integrate_one_method, config.precision)
+
+
+def _get_content_key(data: "relation.Relation") -> Hashable:
+    y = np.ascontiguousarray(data.y)
+    digest = hashlib.blake2b(y.data, digest_size=16).hexdigest()
+    return (type(data).__name__, data.x.start, data.x.end, data.x.size,
+            y.dtype.str, digest)
+
+
+def get_a_prior_analysis(
     time: Union["relation.Relation", ArrayAxis, ArrayLike],
     a_prior_data: Any,
     f_a_t_method: CallFtatMethod
-) -> Tuple[InterpolateArray, InterpolateArray, "signal.Signal"]:
-    '''Get the Frequency and amplitude modulation function from a prior data.
+) -> APriorAnalysis:
+    '''Analyze a prior data to create sweep signal.
+
+    The result is cached by the content of the a prior data (axis and
+    hash of the array), by the method `f_a_t_method` and by the methods
+    of `Config` used in the analysis (conversions between signal and
+    spectrum, integration and precision), so the spectrum, the conversion
+    and the norm are calculated once for the same data even for different
+    objects. The last `A_PRIOR_CACHE_SIZE` results are kept.
+
+    The a prior signal of the result is not shared: it is the a prior data
+    itself, if the data is `Signal`, otherwise a copy of the cached signal.
+    Functions of frequency and amplitude are shared, they return read-only
+    arrays.
 
     Args:
         time (Any): time.
@@ -142,31 +228,78 @@ def get_info_from_a_prior_data(
         f_a_t_method (CallFtatMethod): method to convert a prior data for
             functions that will use to create sweep signal.
 
-    Returns (TupleInterpolateArray,InterpolateArray, "Signal"]):
-        return frequency-time and amplitude-time functions and a prior signal.
+    Returns:
+        APriorAnalysis: frequency-time and amplitude-time functions,
+            a prior signal and its norm.
     '''
 
-    if isinstance(time, spectrum.Spectrum):
-        a_prior_signal = time.get_signal()
-        a_prior_spectrum = time
-    elif isinstance(time, relation.Relation):
-        a_prior_signal = signal.Signal(time)
-        a_prior_spectrum = a_prior_signal.get_spectrum()
-    elif isinstance(a_prior_data, spectrum.Spectrum):
-        a_prior_signal = a_prior_data.get_signal()
-        a_prior_spectrum = a_prior_data
-    elif isinstance(a_prior_data, signal.Signal):
-        a_prior_signal = a_prior_data
-        a_prior_spectrum = a_prior_data.get_spectrum()
+    if isinstance(time, relation.Relation):
+        source = time
     elif isinstance(a_prior_data, relation.Relation):
-        a_prior_spectrum = spectrum.Spectrum(a_prior_data)
+        source = a_prior_data
+    else:
+        source = signal.Signal(time, a_prior_data)
+
+    key = (f_a_t_method, _get_config_key(), _get_content_key(source))
+    analysis = _a_prior_cache.get(key)
+    if analysis is not None:
+        _a_prior_cache.move_to_end(key)
+        return _own_analysis(analysis, source)
+
+    if isinstance(source, spectrum.Spectrum):
+        a_prior_signal = source.get_signal()
+        a_prior_spectrum = source
+    elif isinstance(source, signal.Signal):
+        a_prior_signal = source
+        a_prior_spectrum = source.get_spectrum()
+    elif source is a_prior_data:
+        a_prior_spectrum = spectrum.Spectrum(source)
         a_prior_signal = a_prior_spectrum.get_signal()
     else:
-        a_prior_signal = signal.Signal(time, a_prior_data)
+        a_prior_signal = signal.Signal(source)
         a_prior_spectrum = a_prior_signal.get_spectrum()
 
     f_t, a_t = convert_freq2time(a_prior_spectrum, f_a_t_method)
+    analysis = APriorAnalysis(f_t, a_t, signal.Signal(a_prior_signal),
+                              a_prior_signal.get_norm())
+
+    _a_prior_cache[key] = analysis
+    if len(_a_prior_cache) > A_PRIOR_CACHE_SIZE:
+        _a_prior_cache.popitem(last=False)
+
+    return analysis._replace(signal=a_prior_signal)
+
+
+def _own_analysis(
+    analysis: APriorAnalysis, source: "relation.Relation"
+) -> APriorAnalysis:
+    if isinstance(source, signal.Signal):
+        return analysis._replace(signal=source)
+    return analysis._replace(signal=signal.Signal(analysis.signal))
 
+
+def get_info_from_a_prior_data(
+    time: Union["relation.Relation", ArrayAxis, ArrayLike],
+    a_prior_data: Any,
+    f_a_t_method: CallFtatMethod
+) -> Tuple[InterpolateArray, InterpolateArray, "signal.Signal"]:
+    '''Get the Frequency and amplitude modulation function from a prior data.
+
+    The result is taken from the cache of `get_a_prior_analysis`.
+
+    Args:
+        time (Any): time.
+
+        a_prior_data (Any): a prior data.
+
+        f_a_t_method (CallFtatMethod): method to convert a prior data for
+            functions that will use to create sweep signal.
+
+    Returns (TupleInterpolateArray,InterpolateArray, "Signal"]):
+        return frequency-time and amplitude-time functions and a prior signal.
+    '''
+    f_t, a_t, a_prior_signal, _ = get_a_prior_analysis(
+        time, a_prior_data, f_a_t_method)
     return f_t, a_t, a_prior_signal
 
 
@@ -303,7 +436,7 @@ def get_f_t(sweep: "relation.Relation") -> "relation.Relation":
         / (2.0 * np.pi)
         / sweep.sample,
     )
-    return relation.Relation(sweep.x, result)
+    return relation.Relation(sweep.x, keep_precision(result, sweep.y))
 
 
 def get_a_t(sweep: "relation.Relation") -> "relation.Relation":
@@ -0,0 +1,46 @@
+import os
+from typing import Any, Iterator, Optional, Tuple, Union
+
+import numpy as np
+
+from .help_types import Literal
+
+PathLike = Union[str, "os.PathLike[str]"]
+'''Path of file.'''
+
+MmapMode = Literal["r", "r+", "w+", "c"]
+'''Mode of memory-mapped file (as `numpy.load`).'''
+
+
+def open_output(
+    filename: Optional[PathLike], shape: Tuple[int, ...], dtype: Any
+) -> np.ndarray:
+    '''Create array for the result of calculation.
+
+    Args:
+        filename (PathLike, optional): path of new `.npy` file. If None, then
+            the array is created in memory.
+        shape (Tuple[int, ...]): shape of array.
+        dtype (Any): data type of array.
+
+    Returns:
+        np.ndarray: array in memory or `numpy.memmap` of new `.npy` file.
+    '''
+    if filename is None:
+        return np.empty(shape, dtype=dtype)
+    return np.lib.format.open_memmap(
+        os.fspath(filename), mode="w+", dtype=dtype, shape=shape)
+
+
+def iter_slices(size: int, chunk_size: int) -> Iterator[slice]:
+    '''Split range of indices into chunks.
+
+    Args:
+        size (int): size of array.
+        chunk_size (int): maximum size of chunk.
+
+    Yields:
+        Iterator[slice]: consecutive slices of array.
+    '''
+    for first in range(0, size, chunk_size):
+        yield slice(first, min(first + chunk_size, size))
@@ -0,0 +1,278 @@
+'''Binary container of `Relation`, `Signal`, `Spectrum` and `Sweep`.
+
+The file consists of:
+
+* 16 bytes of prefix: magic bytes `SWPDSGN\\0`, version of format (uint16),
+  reserved (uint16), size of header (uint32), all little-endian;
+* header: JSON with the type of object, the axis x (start, end, sample,
+  size) and the table of sections;
+* sections: raw arrays (C order), each aligned to 64 bytes.
+
+Each section of the table has the offset from the start of file, the data
+type (as in `.npy` files) and the shape of array. Sections of derived data
+(`frequency_time`, `amplitude_time` and `spectrogram` of `Sweep`,
+`a_prior_signal`) also have their axes. The section `y` is always present.
+
+Sections are read independently, so any section can be read without reading
+the others. By default, sections are memory-mapped, so the data is read from
+the disk only when it is used.
+'''
+import json
+import os
+import struct
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+import numpy as np
+
+from .axis import ArrayAxis
+from .exc import BadInputError
+from .memmap import MmapMode, PathLike
+from .relation import Relation
+from .signal import Signal
+from .spectrogram import Spectrogram
+from .spectrum import Spectrum
+from .sweep import Sweep
+
+FORMAT_VERSION = 1
+'''Version of format of written files.'''
+
+MAGIC = b"SWPDSGN\0"
+'''The first bytes of file.'''
+
+ARTIFACTS = ("frequency_time", "amplitude_time", "spectrogram",
+             "a_prior_signal")
+'''Names of sections of derived data of `Sweep`.'''
+
+_PREFIX = struct.Struct("<8sHHI")
+_ALIGNMENT = 64
+_CLASSES: Dict[str, Type[Relation]] = {
+    "Sweep": Sweep, "Spectrum": Spectrum, "Signal": Signal,
+    "Relation": Relation}
+
+RelationType = Union[Relation, Signal, Spectrum, Sweep]
+'''Instance of `Relation`, `Signal`, `Spectrum` or `Sweep`.'''
+
+
+def save(
+    filename: PathLike,
+    relation: Relation,
+    artifacts: Optional[Sequence[str]] = ARTIFACTS,
+) -> None:
+    '''Save instance of `Relation` or inherited class to file.
+
+    The class is saved as the nearest of `Sweep`, `Spectrum`, `Signal` and
+    `Relation`. Cached data (array of axis, spectrum of signal) is not saved.
+
+    Args:
+        filename (PathLike): path of file.
+
+        relation (Relation): instance to save.
+
+        artifacts (Sequence[str], optional): which derived data of `Sweep`
+            to save (see `ARTIFACTS`). If None, nothing is saved.
+            Defaults to all.
+
+    Raises:
+        BadInputError: raise exception if the name of artifact is unknown.
+    '''
+    artifacts = _check_artifacts(artifacts)
+    type_name = next(cls.__name__ for cls in type(relation).__mro__
+                     if _CLASSES.get(cls.__name__) is cls)
+    header: Dict[str, Any] = {
+        "type": type_name, "x": _axis2dict(relation.x), "sections": {}}
+    arrays: List[Tuple[Dict[str, Any], np.ndarray]] = []
+
+    def add(name: str, array: np.ndarray, **axes: ArrayAxis) -> None:
+        section: Dict[str, Any] = {
+            "dtype": np.lib.format.dtype_to_descr(array.dtype),
+            "shape": list(array.shape)}
+        section.update({key: _axis2dict(axis) for key, axis in axes.items()})
+        header["sections"][name] = section
+        arrays.append((section, array))
+
+    add("y", relation.y)
+    if isinstance(relation, Sweep):
+        for name in ("frequency_time", "amplitude_time", "a_prior_signal"):
+            part = getattr(relation, name)
+            if name in artifacts and part is not None:
+                add(name, part.y, x=part.x)
+        if "spectrogram" in artifacts:
+            spectrogram = relation.spectrogram
+            add("spectrogram", spectrogram.spectrogram,
+                time=spectrogram.time, frequency=spectrogram.frequency)
+
+    # Offsets depend on the size of the header, which contains offsets.
+    # The header is padded with spaces, so sections are aligned.
+    header_size = 0
+    while True:
+        offset = _PREFIX.size + header_size
+        for section, array in arrays:
+            section["offset"] = offset
+            offset += _align(array.nbytes)
+        header_bytes = json.dumps(header).encode("utf-8")
+        if len(header_bytes) <= header_size:
+            break
+        header_size = _align(_PREFIX.size + len(header_bytes)) - _PREFIX.size
+
+    with open(os.fspath(filename), "wb") as file:
+        file.write(_PREFIX.pack(MAGIC, FORMAT_VERSION, 0, header_size))
+        file.write(header_bytes.ljust(header_size, b" "))
+        for section, array in arrays:
+            file.seek(section["offset"])
+            np.ascontiguousarray(array).tofile(file)
+
+
+def read_header(filename: PathLike) -> Dict[str, Any]:
+    '''Read header of file.
+
+    Args:
+        filename (PathLike): path of file.
+
+    Raises:
+        BadInputError: raise exception if the file is not the container or
+            the version of format is not supported.
+
+    Returns:
+        Dict[str, Any]: header with keys "version", "type", "x" (axis) and
+            "sections" (table of sections).
+    '''
+    with open(os.fspath(filename), "rb") as file:
+        prefix = file.read(_PREFIX.size)
+        if len(prefix) < _PREFIX.size:
+            raise BadInputError(f"File {filename} is not sweep-design file")
+        magic, version, _, header_size = _PREFIX.unpack(prefix)
+        if magic != MAGIC:
+            raise BadInputError(f"File {filename} is not sweep-design file")
+        if version > FORMAT_VERSION:
+            raise BadInputError(
+                f"Version {version} of file {filename} is not supported "
+                f"(the latest is {FORMAT_VERSION})")
+        header = json.loads(file.read(header_size).decode("utf-8"))
+
+    header["version"] = version
+    return header
+
+
+def load_section(
+    filename: PathLike,
+    name: str,
+    mmap_mode: Optional[MmapMode] = "r",
+    header: Optional[Dict[str, Any]] = None,
+) -> np.ndarray:
+    '''Read one section of file.
+
+    Args:
+        filename (PathLike): path of file.
+
+        name (str): name of section.
+
+        mmap_mode (MmapMode, optional): mode of memory-mapped file ("r", "r+"
+            or "c"). If None, the section is read into memory.
+            Defaults to "r".
+
+        header (Dict[str, Any], optional): header of file. If None, it is
+            read from the file. Defaults to None.
+
+    Raises:
+        BadInputError: raise exception if there is no section or the mode
+            is "w+".
+
+    Returns:
+        np.ndarray: array of section.
+    '''
+    if header is None:
+        header = read_header(filename)
+    if name not in header["sections"]:
+        raise BadInputError(f"There is no section {name} in file {filename}")
+    if mmap_mode == "w+":
+        raise BadInputError("Mode w+ would overwrite the file")
+
+    section = header["sections"][name]
+    dtype = np.lib.format.descr_to_dtype(section["dtype"])
+    shape = tuple(section["shape"])
+    if mmap_mode is not None:
+        return np.memmap(os.fspath(filename), dtype=dtype, mode=mmap_mode,
+                         offset=section["offset"], shape=shape)
+
+    with open(os.fspath(filename), "rb") as file:
+        file.seek(section["offset"])
+        count = int(np.prod(shape))
+        return np.fromfile(file, dtype=dtype, count=count).reshape(shape)
+
+
+def load(
+    filename: PathLike,
+    mmap_mode: Optional[MmapMode] = "r",
+    artifacts: Optional[Sequence[str]] = ARTIFACTS,
+) -> RelationType:
+    '''Load instance of `Relation` or inherited class from file.
+
+    Derived data of `Sweep`, which is not loaded (not saved or not
+    in `artifacts`), is calculated as usual.
+
+    Args:
+        filename (PathLike): path of file.
+
+        mmap_mode (MmapMode, optional): mode of memory-mapped file ("r", "r+"
+            or "c"). If None, sections are read into memory.
+            Defaults to "r".
+
+        artifacts (Sequence[str], optional): which derived data of `Sweep`
+            to load (see `ARTIFACTS`). If None, nothing is loaded.
+            Defaults to all.
+
+    Raises:
+        BadInputError: raise exception if the name of artifact is unknown.
+
+    Returns:
+        RelationType: instance of `Relation`, `Signal`, `Spectrum` or `Sweep`.
+    '''
+    artifacts = _check_artifacts(artifacts)
+    header = read_header(filename)
+    cls = _CLASSES[header["type"]]
+    sections = header["sections"]
+    y = load_section(filename, "y", mmap_mode, header)
+    x = _dict2axis(header["x"])
+    if cls is not Sweep:
+        return cls(x, y)
+
+    parts: Dict[str, Any] = {}
+    for name in ARTIFACTS:
+        if name not in artifacts or name not in sections:
+            continue
+        array = load_section(filename, name, mmap_mode, header)
+        if name == "spectrogram":
+            parts[name] = Spectrogram(
+                _dict2axis(sections[name]["time"]),
+                _dict2axis(sections[name]["frequency"]), array)
+        else:
+            part_cls = Signal if name == "a_prior_signal" else Relation
+            parts[name] = part_cls(_dict2axis(sections[name]["x"]), array)
+
+    return Sweep(x, y, **parts)
+
+
+def _check_artifacts(artifacts: Optional[Sequence[str]]) -> Sequence[str]:
+    artifacts = () if artifacts is None else artifacts
+    unknown = set(artifacts) - set(ARTIFACTS)
+    if unknown:
+        raise BadInputError(f"Unknown artifacts: {sorted(unknown)}")
+    return artifacts
+
+
+def _align(size: int) -> int:
+    return -(-size // _ALIGNMENT) * _ALIGNMENT
+
+
+def _axis2dict(axis: ArrayAxis) -> Dict[str, Any]:
+    return {"start": _number(axis.start), "end": _number(axis.end),
+            "sample": _number(axis.sample), "size": axis.size}
+
+
+def _dict2axis(data: Dict[str, Any]) -> ArrayAxis:
+    return ArrayAxis(data["start"], data["end"], data["sample"])
+
+
+def _number(value: Any) -> Union[int, float]:
+    # Floats are written by `repr`, so they are restored exactly.
+    return value.item() if isinstance(value, np.generic) else value
@@ -0,0 +1,86 @@
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from .help_types import Literal
+
+Precision = Literal["single", "double"]
+'''Precision of floating data.
+
+"single" is float32 for real and complex64 for complex data,
+"double" is float64 for real and complex128 for complex data.'''
+
+_REAL_DTYPES: Dict[str, np.dtype] = {
+    "single": np.dtype(np.float32), "double": np.dtype(np.float64)}
+_COMPLEX_DTYPES: Dict[str, np.dtype] = {
+    "single": np.dtype(np.complex64), "double": np.dtype(np.complex128)}
+
+
+def get_precision(dtype: Any) -> Precision:
+    '''Get precision of data type.
+
+    Integer and boolean data are calculated in double precision.
+
+    Args:
+        dtype (Any): data type.
+
+    Returns:
+        Precision: "single" for float16, float32 and complex64, otherwise
+            "double".
+    '''
+    dtype = np.dtype(dtype)
+    if dtype.kind in "fc" and dtype.itemsize <= (4 if dtype.kind == "f" else 8):
+        return "single"
+    return "double"
+
+
+def get_dtype(dtype: Any, precision: Precision) -> np.dtype:
+    '''Get floating data type of given precision for data of data type.
+
+    Args:
+        dtype (Any): data type of data.
+        precision (Precision): required precision.
+
+    Returns:
+        np.dtype: complex data type for complex data, otherwise real.
+    '''
+    if np.dtype(dtype).kind == "c":
+        return _COMPLEX_DTYPES[precision]
+    return _REAL_DTYPES[precision]
+
+
+def set_precision(
+    array: np.ndarray, precision: Optional[Precision]
+) -> np.ndarray:
+    '''Convert array to precision.
+
+    The array is not copied if it already has the required data type.
+
+    Args:
+        array (np.ndarray): array of numbers.
+        precision (Precision, optional): required precision. If None, then
+            the array is returned as is.
+
+    Returns:
+        np.ndarray: array with floating data type of the precision.
+    '''
+    if precision is None:
+        return array
+    return array.astype(get_dtype(array.dtype, precision), copy=False)
+
+
+def keep_precision(array: np.ndarray, source: np.ndarray) -> np.ndarray:
+    '''Convert result of calculation to single precision of source data.
+
+    The result calculated from double precision data is returned as is.
+
+    Args:
+        array (np.ndarray): result of calculation.
+        source (np.ndarray): data from which the result is calculated.
+
+    Returns:
+        np.ndarray: result with precision of source.
+    '''
+    if get_precision(source.dtype) == "double":
+        return array
+    return set_precision(np.asarray(array), "single")
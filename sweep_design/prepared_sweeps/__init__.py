@@ -1,6 +1,9 @@
 from .dwell_sweep import get_dwell_sweep
 from .linear_sweep import get_linear_sweep
 from .pseudorandom_shuffle import get_shuffle
-from .sweep_from_code import get_code_sweep_segments, get_convolution_sweep_and_code
-from .code_m_sequence import get_m_sequence_code, get_relation_m_sequence
-from .code_zinger import get_code_zinger, get_code_zinger_relation
+from .sweep_from_code import convolve_code, get_code_sweep_segments, get_convolution_sweep_and_code
+from .code_m_sequence import (get_base_m_sequence, get_gold_codes,
+                              get_kasami_codes, get_m_sequence_code,
+                              get_m_sequence_from_state,
+                              get_m_sequence_phases, get_relation_m_sequence)
+from .code_zinger import get_code_zinger, get_code_zinger_array, get_code_zinger_relation
@@ -1,17 +1,208 @@
-from typing import Union
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, Union
 import math
-import random
 
 import numpy as np
 from scipy.signal import max_len_seq  # type: ignore
 
 from ..relation import Relation
 from ..axis import ArrayAxis, get_array_axis_from_array
+from ..exc import BadInputError
+from ..help_types import ArrayLike
 
+GOLD_PREFERRED_TAPS: Dict[int, Tuple[Tuple[int, ...], Tuple[int, ...]]] = {
+    5: ((2,), (4, 3, 2)),
+    6: ((1,), (5, 2, 1)),
+    7: ((3,), (3, 2, 1)),
+    9: ((4,), (6, 4, 3)),
+    10: ((3,), (8, 3, 2)),
+    11: ((2,), (8, 5, 2)),
+}
+'''Taps (in terms of `scipy.signal.max_len_seq`) of preferred pairs of
+m-sequences used to create Gold codes.'''
 
-def get_m_sequence_code(length_code: int, is_full=False) -> np.ndarray:
+
+@lru_cache(maxsize=32)
+def _get_base_m_sequence(
+    nbits: int, taps: Optional[Tuple[int, ...]] = None
+) -> np.ndarray:
+    base = max_len_seq(nbits, taps=taps)[0]
+    base.setflags(write=False)
+    return base
+
+
+@lru_cache(maxsize=4)
+def _get_m_sequence_phases_table(
+    nbits: int, taps: Optional[Tuple[int, ...]] = None
+) -> np.ndarray:
+    # The first nbits elements of m-sequence are equal to the initial state
+    # of the register, so the state defines the cyclic phase of the sequence.
+    # States of all phases are accumulated bit by bit over the cyclic
+    # sliding window: state = (state << 1) | bit.
+    base = _get_base_m_sequence(nbits, taps)
+    extended = np.concatenate((base, base[:nbits - 1]))
+    dtype = np.int32 if nbits < 31 else np.int64
+    states = np.zeros(base.size, dtype=dtype)
+    for bit in range(nbits):
+        np.left_shift(states, 1, out=states)
+        np.bitwise_or(states, extended[bit:bit + base.size], out=states)
+
+    phases = np.zeros(2**nbits, dtype=dtype)
+    phases[states] = np.arange(base.size, dtype=dtype)
+    phases.setflags(write=False)
+    return phases
+
+
+def get_base_m_sequence(
+    nbits: int, taps: Optional[Tuple[int, ...]] = None
+) -> np.ndarray:
+    '''Get cached m-sequence.
+
+    The sequence is calculated once for each `nbits` and `taps` using
+    `scipy.signal.max_len_seq` with the initial state of all ones.
+    **The returned array is read-only.**
+
+    Args:
+        nbits (int): number of bits of the register.
+            The size of the sequence is `2**nbits - 1`.
+
+        taps (Tuple[int, ...], optional): taps of register. If None, then
+            taps of `scipy.signal.max_len_seq` are used. Defaults to None.
+
+    Returns:
+        np.ndarray: m-sequence of 0 and 1.
+    '''
+    return _get_base_m_sequence(nbits, taps)
+
+
+def get_m_sequence_phases(
+    nbits: int,
+    phases: ArrayLike,
+    taps: Optional[Tuple[int, ...]] = None
+) -> np.ndarray:
+    '''Get m-sequences with many cyclic phases at once.
+
+    All phases are derived from the cached m-sequence (`get_base_m_sequence`)
+    by rolling, without generating the sequence again.
+
+    Args:
+        nbits (int): number of bits of the register.
+        phases (ArrayLike): cyclic shifts of the sequence in elements.
+        taps (Tuple[int, ...], optional): taps of register. Defaults to None.
+
+    Returns:
+        np.ndarray: 2D array (phases x elements) of 0 and 1.
+    '''
+    base = get_base_m_sequence(nbits, taps)
+    index = np.arange(base.size)[np.newaxis, :] + \
+        np.asarray(phases)[:, np.newaxis]
+    return base[index % base.size]
+
+
+def get_m_sequence_from_state(
+    state: ArrayLike, taps: Optional[Tuple[int, ...]] = None
+) -> np.ndarray:
+    '''Get m-sequence for the initial state of the register.
+
+    The result is equal to `scipy.signal.max_len_seq(nbits, state, taps)[0]`,
+    but it is the cached m-sequence rolled to the phase of the state.
+    The table of phases of all states is calculated on the first call for
+    `nbits` and `taps` and cached (`2**nbits` integers).
+
+    Args:
+        state (ArrayLike): initial state of the register (0 and 1, not all 0).
+        taps (Tuple[int, ...], optional): taps of register. Defaults to None.
+
+    Raises:
+        BadInputError: raise exception if all elements of state are 0.
+
+    Returns:
+        np.ndarray: m-sequence of 0 and 1.
+    '''
+    state = np.asarray(state, dtype=np.int64)
+    if not np.any(state):
+        raise BadInputError("State of register must not be all zeros.")
+
+    value = int(state @ (1 << np.arange(state.size - 1, -1, -1,
+                                        dtype=np.int64)))
+    phases = _get_m_sequence_phases_table(state.size, taps)
+    return np.roll(get_base_m_sequence(state.size, taps), -int(phases[value]))
+
+
+def get_gold_codes(nbits: int, shifts: Optional[ArrayLike] = None) -> np.ndarray:
+    '''Get family of Gold codes.
+
+    Gold codes are calculated from a preferred pair of m-sequences u and v
+    (`GOLD_PREFERRED_TAPS`) as u xor v shifted by k elements.
+    The whole family is calculated at once.
+
+    Args:
+        nbits (int): number of bits of the register
+            (one of keys of `GOLD_PREFERRED_TAPS`).
+
+        shifts (ArrayLike, optional): shifts k of v. If None, then the
+            full family of `2**nbits + 1` codes is returned: u, v and
+            u xor v shifted by k = 0, ..., 2**nbits - 2. Defaults to None.
+
+    Raises:
+        BadInputError: raise exception if there is not preferred pair
+            for nbits.
+
+    Returns:
+        np.ndarray: 2D array (codes x elements) of 0 and 1.
+    '''
+    if nbits not in GOLD_PREFERRED_TAPS:
+        raise BadInputError(
+            f"Preferred pair of m-sequences for nbits={nbits} is unknown. "
+            f"Available nbits: {sorted(GOLD_PREFERRED_TAPS)}.")
+
+    taps_u, taps_v = GOLD_PREFERRED_TAPS[nbits]
+    u = get_base_m_sequence(nbits, taps_u)
+
+    if shifts is None:
+        codes = u ^ get_m_sequence_phases(nbits, np.arange(u.size), taps_v)
+        return np.vstack((u, get_base_m_sequence(nbits, taps_v), codes))
+
+    return u ^ get_m_sequence_phases(nbits, shifts, taps_v)
+
+
+def get_kasami_codes(nbits: int) -> np.ndarray:
+    '''Get small set of Kasami codes.
+
+    The m-sequence u is decimated by `2**(nbits/2) + 1` to get sequence w.
+    The set consists of u and u xor w shifted by k elements for all k.
+
+    Args:
+        nbits (int): even number of bits of the register.
+
+    Raises:
+        BadInputError: raise exception if nbits is odd.
+
+    Returns:
+        np.ndarray: 2D array (`2**(nbits/2)` x `2**nbits - 1`) of 0 and 1.
+    '''
+    if nbits % 2:
+        raise BadInputError("Small set of Kasami codes needs even nbits.")
+
+    u = get_base_m_sequence(nbits)
+    decimation = 2**(nbits // 2) + 1
+    w = u[(np.arange(u.size) * decimation) % u.size]
+
+    index = np.arange(u.size)[np.newaxis, :] + \
+        np.arange(2**(nbits // 2) - 1)[:, np.newaxis]
+    return np.vstack((u, u ^ w[index % u.size]))
+
+
+def get_m_sequence_code(
+    length_code: int,
+    is_full=False,
+    generator: Optional[np.random.Generator] = None
+) -> np.ndarray:
     '''Create m-sequence array
 
+    The m-sequence with random cyclic phase is taken from the cached
+    m-sequence (`get_base_m_sequence`).
+
     Args:
         length_code (int): length of m-sequence array.
 
@@ -20,17 +211,15 @@ def get_m_sequence_code(length_code: int, is_full=False) -> np.ndarray:
             sequence which size equal length_code.
             Defaults to False.
 
+        generator (np.random.Generator, optional): generator to choose
+            the phase. Pass a seeded generator to get reproducible codes.
+            If None, then a new unseeded generator is used. Defaults to None.
+
     Returns:
         np.ndarray: array of m-sequence.
     '''
     len_sequence = math.ceil(math.log((length_code - 1), 2))
-    start_sequence = np.array([random.randint(0, 1)
-                              for _ in range(len_sequence)])
-
-    if np.all(start_sequence == 0):
-        start_sequence[0] = 1
-
-    m_sequence = max_len_seq(nbits=len_sequence, state=start_sequence)[0]
+    m_sequence = _get_random_phase(len_sequence, generator)
 
     if is_full:
         return m_sequence
@@ -40,36 +229,39 @@ def get_m_sequence_code(length_code: int, is_full=False) -> np.ndarray:
 
 def get_relation_m_sequence(time: Union[ArrayAxis, np.ndarray],
                             start_sequence: np.ndarray = None,
-                            is_full=False) -> Relation:
+                            is_full=False,
+                            generator: Optional[np.random.Generator] = None
+                            ) -> Relation:
     '''Create m-sequence relation.
 
     Args:
         time (Union[ArrayAxis, np.ndarray]): time of sequence.
 
-        start_sequence (np.ndarray, optional): start array sequence of -1 and 1
-            to create m-sequence. Defaults to None.
+        start_sequence (np.ndarray, optional): start array sequence of 0 and 1
+            to create m-sequence. If None, then the phase of m-sequence is
+            random. Defaults to None.
 
         is_full (bool, optional): if True return full m-sequence with new
             time with equal size to m-sequence array. Defaults to False.
 
+        generator (np.random.Generator, optional): generator to choose
+            the phase if start_sequence is None. If None, then a new unseeded
+            generator is used. Defaults to None.
+
     Returns:
         Relation: relation of m-sequence.
     '''
     if not isinstance(time, ArrayAxis):
         time = get_array_axis_from_array(time)
 
-    len_seq = math.ceil(math.log((time.size - 1), 2))
-
     if start_sequence is None:
-        start_sequence = np.array([random.randint(0, 1)
-                                  for _ in range(len_seq)])
-
-    if np.all(start_sequence == 0):
-        start_sequence[0] = 1
-
-    m_sequence = max_len_seq(
-        nbits=start_sequence.size,
-        state=start_sequence)[0]
+        len_seq = math.ceil(math.log((time.size - 1), 2))
+        m_sequence = _get_random_phase(len_seq, generator)
+    else:
+        start_sequence = np.array(start_sequence)
+        if np.all(start_sequence == 0):
+            start_sequence[0] = 1
+        m_sequence = get_m_sequence_from_state(start_sequence)
 
     if is_full:
         new_time = ArrayAxis(
@@ -77,3 +269,13 @@ def get_relation_m_sequence(time: Union[ArrayAxis, np.ndarray],
         return Relation(new_time, m_sequence)
 
     return Relation(time, m_sequence[:time.size])
+
+
+def _get_random_phase(
+    nbits: int, generator: Optional[np.random.Generator] = None
+) -> np.ndarray:
+    if generator is None:
+        generator = np.random.default_rng()
+
+    base = get_base_m_sequence(nbits)
+    return np.roll(base, -int(generator.integers(base.size)))
@@ -1,7 +1,10 @@
-from typing import List
+from typing import List, Optional
 
-from ..help_types import Literal
+import numpy as np
 
+from ..help_types import ArrayLike, Literal
+
+from ..axis import ArrayAxis
 from ..relation import Relation
 
 
@@ -24,9 +27,46 @@ def get_code_zinger(
     return first_sequence_code_zinger * periods
 
 
+def get_code_zinger_array(
+    first_sequence_code_zinger: ArrayLike = [-1, -1, -1, 1],
+    periods=1,
+    phases: Optional[ArrayLike] = None
+) -> np.ndarray:
+    '''Build array of periodic code zinger for many phases at once.
+
+    Each row is the first period repeated n(periods) times and cyclically
+    shifted by a phase (number of elements). The rows are taken from the
+    code by one index array, without loops.
+
+    Args:
+        first_sequence_code_zinger (ArrayLike, optional): First period of code
+            zinger. Defaults to [-1, -1, -1, 1].
+
+        periods (int, optional): Periods of code zinger. Defaults to 1.
+
+        phases (ArrayLike, optional): cyclic shifts of the code in elements.
+            If None, then return 1D array without shift. Defaults to None.
+
+    Returns:
+        np.ndarray: 1D array of code zinger or 2D array (phases x elements).
+    '''
+    code = np.asarray(first_sequence_code_zinger)
+
+    if phases is None:
+        return np.tile(code, periods)
+
+    index = np.arange(code.size * periods)[np.newaxis, :] + \
+        np.asarray(phases)[:, np.newaxis]
+    return code[index % code.size]
+
+
 def get_code_zinger_relation(start_sequence: Relation, periods=1) -> Relation:
     '''Create relation of code zinger.
 
+    The first period is repeated using `numpy.tile`. The axis of the result
+    starts at the start of the first period and contains exactly
+    `periods * start_sequence.size` elements with the same sample.
+
     Args:
         start_sequence (Relation): start of code zinger.
             Example: Relation([-1, -1, -1, 1], [0, 1, 2, 3])
@@ -37,10 +77,13 @@ def get_code_zinger_relation(start_sequence: Relation, periods=1) -> Relation:
         Returns:
             Relation: relation of code zinger.
     '''
-    sequence = start_sequence
-
-    if periods > 1:
-        for k in range(periods):
-            sequence = sequence + start_sequence.shift(start_sequence.end * k)
+    if periods <= 1:
+        return start_sequence
 
-    return sequence
+    y = get_code_zinger_array(start_sequence.y, periods)
+    time = ArrayAxis(
+        start_sequence.start,
+        start_sequence.start + (y.size - 1) * start_sequence.sample,
+        start_sequence.sample
+    )
+    return type(start_sequence)(time, y)
@@ -7,7 +7,7 @@ from ..relation import Relation
 from ..sweep import Sweep
 from ..uncalculated_sweep import ApriorUncalculatedSweep
 from ..utility_functions.ftat_functions import dwell
-from ..utility_functions.a_t import tukey_a_t
+from ..utility_functions.a_t import window_a_t
 
 
 def get_dwell_sweep(
@@ -28,7 +28,7 @@ def get_dwell_sweep(
 
     ftat_method = dwell(f_start, f_end, f_central)
     uasw = ApriorUncalculatedSweep(time, aprior_data, ftat_method)
-    tukey_array = tukey_a_t(time.array, time_tapper, "both")
+    tukey_array = window_a_t(time.array, time_tapper, "both")
     tukey_window = Relation(time, tukey_array)
 
     return uasw() * tukey_window
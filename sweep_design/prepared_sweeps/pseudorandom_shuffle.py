@@ -1,12 +1,11 @@
 import math
-import random
-from typing import Union
+from typing import Optional, Union
 
 import numpy as np
 
 from ..sweep import Sweep
 from ..uncalculated_sweep import UncalculatedSweep
-from ..utility_functions.a_t import tukey_a_t
+from ..utility_functions.a_t import window_a_t
 from ..axis import ArrayAxis, get_array_axis_from_array
 
 
@@ -21,10 +20,15 @@ def get_shuffle(
     length_time_segments=0.5,
     round_number_frequency: int = None,
     time_tapper=1.0,
+    generator: Optional[np.random.Generator] = None,
 ) -> Sweep:
     """Create shuffle sweep signal.
 
     t_tapper in seconds is used to apply tukey function at the end of dwell sweep signal.
+
+    generator is `numpy.random.Generator` used to shuffle frequencies of
+    segments. Pass a seeded generator (`numpy.random.default_rng(seed)`)
+    to get reproducible sweeps. If None, a new unseeded generator is used.
     """
     if not isinstance(time, ArrayAxis):
         time = get_array_axis_from_array(time)
@@ -45,7 +49,10 @@ def get_shuffle(
             f_segment, round_number_frequency
         )
 
-    random.shuffle(f_segment)
+    if generator is None:
+        generator = np.random.default_rng()
+
+    generator.shuffle(f_segment)
 
     x = np.linspace(
         0.0,
@@ -53,11 +60,11 @@ def get_shuffle(
         math.ceil(length_time_segments / time.sample) + 1
     )
     my_cos = np.cos(x * np.pi / length_time_segments - np.pi) / 2 + 1 / 2
-    f_t = np.array([], dtype='float')
-    for f1, f2 in zip(f_segment[:-1], f_segment[1:]):
-        f_t = np.append(f_t, (my_cos * (f2 - f1) + f1)[1:])
+    f1 = f_segment[:-1, np.newaxis]
+    f2 = f_segment[1:, np.newaxis]
+    f_t = (my_cos[np.newaxis, 1:] * (f2 - f1) + f1).ravel()
 
-    a_t = tukey_a_t(time.array, time_tapper)
+    a_t = window_a_t(time.array, time_tapper)
     uncalculated_sweep = UncalculatedSweep(time, f_t[:-2], a_t)
 
     return uncalculated_sweep()
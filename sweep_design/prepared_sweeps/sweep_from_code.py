@@ -1,8 +1,8 @@
 from typing import List, Union
 
 import numpy as np
-
-from sweep_design.exc import BadInputError
+from scipy.fft import next_fast_len  # type: ignore
+from scipy.signal import fftconvolve  # type: ignore
 
 from ..help_types import Literal
 from ..axis import ArrayAxis
@@ -10,13 +10,58 @@ from ..relation import Relation
 from ..sweep import Sweep
 
 
+def convolve_code(code: np.ndarray, base: np.ndarray) -> np.ndarray:
+    '''Full linear convolution of a code with a base signal.
+
+    Code is usually sparse (m-sequence, code zinger and etc. with zeros
+    between chips), so the result is calculated as the sum of shifted copies
+    of the base signal multiplied by non-zero elements of the code.
+    If the code is dense, then FFT convolution is used.
+
+    Args:
+        code (np.ndarray): array of code.
+        base (np.ndarray): array of base signal.
+
+    Returns:
+        np.ndarray: convolution, size is `code.size + base.size - 1`.
+    '''
+    code = np.asarray(code)
+    base = np.asarray(base)
+    size = code.size + base.size - 1
+
+    nonzero = np.flatnonzero(code)
+    fft_size = next_fast_len(size)
+
+    if nonzero.size * base.size > 4 * fft_size * np.log2(fft_size):
+        return fftconvolve(code, base)
+
+    result = np.zeros(size, dtype=np.result_type(code, base))
+    for k in nonzero:
+        result[k:k + base.size] += code[k] * base
+
+    return result
+
+
 def get_convolution_sweep_and_code(
     code: Union[Relation, List[Literal[-1, 0, 1]]],
-    base_sweep: Relation
+    base_sweep: Relation,
+    is_full: bool = False,
 ) -> Sweep:
     '''Get sweep use convolution between sweep and desired code.
 
-    Code can be m-sequence, code zinger and etc.
+    Code can be m-sequence, code zinger and etc. Elements of code are
+    spaced by the sample of the base sweep. If code is `Relation` with
+    another sample, then it is resampled to the sample of the base sweep
+    holding the value of each element (the code is not interpolated).
+    The convolution is calculated by `convolve_code`.
+
+    By default the layout of the result is the same as in version 0.3.1:
+    the time axis goes from `-end` to about `code.size * base_sweep.sample`,
+    where `end` is the larger of the durations of code and base sweep,
+    and the convolution on it is shifted circularly as it was done by
+    `Signal.shift`. If `is_full` is True, then the result is the full
+    linear convolution: its size is `code.size + base_sweep.size - 1` and
+    it starts at `code.start + base_sweep.start` (0 for the list).
 
     Args:
         code (Union[Relation, List[Literal[-1, 0, 1]]): some code.
@@ -24,27 +69,58 @@ def get_convolution_sweep_and_code(
 
         base_sweep (Relation): some base sweep.
 
+        is_full (bool, optional): If True then the full linear convolution
+            is returned. Defaults to `False`.
+
     Returns:
         Sweep: result signal use as sweep signal.
     '''
+    sample = base_sweep.sample
+
     if not isinstance(code, Relation):
-        time_code = ArrayAxis(
-            0,
-            (len(code) - 1) *
-            base_sweep.sample,
-            base_sweep.sample)
-        code = Relation(time_code, code)
+        code_start = 0.0
+        code_y = np.asarray(code)
+    elif code.sample == sample:
+        code_start = code.start
+        code_y = code.y
+    else:
+        code_start = code.start
+        code_time = ArrayAxis(code.start, code.end, sample).array
+        index = np.floor((code_time - code.start) / code.sample + 1e-9)
+        code_y = code.y[np.clip(index.astype(int), 0, code.size - 1)]
 
-    result = Sweep.convolve(
-        code,
-        base_sweep)[None:code.size *
-                    base_sweep.sample]  # type: ignore
+    y = convolve_code(code_y, base_sweep.y)
+    if not is_full:
+        return _get_shifted_window(y, code_y.size, base_sweep)
 
-    if isinstance(result, Sweep):
-        return result.shift(
-            base_sweep.end)
+    start = code_start + base_sweep.start
+    time = ArrayAxis(start, start + (y.size - 1) * sample, sample)
 
-    raise BadInputError('Not enough data!')
+    return Sweep(time, y)
+
+
+def _get_shifted_window(
+    y: np.ndarray, code_size: int, base_sweep: Relation
+) -> Sweep:
+    # The layout of version 0.3.1: code and base sweep were moved to zero,
+    # padded to the same duration and convolved on the axis from -end to end.
+    # The part up to `code_size * sample` was shifted by `base_sweep.end`
+    # with the FFT of a signal with negative times, which rotates the data
+    # by the shift plus two numbers of samples with t >= 0.
+    sample = base_sweep.sample
+    end = max((code_size - 1) * sample, base_sweep.end - base_sweep.start)
+    array = ArrayAxis(-end, end, sample).array
+    array = array[array <= code_size * sample]
+
+    window = np.zeros(array.size, dtype=y.dtype)
+    size = min(array.size, y.size)
+    window[:size] = y[:size]
+
+    time = ArrayAxis(array[0], array[-1], sample)
+    rotation = round(base_sweep.end / sample) + \
+        2 * np.count_nonzero(time.array >= 0.0)
+
+    return Sweep(time, np.roll(window, rotation))
 
 
 def get_code_sweep_segments(
@@ -54,6 +130,13 @@ def get_code_sweep_segments(
     '''Get sweep use code to compose a base_sweep.
 
     Code can be m-sequence, code zinger and etc.
+
+    The copy of the base sweep multiplied by the k-th element of code is
+    shifted by `k * base_sweep.end + base_sweep.sample` (the first copy
+    is not shifted). The output array is allocated once and each copy is
+    added at its integer sample offset, so the time of composition is
+    linear in the size of the result.
+
     Args:
         code (Union[Relation, List[Literal[-1, 0, 1]]): some code.
         sweep (Relation): some base sweep.
@@ -61,12 +144,20 @@ def get_code_sweep_segments(
     if isinstance(code, Relation):
         code = code.y
 
-    new_sweep = base_sweep * code[0]
+    code = np.asarray(code)
+    sample = base_sweep.sample
+    base_y = base_sweep.y
+
+    shifts = np.arange(code.size) * base_sweep.end + sample
+    shifts[0] = 0.0
+    offsets = np.round(shifts / sample).astype(int)
 
-    for cnt, v in enumerate(code[1:], 1):
+    time = ArrayAxis(base_sweep.start, base_sweep.end + shifts[-1], sample)
+    y = np.zeros(time.size, dtype=np.result_type(base_y, code))
 
-        new_sweep = new_sweep + base_sweep.shift(
-            cnt * base_sweep.end + base_sweep.sample
-        ) * v
+    for offset, v in zip(offsets, code):
+        if v != 0:
+            segment = y[offset:offset + base_y.size]
+            segment += v * base_y[:segment.size]
 
-    return Sweep(new_sweep)
+    return Sweep(time, y)
@@ -1,14 +1,18 @@
 import logging
+import os
 from copy import deepcopy
-from typing import Tuple, Type, TypeVar, Union
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar, Union
 
 import numpy as np
 
-from .axis import ArrayAxis
+from .axis import ArrayAxis, get_slots_state
 from .config.base_config import Config
 from .core import MathOperation, RelationProtocol
+from .defaults.methods import one_integrate
 from .exc import BadInputError, NotEqualError, TypeFuncError
 from .help_types import ArrayLike, Number, RealNumber
+from .memmap import MmapMode, PathLike, iter_slices, open_output
+from .precision import Precision, get_precision, set_precision
 
 R = TypeVar("R", bound="Relation")
 '''Description first `Relation`.'''
@@ -54,10 +58,15 @@ class Relation(RelationProtocol):
         _type_: Type of Relation.
     '''
 
+    __slots__ = ("_x", "_y", "_reductions", "__weakref__")
+
     def __init__(
         self,
         x: Union[RelationProtocol, ArrayAxis, ArrayLike],
         y: ArrayLike = None,
+        *,
+        copy: bool = True,
+        precision: Optional[Precision] = None,
     ) -> None:
         '''Initialization of instance of `Relation`.
 
@@ -72,23 +81,31 @@ class Relation(RelationProtocol):
             y (ArrayLike, optional):
                 None or array_like object containing real or complex numbers.
                 If it is not None then it will be converted to np.ndarray.
+                An instance of `numpy.memmap` is used without copying
+                (if its data type matches `Config.precision`).
                 Defaults to None.
 
+            copy (bool, optional): if False, then y which is np.ndarray is
+                used without copying (if its data type matches
+                `Config.precision`), so the instance shares memory with y.
+                Defaults to True.
+
+            precision (Precision, optional): precision of y. If None, then
+                `Config.precision` is used. Defaults to None.
+
         Raises:
             BadInputError:Raise this exception if we don't have enough data.
             NotEqualError: Raise this exception if we try create instance use
         '''
 
-        self._get_array_axis_from_array_method = Config.get_array_axis_from_array_method
-        self._math_operation = Config.math_operation
-        self._interpolate_extrapolate_method = Config.interpolate_extrapolate_method
-        self._integrate_one_method = Config.integrate_one_method
-        self._integrate_method = Config.integrate_method
-        self._differentiate_method = Config.differentiate_method
+        self._init_transient()
+
+        if precision is None:
+            precision = Config.precision
 
         if isinstance(x, RelationProtocol):
             self._x = x.x.copy()
-            self._y = x.y.copy()
+            self._y = set_precision(x.y.copy(), precision)
             if y is not None:
                 logging.warning(f'x is instance of {type(x)}, "y" was ignored')
             return None
@@ -96,16 +113,53 @@ class Relation(RelationProtocol):
         if y is None:
             raise BadInputError("y is absent. Not enough data!")
 
-        y = np.array(y)
+        if copy and not isinstance(y, np.memmap) or \
+                not isinstance(y, np.ndarray):
+            y = np.array(y)
+        y = set_precision(y, precision)
 
         if not isinstance(x, ArrayAxis):
-            x = self._get_array_axis_from_array_method(x)
+            x = Config.get_array_axis_from_array_method(x)
 
         if x.size != y.size:
             raise NotEqualError(x.size, y.size)
 
         self._x, self._y = x, y
 
+    _transient_attributes: Tuple[str, ...] = ("_reductions",)
+    '''Attributes set by `_init_transient`, which are not pickled.'''
+
+    def _init_transient(self) -> None:
+        '''Set empty caches.
+
+        Called on initialization and on unpickling. Methods of `Config` are
+        not stored in the instance, they are taken from `Config` when they
+        are called.
+        '''
+        self._reductions: Dict[Tuple[Any, ...], Number] = {}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        '''Get state of instance for pickling.
+
+        Only data (axis and y) is pickled, caches are not. With pickle
+        protocol 5, y can be transferred as out-of-band buffer
+        (`buffer_callback` of `pickle.dumps`).
+
+        Returns:
+            Dict[str, Any]: state of instance.
+        '''
+        return get_slots_state(self, self._transient_attributes)
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        '''Restore instance from pickled state.
+
+        Args:
+            state (Dict[str, Any]): state of instance.
+        '''
+        self._init_transient()
+        for name, value in state.items():
+            setattr(self, name, value)
+
     @property
     def x(self) -> ArrayAxis:
         '''ArrayAxis of relation.
@@ -205,6 +259,24 @@ class Relation(RelationProtocol):
         '''
         return self._x.size
 
+    @property
+    def is_memmap(self) -> bool:
+        '''Whether y is memory-mapped file.
+
+        Returns:
+            bool: True if y is an instance of `numpy.memmap`.
+        '''
+        return isinstance(self._y, np.memmap)
+
+    @property
+    def precision(self) -> Precision:
+        '''Precision of y.
+
+        Returns:
+            Precision: "single" for float32 and complex64, otherwise "double".
+        '''
+        return get_precision(self._y.dtype)
+
     def get_data(self) -> Tuple[np.ndarray, np.ndarray]:
         '''Return the data of the object.
 
@@ -247,8 +319,92 @@ class Relation(RelationProtocol):
             Number: signal rate
         '''
 
-        square_self = self**2
-        return self._integrate_one_method(square_self) / (self.sample)
+        if Config.integrate_one_method is not one_integrate:
+            square_self = self**2
+            return Config.integrate_one_method(square_self) / (self.sample)
+
+        return self._reduce("norm") / self.sample
+
+    def get_energy(self) -> RealNumber:
+        '''Get energy of relation (integral of squared absolute value of y).
+
+        Returns:
+            RealNumber: energy.
+        '''
+        return self._reduce("energy")
+
+    def get_l2_norm(self) -> RealNumber:
+        '''Get L2 norm of relation (square root of energy).
+
+        Returns:
+            RealNumber: L2 norm.
+        '''
+        return np.sqrt(self._reduce("energy"))
+
+    def get_rms(self) -> RealNumber:
+        '''Get root mean square of relation over x.
+
+        Returns:
+            RealNumber: root mean square of y.
+        '''
+        if self.size == 1:
+            return np.abs(self._y[0])
+        return np.sqrt(self._reduce("energy") / self._get_duration())
+
+    def get_peak(self) -> RealNumber:
+        '''Get peak (maximum of absolute value) of relation.
+
+        Returns:
+            RealNumber: peak of y.
+        '''
+        return self._reduce("peak")
+
+    def get_mean(self) -> Number:
+        '''Get mean value of relation over x.
+
+        Returns:
+            Number: mean of y.
+        '''
+        if self.size == 1:
+            return self._y[0].item()
+        return self._reduce("integral") / self._get_duration()
+
+    def _get_duration(self) -> RealNumber:
+        return self._x.end - self._x.start
+
+    def _reduce(self, name: str) -> Any:
+        '''Calculate reduction of y directly on the array.
+
+        Integrals use trapezoid weights of the uniform axis, that is equal to
+        the trapezoid integration along the axis. If the array y is read-only,
+        the result is cached.
+        '''
+        key = (name, self._x.start, self._x.end, self._x.sample)
+        is_cached = not self._y.flags.writeable
+        if is_cached and key in self._reductions:
+            return self._reductions[key]
+
+        if self._x.size != self._y.size:
+            raise NotEqualError(self._x.size, self._y.size)
+
+        y = self._y
+        if name == "peak":
+            result = max(np.max(np.abs(y[selected])) for selected
+                         in iter_slices(y.size, Config.chunk_size))
+        else:
+            if name == "norm":
+                total, edges = np.dot(y, y), y[0]**2 + y[-1]**2
+            elif name == "energy":
+                total = np.vdot(y, y).real
+                edges = np.abs(y[0])**2 + np.abs(y[-1])**2
+            else:
+                total, edges = np.sum(y), y[0] + y[-1]
+            step = self._get_duration() / (y.size - 1) if y.size > 1 else 0.0
+            result = step * (total - 0.5 * edges)
+
+        if is_cached:
+            self._reductions[key] = result
+        return result
 
     def select_data(self: R, start: Number = None,
                     end: Number = None) -> R:
@@ -281,6 +437,125 @@ class Relation(RelationProtocol):
 
         return type(self)(new_x_array, self.y[is_selected])
 
+    @classmethod
+    def from_npy(
+        cls: Type[R],
+        x: Union[ArrayAxis, ArrayLike],
+        filename: PathLike,
+        mmap_mode: Optional[MmapMode] = "r",
+    ) -> R:
+        '''Create relation from `.npy` file.
+
+        If `mmap_mode` is not None, the file is memory-mapped and
+        the data is not read into memory.
+
+        Args:
+            cls (Type[R]): class of Relation
+            x (Union[ArrayAxis, ArrayLike]): array axis x or array of x.
+            filename (PathLike): path of `.npy` file with array y.
+            mmap_mode (MmapMode, optional): mode of `numpy.load`
+                ("r", "r+", "w+", "c" or None). Defaults to "r".
+
+        Returns:
+            R: new instance of Relation
+        '''
+        return cls(x, np.load(os.fspath(filename), mmap_mode=mmap_mode))
+
+    def map_chunks(
+        self: R,
+        function: Callable[[np.ndarray], np.ndarray],
+        out: Optional[PathLike] = None,
+        chunk_size: Optional[int] = None,
+    ) -> R:
+        '''Apply elementwise function to y chunk by chunk.
+
+        Only one chunk of y is in memory at once, so the method is
+        suitable for memory-mapped relations. The function must return
+        an array of the same size as its input.
+
+        Args:
+            self (R): instance of Relation
+            function (Callable[[np.ndarray], np.ndarray]): elementwise
+                function.
+            out (PathLike, optional): path of new `.npy` file for
+                the result. If None, the result is in memory.
+                Defaults to None.
+            chunk_size (int, optional): size of chunk. If None, then
+                `Config.chunk_size`. Defaults to None.
+
+        Returns:
+            R: new instance of Relation
+        '''
+        return self._map_chunks(
+            lambda selected: function(self._y[selected]), out, chunk_size)
+
+    def operate(
+        self: R,
+        other: Union["Relation", Number],
+        operation: MathOperation,
+        out: Optional[PathLike] = None,
+        chunk_size: Optional[int] = None,
+    ) -> R:
+        '''Math operation calculated chunk by chunk.
+
+        The same as math operators (+, -, \\*, /, \\*\\*), but only one
+        chunk of data is in memory at once. Relations must have the same
+        axis (they are not equalized).
+
+        Args:
+            self (R): instance of Relation
+            other (Union[Relation, Number]): the second operand.
+            operation (MathOperation): math operation.
+            out (PathLike, optional): path of new `.npy` file for
+                the result. If None, the result is in memory.
+                Defaults to None.
+            chunk_size (int, optional): size of chunk. If None, then
+                `Config.chunk_size`. Defaults to None.
+
+        Raises:
+            NotEqualError: raise exception if sizes of relations are different.
+            BadInputError: raise exception if axes of relations are different.
+
+        Returns:
+            R: new instance of Relation
+        '''
+        if not isinstance(other, Relation):
+            return self._map_chunks(
+                lambda selected: Config.math_operation(
+                    self._y[selected], other, operation),
+                out, chunk_size)
+
+        if other.size != self.size:
+            raise NotEqualError(self.size, other.size)
+        if not (np.isclose(other.start, self.start)
+                and np.isclose(other.sample, self.sample)):
+            raise BadInputError("Axes of relations are different")
+
+        other_y = other.y
+        return self._map_chunks(
+            lambda selected: Config.math_operation(
+                self._y[selected], other_y[selected], operation),
+            out, chunk_size)
+
+    def _map_chunks(
+        self: R,
+        function: Callable[[slice], np.ndarray],
+        out: Optional[PathLike],
+        chunk_size: Optional[int],
+    ) -> R:
+        chunk_size = Config.chunk_size if chunk_size is None else chunk_size
+        result: Optional[np.ndarray] = None
+        for selected in iter_slices(self.size, chunk_size):
+            chunk = set_precision(
+                np.asarray(function(selected)), Config.precision)
+            if result is None:
+                result = open_output(out, (self.size,), chunk.dtype)
+            result[selected] = chunk
+
+        if isinstance(result, np.memmap):
+            result.flush()
+        return type(self)(self.x.copy(), result)
+
     def exp(self: R) -> R:
         '''Get exponent of Relation.
 
@@ -301,7 +576,7 @@ class Relation(RelationProtocol):
         Returns:
             R: result of differentiation.
         '''
-        result = self._differentiate_method(self)
+        result = Config.differentiate_method(self)
         return type(self)(*result)
 
     def integrate(self: R) -> R:
@@ -313,7 +588,7 @@ class Relation(RelationProtocol):
         Returns:
             R: result of cumulative integration.
         '''
-        result = self._integrate_method(self)
+        result = Config.integrate_method(self)
         return type(self)(*result)
 
     def interpolate_extrapolate(
@@ -333,9 +608,9 @@ class Relation(RelationProtocol):
         elif isinstance(new_x, ArrayAxis):
             new_x = new_x.copy()
         else:
-            new_x = self._get_array_axis_from_array_method(new_x, False)
+            new_x = Config.get_array_axis_from_array_method(new_x, False)
 
-        new_y = self._interpolate_extrapolate_method(
+        new_y = Config.interpolate_extrapolate_method(
             self.x.array.copy(), self.y.copy())(new_x)
         return type(self)(new_x, new_y)
 
@@ -355,6 +630,23 @@ class Relation(RelationProtocol):
         new_x.end = new_x.end + x_shift
         return type(self)(new_x, self.y)
 
+    def astype(self: R, precision: Precision) -> R:
+        '''Convert relation to precision.
+
+        The result has the requested precision even if `Config.precision`
+        is different (option `precision` of the constructor). Results of
+        operations with it follow `Config.precision`.
+
+        Args:
+            self (R): instance of Relation
+            precision (Precision): "single" (float32 and complex64) or
+                "double" (float64 and complex128).
+
+        Returns:
+            R: new instance of Relation
+        '''
+        return type(self)(self.x.copy(), self.y, precision=precision)
+
     @staticmethod
     def equalize(r1: R, r2: R2) -> Tuple[R, R2]:
         '''Bringing two Relation objects with different x-axes to one common one.
@@ -431,10 +723,10 @@ class Relation(RelationProtocol):
 
         if isinstance(b, RelationProtocol):
             r1, r2 = Relation.equalize(a, b)
-            return r1.x.copy(), a._math_operation(
+            return r1.x.copy(), Config.math_operation(
                 r1.y.copy(), r2.y.copy(), name_operation)
         else:
-            return a.x.copy(), a._math_operation(
+            return a.x.copy(), Config.math_operation(
                 a.y.copy(), b, name_operation)
 
     def __add__(self: R, other: Union["Relation", Number]) -> R:
@@ -526,3 +818,4 @@ class Relation(RelationProtocol):
 
     def __str__(self) -> str:
         return f"y: {self.y}\nx: {str(self.x)}"
+
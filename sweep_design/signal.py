@@ -1,4 +1,4 @@
-from typing import Optional, Type, TypeVar, Union
+from typing import Any, Optional, Type, TypeVar, Union
 
 import numpy as np  # type: ignore
 
@@ -6,9 +6,11 @@ from . import spectrum
 from .axis import ArrayAxis
 from .config.base_config import Config
 from .core import RelationProtocol
-from .exc import ConvertingError
+from .exc import BadInputError, ConvertingError, NotEqualError
 from .relation import Relation
 from .help_types import ArrayLike, Number, RealNumber
+from .memmap import PathLike, open_output
+from .precision import Precision, get_dtype, keep_precision, set_precision
 
 S = TypeVar("S", bound="Signal")
 '''Instance of `Signal`.'''
@@ -37,11 +39,16 @@ class Signal(Relation):
     the instance of `Signal` class.
     '''
 
+    __slots__ = ("_spectrum",)
+
     def __init__(
         self,
         time: Union[RelationProtocol, ArrayAxis, ArrayLike],
         amplitude: ArrayLike = None,
-        spectrum: Optional["spectrum.Spectrum"] = None
+        spectrum: Optional["spectrum.Spectrum"] = None,
+        *,
+        copy: bool = True,
+        precision: Optional[Precision] = None,
     ) -> None:
         '''Initialization of instance of `Signal`.
 
@@ -52,12 +59,24 @@ class Signal(Relation):
 
             amplitude (ArrayLike, optional): None or array_like object
                 containing numbers (real or complex). Defaults to None.
+
+            copy (bool, optional): if False, then the array is used without
+                copying (see `Relation`). Defaults to True.
+
+            precision (Precision, optional): precision of the array. If None,
+                then `Config.precision` is used (see `Relation`).
+                Defaults to None.
         '''
 
-        self._signal2spectrum_method_default = Config.signal2spectrum_method
-        super().__init__(time, amplitude)
+        super().__init__(time, amplitude, copy=copy, precision=precision)
         self._spectrum = spectrum
 
+    _transient_attributes = Relation._transient_attributes + ("_spectrum",)
+
+    def _init_transient(self) -> None:
+        super()._init_transient()
+        self._spectrum = None
+
     @property
     def time(self) -> ArrayAxis:
         '''Time array axis.
@@ -100,7 +119,7 @@ class Signal(Relation):
 
         if self._spectrum is None or frequency:
 
-            f, a = self._signal2spectrum_method_default(
+            f, a = Config.signal2spectrum_method(
                 self, frequency, is_start_zero)
             self._spectrum = spectrum.Spectrum(f, a, self)
 
@@ -147,11 +166,203 @@ class Signal(Relation):
         '''
         return self.get_spectrum(frequency, is_start_zero).get_phase_spectrum()
 
+    def get_band_spectrum(
+        self,
+        frequency_start: float,
+        frequency_end: float,
+        frequency_sample: Optional[float] = None,
+        is_start_zero=False
+    ) -> "spectrum.Spectrum":
+        '''Get spectrum of signal only in the band of frequency.
+
+        Only the requested frequencies are calculated (zoom FFT), so the band
+        can be calculated with fine resolution without the full spectrum.
+        The method defined in the `Config` class is used
+        (`Config.band_spectrum_method`). The result is not cached and is not
+        linked to the signal.
+
+        Args:
+            frequency_start (float): the start frequency.
+
+            frequency_end (float): the end frequency.
+
+            frequency_sample (float, optional): sample of frequency. If None,
+                then the sample of `get_spectrum` (1 / (size * sample)).
+                Defaults to None.
+
+            is_start_zero (bool, optional): If True then the signal will be
+                shifted to zero. Defaults to `False`.
+
+        Returns:
+            spectrum.Spectrum: spectrum in the band of frequency.
+        '''
+        if frequency_sample is None:
+            frequency_sample = 1 / (self.size * self.sample)
+
+        frequency = ArrayAxis(frequency_start, frequency_end, frequency_sample)
+        time_start = 0.0 if is_start_zero else self.start
+        return spectrum.Spectrum(frequency, Config.band_spectrum_method(
+            self.y, self.sample, time_start, frequency))
+
+    def get_sparse_spectrum(
+        self,
+        frequency: Union[ArrayAxis, ArrayLike],
+        is_start_zero=False
+    ) -> "spectrum.SparseSpectrum":
+        '''Get spectrum of signal at a few frequencies.
+
+        The spectrum is calculated only at the requested frequencies (for
+        example, the fundamental frequency and its harmonics), which is
+        faster than `get_spectrum` when there are few frequencies.
+        Frequencies can be arbitrary. If they are equally spaced, the result
+        can be converted to `spectrum.Spectrum` by `to_spectrum`.
+        The method defined in the `Config` class is used
+        (`Config.sparse_spectrum_method`). Use this method of `Config`
+        directly to calculate many signals.
+
+        Args:
+            frequency (Union[ArrayAxis, ArrayLike]): frequencies.
+
+            is_start_zero (bool, optional): If True then the signal will be
+                shifted to zero. Defaults to `False`.
+
+        Returns:
+            spectrum.SparseSpectrum: frequencies and spectrum at them.
+        '''
+        if isinstance(frequency, ArrayAxis):
+            array = frequency.array
+        else:
+            array = np.atleast_1d(np.asarray(frequency, dtype=float))
+
+        time_start = 0.0 if is_start_zero else self.start
+        return spectrum.SparseSpectrum(array, set_precision(
+            Config.sparse_spectrum_method(
+                self.y, self.sample, time_start, array), Config.precision))
+
+    def get_power_spectral_density(
+        self,
+        nperseg: int = 256,
+        hop: Optional[int] = None,
+        window: Any = "hann",
+        nfft: Optional[int] = None,
+    ) -> Relation:
+        '''Get power spectral density of signal averaged by Welch's method.
+
+        The method defined in the `Config` class is used
+        (`Config.power_spectral_density_method`).
+
+        Args:
+            nperseg (int, optional): length of each segment. Defaults to 256.
+
+            hop (int, optional): number of samples between the starts of
+                neighbouring segments. If None, then `nperseg // 2`.
+                Defaults to None.
+
+            window (Any, optional): window, any value accepted by
+                `scipy.signal.get_window`. Defaults to "hann".
+
+            nfft (int, optional): length of FFT. If None, then equal to
+                `nperseg`. Defaults to None.
+
+        Raises:
+            BadInputError: raise exception if hop is not from 1 to nperseg.
+
+        Returns:
+            Relation: power spectral density.
+        '''
+        frequency, density = Config.power_spectral_density_method(
+            self.y, self.sample, nperseg, hop, window, nfft)
+        return Relation(frequency, density)
+
+    def get_cross_spectral_density(
+        self,
+        other: SSPR,
+        nperseg: int = 256,
+        hop: Optional[int] = None,
+        window: Any = "hann",
+        nfft: Optional[int] = None,
+    ) -> "spectrum.Spectrum":
+        '''Get cross spectral density of two signals averaged by Welch's method.
+
+        Signals must have the same sample and size. The method defined in
+        the `Config` class is used (`Config.cross_spectral_density_method`).
+
+        Args:
+            other (SSPR): the second signal. An instance of `spectrum.Spectrum`
+                will be converted to `Signal`.
+
+            nperseg (int, optional): length of each segment. Defaults to 256.
+
+            hop (int, optional): number of samples between the starts of
+                neighbouring segments. If None, then `nperseg // 2`.
+                Defaults to None.
+
+            window (Any, optional): window, any value accepted by
+                `scipy.signal.get_window`. Defaults to "hann".
+
+            nfft (int, optional): length of FFT. If None, then equal to
+                `nperseg`. Defaults to None.
+
+        Raises:
+            NotEqualError: raise exception if sizes of signals are different.
+            BadInputError: raise exception if samples of signals are different
+                or hop is not from 1 to nperseg.
+
+        Returns:
+            spectrum.Spectrum: cross spectral density.
+        '''
+        other_signal = _inp2signal(other)
+        _check_common_time(self, other_signal)
+        frequency, density = Config.cross_spectral_density_method(
+            self.y, other_signal.y, self.sample, nperseg, hop, window, nfft)
+        return spectrum.Spectrum(frequency, density)
+
+    def spectral_diff(self: S, order: int = 1) -> S:
+        '''Differentiation of `Signal` in the frequency domain.
+
+        Unlike `diff`, the time axis of the result is equal to the time axis
+        of the signal. The method defined in the `Config` class is used
+        (`Config.spectral_derivative_method`).
+
+        Args:
+            self (S): instance of Signal.
+            order (int, optional): order of the derivative. Defaults to 1.
+
+        Returns:
+            S: result of differentiation.
+        '''
+        return type(self)(self.x.copy(), Config.spectral_derivative_method(
+            self.y, self.sample, order))
+
+    def spectral_integrate(
+        self: S, order: int = 1, low_frequency: float = 0.0
+    ) -> S:
+        '''Integration of `Signal` in the frequency domain.
+
+        Unlike `integrate`, the time axis of the result is equal to the time
+        axis of the signal. The zero frequency is removed and frequencies
+        below `low_frequency` are suppressed by regularization.
+        The method defined in the `Config` class is used
+        (`Config.spectral_derivative_method`).
+
+        Args:
+            self (S): instance of Signal.
+            order (int, optional): order of the integral. Defaults to 1.
+            low_frequency (float, optional): frequency below which integration
+                is suppressed. Defaults to 0.0.
+
+        Returns:
+            S: result of integration.
+        '''
+        return type(self)(self.x.copy(), Config.spectral_derivative_method(
+            self.y, self.sample, -order, low_frequency))
+
     def shift(self: S, x_shift: RealNumber = 0) -> S:
 
         sp = self.get_spectrum()
         shift = spectrum.Spectrum(
-            sp.frequency, np.exp(-1j * sp.frequency.array * 2 * np.pi * x_shift))
+            sp.frequency, keep_precision(
+                np.exp(-1j * sp.frequency.array * 2 * np.pi * x_shift), self.y))
 
         return self.add_phase(shift)
 
@@ -260,6 +471,63 @@ class Signal(Relation):
         s_r2 = _inp2signal(r2)
         return cls(super().correlate(s_r1, s_r2))
 
+    def block_correlate(
+        self,
+        reference: SSPR,
+        out: Optional[PathLike] = None,
+        block_size: Optional[int] = None,
+    ) -> "Signal":
+        '''Correlate long signal with short reference signal block by block.
+
+        The correlation is calculated for non-negative lags only (the time
+        of the result starts from zero and has the size of the signal), as
+        for the record of vibrator correlated with the sweep. Only a block of
+        the signal is read at once, so the signal can be memory-mapped and
+        the result can be written to a new memory-mapped file.
+        The method defined in the `Config` class is used
+        (`Config.block_correlate_method`).
+
+        Args:
+            reference (SSPR): reference signal with the same sample.
+                An instance of `spectrum.Spectrum` will be converted
+                to `Signal`.
+
+            out (PathLike, optional): path of new `.npy` file for the result.
+                If None, the result is in memory. Defaults to None.
+
+            block_size (int, optional): number of lags calculated at once.
+                If None, then `Config.chunk_size`. Defaults to None.
+
+        Raises:
+            BadInputError: raise exception if samples of signals are different
+                or the reference is longer than the signal.
+
+        Returns:
+            Signal: correlation of signal with reference.
+        '''
+        reference_signal = _inp2signal(reference)
+        if not np.isclose(self.sample, reference_signal.sample):
+            raise BadInputError(
+                f"Samples of signals are different: {self.sample} and "
+                f"{reference_signal.sample}.")
+        if reference_signal.size > self.size:
+            raise BadInputError("Reference is longer than signal")
+
+        dtype = np.result_type(self.y.dtype, reference_signal.y.dtype,
+                               np.float32)
+        if Config.precision is not None:
+            dtype = get_dtype(dtype, Config.precision)
+
+        result = open_output(out, (self.size,), dtype)
+        Config.block_correlate_method(
+            self.y, reference_signal.y, result,
+            Config.chunk_size if block_size is None else block_size)
+        if isinstance(result, np.memmap):
+            result.flush()
+
+        time = ArrayAxis(0.0, (self.size - 1) * self.sample, self.sample)
+        return Signal(time, result)
+
     def __add__(self: S, a: SSPRN) -> S:
         s_a = _inp2signal_operation(a)
         return super().__add__(s_a)
@@ -297,3 +565,12 @@ def _inp2signal(inp: SSPR) -> Signal:
         return Signal(inp)
     else:
         raise ConvertingError(type(inp), Signal)
+
+
+def _check_common_time(first: Relation, second: Relation) -> None:
+    if first.size != second.size:
+        raise NotEqualError(first.size, second.size)
+    if not np.isclose(first.sample, second.sample):
+        raise BadInputError(
+            f"Samples of signals are different: {first.sample} and "
+            f"{second.sample}.")
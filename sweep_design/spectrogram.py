@@ -1,9 +1,13 @@
-
-from typing import NamedTuple
+from typing import List, NamedTuple, Optional, Tuple
 
 import numpy as np
 
 from .axis import ArrayAxis
+from .exc import BadInputError
+from .help_types import Literal
+
+PyramidReduction = Literal["mean", "max"]
+'''How pixels of spectrogram are merged on the next level of pyramid.'''
 
 
 class Spectrogram(NamedTuple):
@@ -14,3 +18,189 @@ class Spectrogram(NamedTuple):
     time: ArrayAxis
     frequency: ArrayAxis
     spectrogram: np.ndarray
+
+
+class SpectrogramPyramid:
+    '''Spectrogram decimated several times in time and frequency.
+
+    Level 0 is the original spectrogram. Each next level is decimated
+    by `factor` along each axis longer than `min_size` (blocks of pixels are
+    merged by mean or maximum). Levels are calculated once when the pyramid
+    is created. Use `get_region` to get the part of spectrogram
+    with resolution enough to draw it at the given size in pixels. Only
+    the required part of the selected level is read (the result is a view).
+
+    The image of each level follows `Spectrogram`: rows go from the highest
+    frequency to the lowest. Axes of the next levels are centres of merged
+    blocks.
+    '''
+
+    def __init__(
+        self,
+        spectrogram: Spectrogram,
+        factor: int = 2,
+        min_size: int = 256,
+        reduction: PyramidReduction = "mean",
+    ) -> None:
+        '''Build pyramid of spectrogram.
+
+        Args:
+            spectrogram (Spectrogram): the original spectrogram.
+
+            factor (int, optional): decimation factor between levels.
+                Defaults to 2.
+
+            min_size (int, optional): axes are not decimated below this size.
+                Defaults to 256.
+
+            reduction (Literal[&quot;mean&quot;, &quot;max&quot;], optional):
+                how blocks of pixels are merged. Defaults to "mean".
+
+        Raises:
+            BadInputError: raise exception if factor is less than 2 or
+                reduction is unknown.
+        '''
+        if factor < 2:
+            raise BadInputError("Factor of pyramid must be at least 2")
+
+        if reduction not in ("mean", "max"):
+            raise BadInputError(f"Unknown reduction of pyramid: {reduction}")
+
+        self.factor = factor
+        self.min_size = min_size
+        self.reduction = reduction
+        self.levels: List[Spectrogram] = [spectrogram]
+
+        while True:
+            level = self._decimate(self.levels[-1])
+            if level is None:
+                break
+            self.levels.append(level)
+
+    def get_level(self, level: int) -> Spectrogram:
+        '''Get level of pyramid.
+
+        Args:
+            level (int): number of level. 0 is the original spectrogram.
+
+        Returns:
+            Spectrogram: spectrogram of level.
+        '''
+        return self.levels[level]
+
+    def get_region(
+        self,
+        time_start: Optional[float] = None,
+        time_end: Optional[float] = None,
+        frequency_start: Optional[float] = None,
+        frequency_end: Optional[float] = None,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+    ) -> Spectrogram:
+        '''Get region of spectrogram at the coarsest sufficient level.
+
+        The level is the coarsest one, which has at least `width` points of
+        time and `height` points of frequency inside the region.
+        If no level has enough points, the original spectrogram is used.
+
+        Args:
+            time_start (float, optional): start of time. Defaults to None.
+            time_end (float, optional): end of time. Defaults to None.
+            frequency_start (float, optional): start of frequency.
+                Defaults to None.
+            frequency_end (float, optional): end of frequency.
+                Defaults to None.
+            width (int, optional): required number of points of time.
+                If None, the original resolution of time is required.
+                Defaults to None.
+            height (int, optional): required number of points of frequency.
+                If None, the original resolution of frequency is required.
+                Defaults to None.
+
+        Returns:
+            Spectrogram: region of spectrogram. The image is a view of
+                the level.
+        '''
+        for level in reversed(self.levels):
+            time_slice = _get_slice(level.time, time_start, time_end)
+            frequency_slice = _get_slice(
+                level.frequency, frequency_start, frequency_end)
+
+            is_enough_time = width is not None and \
+                time_slice.stop - time_slice.start >= width
+            is_enough_frequency = height is not None and \
+                frequency_slice.stop - frequency_slice.start >= height
+
+            if level is self.levels[0] or (
+                    (is_enough_time or level.time is self.levels[0].time)
+                    and (is_enough_frequency
+                         or level.frequency is self.levels[0].frequency)):
+                break
+
+        size = level.frequency.size
+        rows = slice(size - frequency_slice.stop, size - frequency_slice.start)
+        return Spectrogram(
+            _get_sub_axis(level.time, time_slice),
+            _get_sub_axis(level.frequency, frequency_slice),
+            level.spectrogram[rows, time_slice]
+        )
+
+    def _decimate(self, level: Spectrogram) -> Optional[Spectrogram]:
+        time, frequency, image = level
+        is_time = time.size > self.min_size
+        is_frequency = frequency.size > self.min_size
+        if not (is_time or is_frequency):
+            return None
+
+        if is_time:
+            time, image = self._decimate_axis(time, image, 1, "start")
+        if is_frequency:
+            frequency, image = self._decimate_axis(frequency, image, 0, "end")
+
+        return Spectrogram(time, frequency, image)
+
+    def _decimate_axis(
+        self, axis: ArrayAxis, image: np.ndarray, dimension: int,
+        origin: Literal["start", "end"]
+    ) -> Tuple[ArrayAxis, np.ndarray]:
+        # Blocks are counted from the start of time and from the highest
+        # frequency (the first row of image).
+        indices = np.arange(0, axis.size, self.factor)
+        if self.reduction == "mean":
+            counts = np.diff(np.append(indices, axis.size))
+            shape = [1, 1]
+            shape[dimension] = counts.size
+            image = (np.add.reduceat(image, indices, axis=dimension)
+                     / counts.reshape(shape)).astype(image.dtype, copy=False)
+        else:
+            image = np.maximum.reduceat(image, indices, axis=dimension)
+
+        sample = axis.sample * self.factor
+        offset = (self.factor - 1) / 2 * axis.sample
+        if origin == "start":
+            start = axis.start + offset
+            new_axis = ArrayAxis(
+                start, start + (indices.size - 1) * sample, sample)
+        else:
+            end = axis.end - offset
+            new_axis = ArrayAxis(
+                end - (indices.size - 1) * sample, end, sample)
+
+        return new_axis, image
+
+
+def _get_slice(
+    axis: ArrayAxis, start: Optional[float], end: Optional[float]
+) -> slice:
+    array = axis.array
+    first = 0 if start is None else int(np.searchsorted(array, start))
+    last = array.size if end is None else \
+        int(np.searchsorted(array, end, side="right"))
+    return slice(first, max(first, last))
+
+
+def _get_sub_axis(axis: ArrayAxis, selected: slice) -> ArrayAxis:
+    size = selected.stop - selected.start
+    start = axis.start + selected.start * axis.sample
+    return ArrayAxis(start, start + (max(size, 1) - 1) * axis.sample,
+                     axis.sample)
@@ -1,4 +1,4 @@
-from typing import Optional, Type, TypeVar, Union
+from typing import NamedTuple, Optional, Type, TypeVar, Union
 
 import numpy as np
 
@@ -6,7 +6,8 @@ from . import signal
 from .axis import ArrayAxis
 from .config.base_config import Config
 from .core import RelationProtocol
-from .exc import ConvertingError
+from .exc import BadInputError, ConvertingError
+from .precision import Precision
 from .relation import Relation
 from .help_types import ArrayLike, Number
 
@@ -38,11 +39,16 @@ class Spectrum(Relation):
 
     '''
 
+    __slots__ = ("_signal",)
+
     def __init__(
         self,
         frequency: Union[RelationProtocol, ArrayAxis, ArrayLike],
         spectrum_amplitude: ArrayLike = None,
-        signal: Optional["signal.Signal"] = None
+        signal: Optional["signal.Signal"] = None,
+        *,
+        copy: bool = True,
+        precision: Optional[Precision] = None,
     ) -> None:
         '''Initialization of instance of `Spectrum`.
 
@@ -56,11 +62,23 @@ class Spectrum(Relation):
                 None or array_like object containing numbers (real or complex).
                 Defaults to None.
 
+            copy (bool, optional): if False, then the array is used without
+                copying (see `Relation`). Defaults to True.
+
+            precision (Precision, optional): precision of the array. If None,
+                then `Config.precision` is used (see `Relation`).
+                Defaults to None.
+
         '''
-        super().__init__(frequency, spectrum_amplitude)
-        self._spectrum2signal_method_default = Config.spectrum2signal_method
+        super().__init__(frequency, spectrum_amplitude, copy=copy, precision=precision)
         self._signal = signal
 
+    _transient_attributes = Relation._transient_attributes + ("_signal",)
+
+    def _init_transient(self) -> None:
+        super()._init_transient()
+        self._signal = None
+
     @property
     def frequency(self) -> ArrayAxis:
         '''Frequency array axis.
@@ -103,7 +121,7 @@ class Spectrum(Relation):
 
         if self._signal is None or time:
 
-            time, amplitude = self._spectrum2signal_method_default(
+            time, amplitude = Config.spectrum2signal_method(
                 self, time, start_time
             )
             self._signal = signal.Signal(time, amplitude, self)
@@ -312,3 +330,33 @@ def _input2spectrum(inp: SSPR) -> Spectrum:
         return Spectrum(inp)
     else:
         raise ConvertingError(type(inp), Spectrum)
+
+
+class SparseSpectrum(NamedTuple):
+    '''Spectrum of signal at arbitrary frequencies.
+
+    The result of `signal.Signal.get_sparse_spectrum`. Frequencies are not
+    necessarily equally spaced or sorted (for example, the fundamental
+    frequency and its harmonics).
+    '''
+    frequency: np.ndarray
+    amplitude: np.ndarray
+
+    def to_spectrum(self) -> Spectrum:
+        '''Convert to `Spectrum`.
+
+        Raises:
+            BadInputError: raise exception if frequencies are not increasing
+                and equally spaced.
+
+        Returns:
+            Spectrum: spectrum on the axis of frequencies.
+        '''
+        steps = np.diff(self.frequency)
+        if steps.size and (steps[0] <= 0 or not np.allclose(steps, steps[0])):
+            raise BadInputError(
+                "Frequencies of spectrum must be increasing and equally "
+                "spaced.")
+        frequency = ArrayAxis(self.frequency[0], self.frequency[-1],
+                              steps[0] if steps.size else 1.0)
+        return Spectrum(frequency, self.amplitude)
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Optional, Union
 
 import numpy as np
 
@@ -7,6 +7,8 @@ from .config.sweep_config import SweepConfig
 from .config.base_config import Config
 from .core import RelationProtocol
 from .defaults.sweep_methods import Spectrogram as DataSpectrogram
+from .exc import BadInputError
+from .precision import Precision
 from .relation import Relation
 from .signal import Signal
 from .spectrogram import Spectrogram
@@ -34,6 +36,9 @@ class Sweep(Signal):
 
     '''
 
+    __slots__ = ("frequency_time", "amplitude_time", "spectrogram",
+                 "a_prior_signal")
+
     def __init__(
         self,
         time: Union[RelationProtocol, ArrayAxis, ArrayLike],
@@ -41,6 +46,10 @@ class Sweep(Signal):
         frequency_time: Relation = None,
         amplitude_time: Relation = None,
         a_prior_signal: Signal = None,
+        spectrogram: Optional[Union[Spectrogram, DataSpectrogram]] = None,
+        *,
+        copy: bool = True,
+        precision: Optional[Precision] = None,
     ) -> None:
         '''Initialize sweep instance.
 
@@ -64,9 +73,24 @@ class Sweep(Signal):
             a_prior_signal (Signal, optional): The signal used to create
                 the sweep signal. Defaults to None.
 
+            spectrogram (Union[Spectrogram, DataSpectrogram], optional):
+                spectrogram of the signal (as returned by
+                `SweepConfig.spectrogram_method`). If None, it is calculated.
+                Defaults to None.
+
+            copy (bool, optional): if False, then the amplitude is used
+                without copying (see `Relation`). Defaults to True.
+
+            precision (Precision, optional): precision of the array. If None,
+                then `Config.precision` is used (see `Relation`).
+                Defaults to None.
+
+        Raises:
+            BadInputError: raise exception if spectrogram is neither
+                `Spectrogram` nor tuple of time, frequency and 2D array.
         '''
 
-        super().__init__(time, amplitude)
+        super().__init__(time, amplitude, copy=copy, precision=precision)
 
         self.frequency_time = (
             frequency_time
@@ -79,14 +103,29 @@ class Sweep(Signal):
             else SweepConfig.get_a_t(self)
         )
 
-        spectrogram = SweepConfig.spectrogram_method(self)
+        if spectrogram is None:
+            spectrogram = SweepConfig.spectrogram_method(self)
 
         self.spectrogram = _get_spectrogram(spectrogram)
 
         self.a_prior_signal = a_prior_signal
 
 
-def _get_spectrogram(spectrogram: DataSpectrogram) -> Spectrogram:
+def _get_spectrogram(
+    spectrogram: Union[Spectrogram, DataSpectrogram]
+) -> Spectrogram:
+    if isinstance(spectrogram, Spectrogram):
+        return spectrogram
+
+    if not isinstance(spectrogram, tuple) or len(spectrogram) != 3 or \
+            np.ndim(spectrogram[2]) != 2:
+        raise BadInputError(
+            "Spectrogram must be instance of Spectrogram or tuple of time, "
+            "frequency and 2D array of spectrogram.")
+    return _data2spectrogram(spectrogram)
+
+
+def _data2spectrogram(spectrogram: DataSpectrogram) -> Spectrogram:
     spectrogram_ = spectrogram[2]
     if spectrogram[0].size < 2:
         time = np.append(spectrogram[0]
@@ -115,5 +154,5 @@ def _get_spectrogram(spectrogram: DataSpectrogram) -> Spectrogram:
     return Spectrogram(
         time=Config.get_array_axis_from_array_method(time),
         frequency=Config.get_array_axis_from_array_method(frequency),
-        spectrogram=spectrogram[2],
+        spectrogram=spectrogram_,
     )
@@ -8,7 +8,7 @@ from .axis import ArrayAxis
 from .config.base_config import Config
 from .config.sweep_config import SweepConfig
 from .defaults.sweep_methods import (CallFtatMethod, Ftatr, InterpolateArray,
-                                     get_info_from_a_prior_data,
+                                     get_a_prior_analysis,
                                      get_info_from_ftat)
 from .exc import BadInputError
 from .relation import Relation
@@ -62,11 +62,8 @@ class UncalculatedSweep:
                 and equal to 1. Defaults to None.
         '''
 
-        self._integrate_function_default = Config.integrate_function_method
-        self._get_array_axis_from_array_method = Config.get_array_axis_from_array_method
-
         if not (isinstance(time, ArrayAxis) or time is None):
-            time = self._get_array_axis_from_array_method(time)
+            time = Config.get_array_axis_from_array_method(time)
 
         if not (
             isinstance(
@@ -131,14 +128,14 @@ class UncalculatedSweep:
             if isinstance(time, ArrayAxis):
                 calc_time = time
             else:
-                calc_time = self._get_array_axis_from_array_method(time)
+                calc_time = Config.get_array_axis_from_array_method(time)
         elif time is None and self._time is not None:
             calc_time = self._time
 
         if isinstance(self._frequency_time, InterpolateArray):
-            tht = self._array_tht(self._frequency_time(calc_time))
-            frequency_time = Relation(
-                calc_time, self._frequency_time(calc_time))
+            frequency_time_array = self._frequency_time(calc_time)
+            tht = self._array_tht(frequency_time_array)
+            frequency_time = Relation(calc_time, frequency_time_array)
         else:
             tht = self._func_tht(self._frequency_time)
             frequency_time = Relation(
@@ -171,7 +168,7 @@ class UncalculatedSweep:
 
         def result(time: ArrayAxis) -> Relation:
             return Relation(
-                *self._integrate_function_default(frequency_time, time))
+                *Config.integrate_function_method(frequency_time, time))
         return result
 
     def _array_tht(
@@ -202,6 +199,13 @@ class ApriorUncalculatedSweep(UncalculatedSweep):
     The extracted frequency over time (`frequency_time`) and the amplitude
     envelope over time (`amplitude_time`) will be send to the
     `UncalculatedSweep` constructor.
+
+    The analysis of a prior data (spectrum, conversion by `ftat_method` and
+    norm of a prior signal) is done once in the constructor and is kept by
+    the instance. It is also cached by content of data and by methods of
+    `Config` (see `sweep_design.defaults.sweep_methods.get_a_prior_analysis`),
+    so instances created from the same data, method and configuration share
+    the functions of frequency and amplitude, but not the a prior signal.
     '''
 
     def __init__(
@@ -233,7 +237,8 @@ class ApriorUncalculatedSweep(UncalculatedSweep):
             frequency_time,
             amplitude_time,
             self._a_prior_signal,
-        ) = get_info_from_a_prior_data(time, a_prior_data, ftat_method)
+            self._a_prior_norm,
+        ) = get_a_prior_analysis(time, a_prior_data, ftat_method)
         super().__init__(time, frequency_time, amplitude_time)
 
     def __call__(
@@ -262,8 +267,7 @@ class ApriorUncalculatedSweep(UncalculatedSweep):
 
         if is_normalize:
             norm_sweep = sweep.get_norm()
-            norm_a_prior = self._a_prior_signal.get_norm()
-            norm = sqrt(norm_a_prior) / sqrt(norm_sweep)
+            norm = sqrt(self._a_prior_norm) / sqrt(norm_sweep)
             sweep.amplitude_time *= norm
             sweep *= norm
 
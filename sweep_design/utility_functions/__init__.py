@@ -1,6 +1,23 @@
-from .a_t import tukey_a_t
+from .a_t import get_taper_window, tukey_a_t, window_a_t
 from .emd_analyze import get_IMFs_ceemdan, get_IMFs_emd
+from .ceemdan_pool import CEEMDANPool, get_IMFs_ceemdan_pool
 from .f_t import f_t_linear_array, f_t_linear_function
-from .ftat_functions import proportional_freq2time, dwell
+from .ftat_functions import proportional_freq2time, dwell, dwell_batch
 from .sweep_correction import correct_sweep
 from .source_sweep_correction import get_correction_for_source
+from .batch_source_correction import (
+    SourceCorrectionResult,
+    SourceParameters,
+    get_corrections_for_sources,
+)
+from .spectral_density import (
+    get_cross_spectral_densities,
+    get_mean_power_spectral_density,
+    get_power_spectral_densities,
+)
+from .shared_signals import (
+    SharedSignalInfo,
+    SharedSignals,
+    attach_signals,
+    detach_signals,
+)
@@ -1,21 +1,80 @@
+from functools import lru_cache
 from typing import Optional
 import numpy as np
-from scipy.signal.windows import tukey  # type: ignore
+from scipy.signal.windows import get_window, tukey  # type: ignore
 
 from ..help_types import Literal
 
 Location = Literal["left", "right", "both"]
 
+WindowKind = Literal["tukey", "hann", "blackman", "cosine"]
 
-def tukey_a_t(
+
+@lru_cache(maxsize=128)
+def get_taper_window(
+    size: int,
+    tapper: float,
+    location: Location = "both",
+    kind: WindowKind = "tukey",
+) -> np.ndarray:
+    '''Get cached window to taper the edges of a signal.
+
+    Windows are cached by all parameters, so the same window is calculated
+    only once. **The returned array is read-only and shared between calls.**
+    Copy it before changing.
+
+    Args:
+        size (int): size of window.
+
+        tapper (float): fraction of the window inside the tapered region
+            (from 0 to 1), the same as `alpha` of the Tukey window.
+
+        location (Literal[&quot;left&quot;, &quot;right&quot;, &quot;both&quot;], optional):
+            Where the taper will be applied. Defaults to "both".
+
+        kind (Literal[&quot;tukey&quot;, &quot;hann&quot;, &quot;blackman&quot;, &quot;cosine&quot;], optional):
+            Shape of the taper. "tukey" is `scipy.signal.windows.tukey`.
+            Other kinds use the rising half of the corresponding window of
+            `scipy.signal.windows`. Defaults to "tukey".
+
+    Returns:
+        np.ndarray: read-only window.
+    '''
+    if kind == "tukey":
+        result = tukey(size, alpha=tapper)
+    else:
+        result = np.ones(size)
+        width = int(np.floor(tapper * (size - 1) / 2.0))
+        if width > 0:
+            edge = get_window(kind, 2 * width + 1, fftbins=False)[:width]
+            result[:width] = edge
+            result[size - width:] = edge[::-1]
+
+    if location != "both":
+        result[int(size / 2):] = 1.0
+
+        if location == "right":
+            result = result[::-1].copy()
+        elif location != "left":
+            result = np.ones(size)
+
+    result.setflags(write=False)
+    return result
+
+
+def window_a_t(
     time: np.ndarray,
     time_tapper: Optional[float],
     location: Location = "both",
+    kind: WindowKind = "tukey",
 ) -> np.ndarray:
-    '''Calculate array envelope for signal.
+    '''Calculate array envelope for signal using cached taper windows.
+
+    **The returned array is read-only and shared between calls** (see
+    `get_taper_window`). Copy it before changing.
 
     Args:
-        time (np.ndarray): time
+        time (np.ndarray): time (ascending).
 
         time_tapper (float): time_tapper in time, where coefficient will be equal 1.
 
@@ -26,31 +85,50 @@ def tukey_a_t(
             "both" is at the start and at the end.
             Defaults to "both".
 
+        kind (Literal[&quot;tukey&quot;, &quot;hann&quot;, &quot;blackman&quot;, &quot;cosine&quot;], optional):
+            Shape of the taper. Defaults to "tukey".
+
     Returns:
         np.ndarray: amplitude correction for signal. Multiple signal to result
             of function.
     '''
     if time_tapper is None:
-        return np.ones(time.size)
+        return get_taper_window(time.size, 0.0, "both", kind)
 
     if time_tapper <= time[int(time.size / 2)]:
-        tapper = time[time <= time_tapper].size * 2 / time.size
+        tapper = int(np.searchsorted(time, time_tapper, side="right")) \
+            * 2 / time.size
     else:
         tapper = 1.0
 
-    result = tukey(time.size, alpha=tapper)
+    return get_taper_window(time.size, tapper, location, kind)
 
-    if location == "both":
-        return result
 
-    result = np.append(
-        result[: int(time.size / 2)], np.ones(time.size - int(time.size / 2))
-    )
+def tukey_a_t(
+    time: np.ndarray,
+    time_tapper: Optional[float],
+    location: Location = "both",
+) -> np.ndarray:
+    '''Calculate array envelope for signal.
+
+    The Tukey window is taken from cache (see `get_taper_window`) and
+    copied, so the returned array can be changed. Use `window_a_t` to get
+    the cached read-only window without copying.
+
+    Args:
+        time (np.ndarray): time
 
-    if location == "left":
-        return result
+        time_tapper (float): time_tapper in time, where coefficient will be equal 1.
 
-    if location == "right":
-        return np.flip(result)
+        location (Literal[&quot;left&quot;, &quot;right&quot;, &quot;both&quot;], optional):
+            Where the correction will be applied.
+            "left" is at the start.
+            "right" is at the end.
+            "both" is at the start and at the end.
+            Defaults to "both".
 
-    return np.ones(time.size)
+    Returns:
+        np.ndarray: amplitude correction for signal. Multiple signal to result
+            of function.
+    '''
+    return window_a_t(time, time_tapper, location, "tukey").copy()
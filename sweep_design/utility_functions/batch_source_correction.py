@@ -0,0 +1,110 @@
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import product
+from typing import Callable, Iterator, NamedTuple, Optional, Sequence, Set, Tuple
+
+from ..signal import Signal
+from .source_sweep_correction import correct_for_source, linear_coefficient
+
+
+class SourceParameters(NamedTuple):
+    '''Parameters of vibration source used by `get_correction_for_source`.
+
+    `coefficient_function` is sent to worker processes, so it must be
+    picklable (a function defined at module level, not a lambda).
+    '''
+    reaction_mass: float = 1.0
+    limits: Optional[float] = None
+    limits_percent: float = 0.85
+    limit_iteration: Optional[int] = 10
+    window_percent: float = 0.01
+    coefficient_function: Callable[[float], float] = linear_coefficient
+    low_frequency: Optional[float] = None
+
+
+class SourceCorrectionResult(NamedTuple):
+    '''Result of one job of the batch correction.
+
+    `signal_index` and `parameters_index` are positions of the input signal
+    and of the source parameters in the sequences passed to
+    `get_corrections_for_sources`.
+    '''
+    signal_index: int
+    parameters_index: int
+    signal: Signal
+    iterations: int
+    time: float
+
+
+def _run_job(
+    job: Tuple[int, int, Signal, SourceParameters]
+) -> SourceCorrectionResult:
+    signal_index, parameters_index, signal, parameters = job
+    start = time.perf_counter()
+    corrected_signal, iterations = correct_for_source(signal, *parameters)
+    return SourceCorrectionResult(
+        signal_index,
+        parameters_index,
+        corrected_signal,
+        iterations,
+        time.perf_counter() - start
+    )
+
+
+def get_corrections_for_sources(
+    signals: Sequence[Signal],
+    parameters: Sequence[SourceParameters],
+    processes: Optional[int] = None,
+    max_pending: Optional[int] = None,
+) -> Iterator[SourceCorrectionResult]:
+    '''Correct sweep signals for many vibration sources in a process pool.
+
+    A job is created for each combination of signal and source parameters.
+    Jobs are calculated using `get_correction_for_source` in a pool of
+    processes. Results are yielded as soon as they are calculated, so their
+    order is not the order of the jobs. Use `signal_index` and
+    `parameters_index` of the result to find the job.
+
+    Args:
+        signals (Sequence[Signal]): signals to be corrected.
+
+        parameters (Sequence[SourceParameters]): parameters of sources.
+
+        processes (int, optional): number of worker processes. If None, then
+            the number of CPUs is used. Defaults to None.
+
+        max_pending (int, optional): maximum number of jobs submitted to
+            the pool at the same time. Limits the memory used by jobs waiting
+            in the queue. If None, then twice the number of processes.
+            Defaults to None.
+
+    Yields:
+        Iterator[SourceCorrectionResult]: corrected signal, number of
+            iterations and time of calculation for each job.
+    '''
+    jobs = (
+        (signal_index, parameters_index, signal, source_parameters)
+        for (signal_index, signal), (parameters_index, source_parameters)
+        in product(enumerate(signals), enumerate(parameters))
+    )
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+
+    if max_pending is None:
+        max_pending = 2 * processes
+
+    with ProcessPoolExecutor(processes) as executor:
+        pending: Set[Future] = set()
+        for job in jobs:
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            pending.add(executor.submit(_run_job, job))
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
@@ -0,0 +1,314 @@
+from multiprocessing import Pool
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+from PyEMD import EMD  # type: ignore
+
+from ..signal import Signal
+from .shared_arrays import (
+    SharedArray,
+    SharedArrayInfo,
+    attach,
+    ensure_resource_tracker,
+    get_shared_memory,
+)
+
+_worker_emd: Any = None
+
+
+def _init_worker(ext_EMD: Any) -> None:
+    global _worker_emd
+    _worker_emd = EMD() if ext_EMD is None else ext_EMD
+
+
+def _decompose_noise(
+    task: Tuple[int, Any, str, float, SharedArrayInfo]
+) -> Tuple[int, Optional[np.ndarray]]:
+    trial, seed, noise_kind, noise_scale, noise_info = task
+    noise, = attach(noise_info)
+    capacity, size = noise.shape[1:]
+    generator = np.random.default_rng(seed)
+
+    if noise_kind == "normal":
+        data = generator.normal(loc=0, scale=noise_scale, size=size)
+    elif noise_kind == "uniform":
+        data = generator.uniform(
+            low=-noise_scale / 2, high=noise_scale / 2, size=size)
+    else:
+        raise ValueError(f'Unsupported noise kind "{noise_kind}". '
+                         'Allowed are "normal" and "uniform".')
+
+    imfs = _worker_emd.emd(data, None, max_imf=-1)
+    imfs /= np.std(imfs[0])
+
+    # IMFs are written to the shared array, only IMFs which do not fit
+    # into it are sent back.
+    noise[trial, :min(imfs.shape[0], capacity)] = imfs[:capacity]
+    overflow = imfs[capacity:] if imfs.shape[0] > capacity else None
+    return imfs.shape[0], overflow
+
+
+def _trial(task: Tuple[int, int, float, SharedArrayInfo, SharedArrayInfo,
+                       SharedArrayInfo, SharedArrayInfo]) -> None:
+    trial, imf_number, beta, residue_info, noise_info, count_info, out_info = task
+
+    residue, noise, counts, out = attach(
+        residue_info, noise_info, count_info, out_info)
+
+    data = residue.copy()
+    if counts[trial] > imf_number:
+        data += beta * noise[trial, imf_number]
+
+    imfs = _worker_emd.emd(data, None, max_imf=1)
+    out[trial] = imfs[0] if imf_number == 0 else imfs[-1]
+
+
+class CEEMDANPool:
+    '''Reproducible CEEMDAN executed over a persistent pool of processes.
+
+    The implementation follows the CEEMDAN algorithm of PyEMD
+    (https://pyemd.readthedocs.io/), but the signal, the current residue and
+    the IMFs of the added noise are placed in `multiprocessing.shared_memory`,
+    so that each trial sends only its number and the descriptors of
+    the shared arrays to a worker. The IMFs of noise are written by workers
+    directly into shared memory. Each trial gets its own
+    `numpy.random.Generator` spawned from one `numpy.random.SeedSequence`,
+    and the results of the trials are reduced in the order of trials.
+    Therefore, for the same seed the IMFs are identical regardless
+    of the number of processes.
+
+    The pool is created once and is reused by every call of the instance.
+    Close the pool with `close` or use the instance as a context manager.
+    Shared memory requires Python 3.8 or newer.
+
+    Example:
+        with CEEMDANPool(trials=50, seed=1, processes=4) as ceemdan:
+            imfs = [ceemdan(signal) for signal in signals]
+    '''
+
+    def __init__(
+        self,
+        trials=30,
+        epsilon=0.005,
+        seed: Optional[int] = None,
+        processes: Optional[int] = None,
+        ext_EMD: Any = None,
+        noise_scale=1.0,
+        noise_kind="normal",
+        range_thr=0.01,
+        total_power_thr=0.05,
+        max_imf=100,
+    ) -> None:
+        '''Initialize instance of `CEEMDANPool`.
+
+        Args:
+            trials (int, optional): number of trials (EMD of signal with added
+                noise). Defaults to 30.
+
+            epsilon (float, optional): Scale for added noise (\\epsilon) which
+                multiply std \\sigma: \\beta = \\epsilon \\cdot \\sigma.
+                Defaults to 0.005.
+
+            seed (int, optional): seed of `numpy.random.SeedSequence` from
+                which noise of each trial is generated. If None, then the noise
+                is not reproducible. Defaults to None.
+
+            processes (int, optional): number of worker processes.
+                If None, then the number of CPUs is used. Defaults to None.
+
+            ext_EMD (Any, optional): EMD object defined outside, which will
+                be used in each worker. If None, then EMD with default options
+                is used. Defaults to None.
+
+            noise_scale (float, optional): Scale (amplitude) of the added
+                noise. Defaults to 1.0.
+
+            noise_kind (str, optional): What type of noise to add. Allowed
+                are "normal" and "uniform". Defaults to "normal".
+
+            range_thr (float, optional): Range threshold used as an IMF check.
+                Defaults to 0.01.
+
+            total_power_thr (float, optional): Signal's power threshold.
+                Finishes decomposition if sum(abs(r)) < thr. Defaults to 0.05.
+
+            max_imf (int, optional): maximum number of IMFs. Defaults to 100.
+        '''
+        self.trials = trials
+        self.epsilon = epsilon
+        self.seed = seed
+        self.noise_scale = noise_scale
+        self.noise_kind = noise_kind
+        self.range_thr = range_thr
+        self.total_power_thr = total_power_thr
+        self.max_imf = max_imf
+
+        self._emd = EMD() if ext_EMD is None else ext_EMD
+
+        # Workers must share the resource tracker of this process, otherwise
+        # they report the shared segments as leaked at exit.
+        get_shared_memory()
+        ensure_resource_tracker()
+
+        self._pool = Pool(processes, _init_worker, (ext_EMD,))
+
+    def __enter__(self) -> 'CEEMDANPool':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        '''Stop worker processes.'''
+        self._pool.close()
+        self._pool.join()
+
+    def __call__(self, data: Signal) -> List[Signal]:
+        '''Calculate IMFs of signal.
+
+        Args:
+            data (Signal): signal to calculate IMFs.
+
+        Returns:
+            List[Signal]: List of Signals expected IMFs. The last one is
+                the residue.
+        '''
+        imfs = self.ceemdan(data.y)
+        return [Signal(data.x.copy(), k) for k in imfs]
+
+    def ceemdan(self, y: np.ndarray) -> np.ndarray:
+        '''Calculate IMFs of array.
+
+        Args:
+            y (np.ndarray): array of signal.
+
+        Returns:
+            np.ndarray: 2D array where each row is IMF. The last row is
+                the residue.
+        '''
+        scale = np.std(y)
+        s = np.asarray(y, dtype=float) / scale
+
+        seeds = np.random.SeedSequence(self.seed).spawn(self.trials)
+        # The number of IMFs of noise is about log2 of its size.
+        capacity = min(self.max_imf, int(np.log2(max(s.size, 2))) + 2)
+        noise = SharedArray((self.trials, capacity, s.size))
+        counts = SharedArray((self.trials,), np.int64)
+        residue = SharedArray((s.size,))
+        out = SharedArray((self.trials, s.size))
+        segments = [noise, counts, residue, out]
+
+        try:
+            results = self._pool.map(
+                _decompose_noise,
+                [(trial, seed, self.noise_kind, self.noise_scale, noise.info)
+                 for trial, seed in enumerate(seeds)])
+            for trial, (count, _) in enumerate(results):
+                counts.array[trial] = count
+
+            required = min(max(count for count, _ in results), self.max_imf)
+            if required > capacity:
+                noise = segments[0] = self._extend_noise(
+                    noise, required, results)
+            del results
+
+            residue.array[:] = s
+            self._run_trials(0, self.epsilon, segments)
+            all_imfs = [out.array.sum(axis=0) / self.trials]
+            previous_residue = s - all_imfs[0]
+
+            while len(all_imfs) < self.max_imf and \
+                    not self._is_end(s, all_imfs):
+                beta = self.epsilon * np.std(previous_residue)
+                residue.array[:] = previous_residue
+                self._run_trials(len(all_imfs), beta, segments)
+                local_mean = out.array.sum(axis=0) / self.trials
+                all_imfs.append(previous_residue - local_mean)
+                previous_residue = local_mean
+
+        finally:
+            for segment in segments:
+                segment.free()
+
+        all_imfs.append(s - np.sum(all_imfs, axis=0))
+        return np.vstack(all_imfs) * scale
+
+    def _extend_noise(
+        self,
+        noise: SharedArray,
+        capacity: int,
+        results: List[Tuple[int, Optional[np.ndarray]]],
+    ) -> SharedArray:
+        extended = SharedArray(
+            (noise.array.shape[0], capacity, noise.array.shape[2]))
+        old_capacity = noise.array.shape[1]
+        extended.array[:, :old_capacity] = noise.array
+        noise.free()
+        for trial, (_, imfs) in enumerate(results):
+            if imfs is not None:
+                imfs = imfs[:capacity - old_capacity]
+                extended.array[trial, old_capacity:][:imfs.shape[0]] = imfs
+        return extended
+
+    def _run_trials(self, imf_number: int, beta: float,
+                    segments: List[SharedArray]) -> None:
+        noise, counts, residue, out = segments
+        self._pool.map(
+            _trial,
+            [(trial, imf_number, beta, residue.info,
+              noise.info, counts.info, out.info)
+             for trial in range(self.trials)])
+
+    def _is_end(self, s: np.ndarray, all_imfs: List[np.ndarray]) -> bool:
+        residue = s - np.sum(all_imfs, axis=0)
+
+        if self._emd.emd(residue, None, max_imf=1).shape[0] == 1:
+            return True
+
+        if np.max(residue) - np.min(residue) < self.range_thr:
+            return True
+
+        return bool(np.sum(np.abs(residue)) < self.total_power_thr)
+
+
+def get_IMFs_ceemdan_pool(
+    data: Signal,
+    trials=30,
+    epsilon=0.005,
+    seed: Optional[int] = None,
+    processes: Optional[int] = None,
+    ext_EMD: Any = None,
+    noise_scale=1.0,
+    noise_kind="normal",
+    range_thr=0.01,
+    total_power_thr=0.05,
+    max_imf=100,
+) -> List[Signal]:
+    '''Reproducible complete ensemble empirical mode decomposition (CEEMDAN).
+
+    Create `CEEMDANPool`, calculate IMFs of the signal and close the pool.
+    To decompose many signals reuse one instance of `CEEMDANPool`.
+    For the same seed the result does not depend on the number of processes.
+
+    Args:
+        data (Signal): signal to calculate IMFs.
+        trials (int, optional): number of trials. Defaults to 30.
+        epsilon (float, optional): scale for added noise. Defaults to 0.005.
+        seed (int, optional): seed of the noise. Defaults to None.
+        processes (int, optional): number of worker processes.
+            Defaults to None.
+        ext_EMD (Any, optional): EMD object used in workers. Defaults to None.
+        noise_scale (float, optional): scale of the noise. Defaults to 1.0.
+        noise_kind (str, optional): "normal" or "uniform".
+            Defaults to "normal".
+        range_thr (float, optional): range threshold. Defaults to 0.01.
+        total_power_thr (float, optional): power threshold. Defaults to 0.05.
+        max_imf (int, optional): maximum number of IMFs. Defaults to 100.
+
+    Returns:
+        List[Signal]: List of Signals expected IMFs.
+    '''
+    with CEEMDANPool(trials, epsilon, seed, processes, ext_EMD, noise_scale,
+                     noise_kind, range_thr, total_power_thr,
+                     max_imf) as ceemdan:
+        return ceemdan(data)
@@ -1,5 +1,5 @@
 from math import sqrt
-from typing import Callable, Tuple
+from typing import Callable, List, Optional, Sequence, Tuple
 
 import numpy as np
 from scipy import integrate  # type: ignore
@@ -41,25 +41,72 @@ def dwell(f_start: float = None, f_end: float = None, fc: float = None) \
     def freq2time(
             spectrum: "Spectrum") -> Tuple[Time, Frequency, Envelope]:
 
-        f, a_f = spectrum.select_data(
-            f_start, f_end).get_amp_spectrum().get_data()
+        f, a_f = spectrum.get_amp_spectrum().get_data()
+        return _dwell_law(f, a_f**2, [f_start], [fc], [f_end])[0]
 
-        f_c = fc if fc else f[0]
-
-        freq = f[f <= f_c]
-
-        freq_ratio = np.divide(
-            freq[1:], freq[:-1], out=np.ones_like(freq[1:]), where=freq[:-1] != 0
-        )
-        dur = np.cumprod(1 / (freq_ratio**4))
-        energy = a_f[f <= f_c][:-1] ** 2
-        nT = np.append([0.0], dur * energy).cumsum()
-        nT2 = np.append(nT[-1], dur[-1] * (a_f[f > f_c] ** 2)).cumsum()
-        nT = np.append(nT, nT2[1:])
+    return freq2time
 
-        a_t = np.cumprod(np.append([1.0], freq_ratio**2))
-        a_t = np.append(a_t, [a_t[-1]] * (len(a_f) - len(a_t)))
 
-        return nT, f, a_t
+def dwell_batch(
+    spectrum: "Spectrum",
+    f_start: Sequence[Optional[float]],
+    f_central: Sequence[Optional[float]],
+    f_end: Sequence[Optional[float]],
+) -> List[Tuple[Time, Frequency, Envelope]]:
+    """Calculate dwell law for many parameters and one a priori spectrum.
 
-    return freq2time
+    The result of each combination (f_start[i], f_central[i], f_end[i]) is
+    equal to the result of `dwell(f_start[i], f_end[i], f_central[i])`.
+    The amplitude spectrum is calculated only once and all combinations are
+    calculated together in one pass of array operations.
+    """
+    f, a_f = spectrum.get_amp_spectrum().get_data()
+    return _dwell_law(f, a_f**2, f_start, f_central, f_end)
+
+
+def _dwell_law(
+    f: np.ndarray,
+    energy: np.ndarray,
+    f_start: Sequence[Optional[float]],
+    f_central: Sequence[Optional[float]],
+    f_end: Sequence[Optional[float]],
+) -> List[Tuple[Time, Frequency, Envelope]]:
+
+    # Duration of frequency f_k below the cutoff frequency is the product of
+    # (f_(j-1) / f_j)^4, which is equal to (f_ref / f_k)^4.
+    i_start = np.array([0 if k is None else np.searchsorted(f, k, "left")
+                        for k in f_start])
+    i_end = np.array([f.size - 1 if k is None else
+                      np.searchsorted(f, k, "right") - 1 for k in f_end])
+    f_c = [k if k else f[i] for k, i in zip(f_central, i_start)]
+    i_c = np.clip(np.searchsorted(f, f_c, "right") - 1, i_start, i_end)
+
+    i_ref = np.where((f[i_start] == 0) & (i_start < i_end),
+                     i_start + 1, i_start)
+    f_ref = f[i_ref][:, np.newaxis]
+
+    # Only frequencies selected by at least one combination are used.
+    low, high = i_start.min(), i_end.max() + 1
+    f, energy = f[low:high], energy[low:high]
+    i_start, i_end, i_c = i_start - low, i_end - low, i_c - low
+
+    index = np.arange(f.size)[np.newaxis, :]
+    start = i_start[:, np.newaxis]
+    end = i_end[:, np.newaxis]
+    central = i_c[:, np.newaxis]
+
+    f_clip = f[np.clip(index, start, central)]
+    dur = np.divide(f_ref, f_clip, out=np.ones(f_clip.shape),
+                    where=np.clip(index, start, central) > start) ** 4
+
+    next_dur = np.concatenate((dur[:, 1:], dur[:, -1:]), axis=1)
+    increment = np.where(
+        (index >= start) & (index <= end) & (index != central),
+        next_dur * energy, 0.0)
+    inclusive = increment.cumsum(axis=1)
+    n_t = np.where(index <= central, inclusive - increment, inclusive)
+
+    a_t = dur ** -0.5
+
+    return [(n_t[k, i0:i1 + 1], f[i0:i1 + 1], a_t[k, i0:i1 + 1])
+            for k, (i0, i1) in enumerate(zip(i_start, i_end))]
@@ -0,0 +1,204 @@
+'''Arrays placed in `multiprocessing.shared_memory` for pools of processes.
+
+The main process creates `SharedArray` and sends its `info` to workers.
+Workers get the array by `attach` without copying. Shared memory requires
+Python 3.8 or newer.
+'''
+import os
+import sys
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+SharedArrayInfo = Tuple[str, Tuple[int, ...], str]
+'''Description of array placed in shared memory: (name, shape, dtype).'''
+
+ALIGNMENT = 64
+'''Alignment (in bytes) of arrays placed in one segment.'''
+
+_worker_segments: Dict[str, Any] = {}
+_own_tracker: Dict[int, bool] = {}
+
+
+def get_shared_memory() -> Any:
+    '''Import `multiprocessing.shared_memory`.
+
+    Raises:
+        ImportError: raise exception if Python is older than 3.8.
+
+    Returns:
+        Any: module `multiprocessing.shared_memory`.
+    '''
+    if sys.version_info < (3, 8):
+        raise ImportError("Shared memory requires Python 3.8 or newer")
+    from multiprocessing import shared_memory
+    return shared_memory
+
+
+def ensure_resource_tracker() -> None:
+    '''Start the resource tracker of this process.
+
+    Call it before the pool of processes is created. Then workers share
+    the tracker and do not report the segments as leaked at exit.
+    '''
+    if os.name == "posix":
+        from multiprocessing import resource_tracker
+        resource_tracker.ensure_running()
+
+
+def align(size: int) -> int:
+    '''Round size up to `ALIGNMENT`.
+
+    Args:
+        size (int): size in bytes.
+
+    Returns:
+        int: aligned size.
+    '''
+    return -(-size // ALIGNMENT) * ALIGNMENT
+
+
+class SharedSegment:
+    '''Segment of shared memory created by the main process.
+
+    The segment is removed by `free`. If arrays of the segment are still
+    alive, the memory is released when they are deleted.
+    '''
+
+    def __init__(self, size: int) -> None:
+        '''Create segment.
+
+        Args:
+            size (int): size of segment in bytes.
+        '''
+        self._segment = get_shared_memory().SharedMemory(
+            create=True, size=max(size, 1))
+
+    @property
+    def name(self) -> str:
+        return self._segment.name
+
+    @property
+    def buf(self) -> memoryview:
+        return self._segment.buf
+
+    def free(self) -> None:
+        '''Close and remove segment.'''
+        try:
+            self._segment.unlink()
+        except FileNotFoundError:
+            pass
+        try:
+            self._segment.close()
+        except BufferError:
+            pass
+
+
+class SharedArray:
+    '''Array placed in its own segment of shared memory.'''
+
+    def __init__(self, shape: Tuple[int, ...], dtype: Any = float) -> None:
+        '''Create array (filled with zeros).
+
+        Args:
+            shape (Tuple[int, ...]): shape of array.
+            dtype (Any, optional): data type of array. Defaults to float.
+        '''
+        dtype = np.dtype(dtype)
+        self._segment = SharedSegment(int(np.prod(shape)) * dtype.itemsize)
+        self.array: np.ndarray = np.ndarray(
+            shape, dtype=dtype, buffer=self._segment.buf)
+        self.info: SharedArrayInfo = (self._segment.name, shape, dtype.str)
+
+    def free(self) -> None:
+        '''Remove array from shared memory.'''
+        del self.array
+        self._segment.free()
+
+
+def open_segment(name: str) -> Any:
+    '''Open segment of shared memory created by another process.
+
+    The segment is removed by the process which created it. The opened
+    segment is not tracked (option `track` of Python 3.13 and newer). Older
+    versions always register the segment: if the process shares the resource
+    tracker of the main process, it is harmless, otherwise the registration
+    is cancelled, so the own tracker of the process does not remove
+    the segment at exit.
+
+    Args:
+        name (str): name of segment.
+
+    Returns:
+        Any: instance of `multiprocessing.shared_memory.SharedMemory`.
+    '''
+    shared_memory = get_shared_memory()
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        pass
+
+    if os.name != "posix":
+        return shared_memory.SharedMemory(name=name)
+
+    from multiprocessing import resource_tracker
+
+    # Whether the tracker is shared is known only before the first segment
+    # is opened, since opening starts the own tracker.
+    pid = os.getpid()
+    if pid not in _own_tracker:
+        tracker = resource_tracker._resource_tracker  # type: ignore
+        _own_tracker[pid] = getattr(tracker, "_fd", None) is None
+    segment = shared_memory.SharedMemory(name=name)
+    if _own_tracker[pid]:
+        resource_tracker.unregister(segment._name, "shared_memory")
+    return segment
+
+
+def attach_segments(*names: str) -> List[Any]:
+    '''Get segments in worker process.
+
+    The segments are kept open between calls. Segments not in `names` are
+    closed, if no arrays of them are alive.
+
+    Args:
+        names (str): names of segments.
+
+    Returns:
+        List[Any]: instances of `multiprocessing.shared_memory.SharedMemory`.
+    '''
+    for name in list(_worker_segments):
+        if name not in names:
+            try:
+                _worker_segments[name].close()
+            except BufferError:
+                continue
+            del _worker_segments[name]
+
+    for name in names:
+        if name not in _worker_segments:
+            _worker_segments[name] = open_segment(name)
+    return [_worker_segments[name] for name in names]
+
+
+def attach(*infos: SharedArrayInfo) -> List[np.ndarray]:
+    '''Get arrays in worker process without copying.
+
+    Args:
+        infos (SharedArrayInfo): descriptions of arrays (`SharedArray.info`).
+
+    Returns:
+        List[np.ndarray]: arrays.
+    '''
+    segments = attach_segments(*(name for name, _, _ in infos))
+    return [np.ndarray(shape, dtype=dtype, buffer=segment.buf)
+            for segment, (_, shape, dtype) in zip(segments, infos)]
+
+
+def detach() -> None:
+    '''Close segments opened in the current process.
+
+    Arrays of the segments must be deleted before.
+    '''
+    while _worker_segments:
+        _worker_segments.popitem()[1].close()
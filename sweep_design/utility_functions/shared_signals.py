@@ -0,0 +1,163 @@
+from typing import Any, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from ..axis import ArrayAxis
+from ..exc import BadInputError
+from ..signal import Signal
+from . import shared_arrays
+
+
+class SharedSignalInfo(NamedTuple):
+    '''Description of signal placed in shared memory.
+
+    The description is small, so it is sent to workers instead of the signal.
+    '''
+    name: str
+    offset: int
+    size: int
+    dtype: str
+    start: float
+    end: float
+    sample: float
+
+
+class SharedSignals:
+    '''Signals placed in one segment of `multiprocessing.shared_memory`.
+
+    The data of signals is copied into the segment once. Workers get
+    the descriptions `infos` and restore the signals by `attach_signals`
+    without copying, so the data is not pickled for each task. The signals
+    placed in the segment can be changed by workers (for example, the segment
+    can be used as output of calculation).
+
+    The segment is removed by `close` or on exit of the context manager.
+    Create the instance before the pool of processes, so that workers use
+    the resource tracker of the main process.
+
+    Example:
+        with SharedSignals(records) as shared, Pool(4) as pool:
+            peaks = pool.map(get_peak, shared.infos)
+
+        def get_peak(info):
+            record, = attach_signals(info)
+            return Signal.correlate(record, sweep).get_peak()
+    '''
+
+    def __init__(self, signals: Sequence[Signal]) -> None:
+        '''Copy signals into new segment of shared memory.
+
+        Args:
+            signals (Sequence[Signal]): signals to share.
+
+        Raises:
+            BadInputError: raise exception if there are no signals.
+        '''
+        if not signals:
+            raise BadInputError("There are no signals to share")
+
+        shared_arrays.ensure_resource_tracker()
+
+        offsets: List[int] = []
+        size = 0
+        for signal in signals:
+            offsets.append(size)
+            size += shared_arrays.align(signal.y.nbytes)
+
+        self._segment: Optional[shared_arrays.SharedSegment] = \
+            shared_arrays.SharedSegment(size)
+        self.infos: List[SharedSignalInfo] = []
+        for signal, offset in zip(signals, offsets):
+            info = SharedSignalInfo(
+                self._segment.name, offset, signal.size, signal.y.dtype.str,
+                signal.start, signal.end, signal.sample)
+            _get_view(self._segment, info)[:] = signal.y
+            self.infos.append(info)
+
+    @classmethod
+    def empty(
+        cls, time: ArrayAxis, count: int, dtype: Any = float
+    ) -> 'SharedSignals':
+        '''Create segment for signals calculated by workers.
+
+        Args:
+            time (ArrayAxis): time axis of signals.
+            count (int): number of signals.
+            dtype (Any, optional): data type of signals. Defaults to float.
+
+        Returns:
+            SharedSignals: instance with zero signals.
+        '''
+        zero = Signal(time, np.zeros(time.size, dtype=dtype))
+        return cls([zero] * count)
+
+    @property
+    def signals(self) -> List[Signal]:
+        '''Signals in the segment (without copying).
+
+        The signals must not be used after `close`.
+
+        Raises:
+            BadInputError: raise exception if the segment is closed.
+
+        Returns:
+            List[Signal]: signals.
+        '''
+        if self._segment is None:
+            raise BadInputError("Shared signals are closed")
+        return [_get_signal(self._segment, info) for info in self.infos]
+
+    def __enter__(self) -> 'SharedSignals':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        '''Remove the segment of shared memory.
+
+        The name of segment is removed at once. The memory is released when
+        the last signal created by `signals` is deleted.
+        '''
+        if self._segment is None:
+            return
+        segment, self._segment = self._segment, None
+        segment.free()
+
+
+def attach_signals(*infos: SharedSignalInfo) -> List[Signal]:
+    '''Restore signals placed in shared memory (in worker process).
+
+    The signals use the memory of the segment and are not copied (if their
+    data type matches `Config.precision`). The segments are kept open
+    between calls (see `shared_arrays.attach_segments`). Segments not used by `infos`
+    are closed, if signals of them are deleted.
+
+    Args:
+        infos (SharedSignalInfo): descriptions of signals from
+            `SharedSignals.infos`.
+
+    Returns:
+        List[Signal]: signals.
+    '''
+    names = list(dict.fromkeys(info.name for info in infos))
+    segments = dict(zip(names, shared_arrays.attach_segments(*names)))
+    return [_get_signal(segments[info.name], info) for info in infos]
+
+
+def detach_signals() -> None:
+    '''Close segments of shared memory opened in the current process.
+
+    Signals of the segments must be deleted before.
+    '''
+    shared_arrays.detach()
+
+
+def _get_view(segment: Any, info: SharedSignalInfo) -> np.ndarray:
+    return np.ndarray((info.size,), dtype=info.dtype, buffer=segment.buf,
+                      offset=info.offset)
+
+
+def _get_signal(segment: Any, info: SharedSignalInfo) -> Signal:
+    return Signal(ArrayAxis(info.start, info.end, info.sample),
+                  _get_view(segment, info), copy=False)
@@ -1,11 +1,11 @@
-from typing import Callable, Optional, TypeVar, Union
+from typing import Callable, Optional, Tuple
 
 import numpy as np
 
 from ..relation import Relation
 from ..signal import Signal
 from .emd_analyze import get_IMFs_emd
-from .a_t import tukey_a_t
+from .a_t import window_a_t
 
 
 def soft_clip(
@@ -36,6 +36,11 @@ def soft_clip(
     return np.apply_along_axis(select_choice, 1, data)
 
 
+def linear_coefficient(x: float) -> float:
+    """Default coefficient function of correction. Return the input."""
+    return x
+
+
 def get_correction_for_source(
     signal: Signal,
     reaction_mass: float = 1.0,
@@ -43,7 +48,8 @@ def get_correction_for_source(
     limits_percent=0.85,
     limit_iteration: Optional[int] = 10,
     window_percent=0.01,
-    coefficient_function: Callable[[float], float] = lambda x: x,
+    coefficient_function: Callable[[float], float] = linear_coefficient,
+    low_frequency: Optional[float] = None,
 ) -> Signal:
     '''Sweep signal correction for realization on the vibration source.
 
@@ -72,30 +78,79 @@ def get_correction_for_source(
             to ensure a zero first amplitude. Defaults to 0.01.
 
         coefficient_function (_type_, optional): function to suppress..
-            Defaults to lambda x:x.
+            Defaults to `linear_coefficient` (f(x) = x).
+
+        low_frequency (Optional[float], optional): If None, then displacement
+            and force are calculated by cumulative integration and
+            differentiation (the time axis is shortened by two samples).
+            Otherwise they are calculated in the frequency domain
+            (`Signal.spectral_integrate`, `Signal.spectral_diff`) with
+            suppression of frequencies below `low_frequency`, and the time
+            axis of the result is equal to the time axis of the signal.
+            Defaults to None.
 
     Returns:
         Signal: correct force signal.
     '''
+    return correct_for_source(
+        signal,
+        reaction_mass,
+        limits,
+        limits_percent,
+        limit_iteration,
+        window_percent,
+        coefficient_function,
+        low_frequency
+    )[0]
+
+
+def correct_for_source(
+    signal: Signal,
+    reaction_mass: float = 1.0,
+    limits: float = None,
+    limits_percent=0.85,
+    limit_iteration: Optional[int] = 10,
+    window_percent=0.01,
+    coefficient_function: Callable[[float], float] = linear_coefficient,
+    low_frequency: Optional[float] = None,
+) -> Tuple[Signal, int]:
+    '''Sweep signal correction for realization on the vibration source.
+
+    The same as `get_correction_for_source`, but also return the number of
+    performed iterations of correction.
+
+    Returns:
+        Tuple[Signal, int]: correct force signal and number of iterations.
+    '''
+
+    is_spectral = low_frequency is not None
+
+    def get_displacement(force: Signal) -> Signal:
+        if is_spectral:
+            return force.spectral_integrate(
+                2, low_frequency) / reaction_mass  # type: ignore
+        return force.integrate().integrate() / reaction_mass
 
     new_time = signal.x.copy()
-    new_time.start = new_time.start + 2 * new_time.sample
+    if not is_spectral:
+        new_time.start = new_time.start + 2 * new_time.sample
 
     window = Relation(
         new_time,
-        tukey_a_t(
+        window_a_t(
             new_time.array,
             new_time.end *
             window_percent,
             "left"))
 
-    displacement = signal.integrate().integrate() / reaction_mass
+    displacement = get_displacement(signal)
 
     new_displacement = None
     imfs = get_IMFs_emd(displacement)
     imfs[0] = imfs[0] * window
 
-    d_array = np.vstack((imfs[0].y, signal.y[1:-1]))
+    d_array = np.vstack(
+        (imfs[0].y, signal.y if is_spectral else signal.y[1:-1]))
     d_array = np.transpose(d_array)
 
     cnt: int = 0
@@ -111,7 +166,7 @@ def get_correction_for_source(
                 coefficient_function(cnt))
 
         force = type(signal)(new_time, result[:, 1])
-        new_displacement = force.integrate().integrate() / reaction_mass
+        new_displacement = get_displacement(force)
         imfs = get_IMFs_emd(new_displacement)
 
         new_displacement = imfs[0] * window
@@ -124,4 +179,7 @@ def get_correction_for_source(
 
     new_displacement = new_displacement or imfs[0]
 
-    return new_displacement.diff().diff() * reaction_mass
+    if is_spectral:
+        return new_displacement.spectral_diff(2) * reaction_mass, cnt
+
+    return new_displacement.diff().diff() * reaction_mass, cnt
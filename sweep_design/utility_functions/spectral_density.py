@@ -0,0 +1,163 @@
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..axis import ArrayAxis
+from ..config.base_config import Config
+from ..exc import BadInputError, NotEqualError
+from ..relation import Relation
+from ..signal import Signal
+from ..spectrum import Spectrum
+
+
+def _stack(signals: Sequence[Signal]) -> Tuple[np.ndarray, float]:
+    if not signals:
+        raise BadInputError("No signals to calculate spectral density")
+
+    first = signals[0]
+    for signal in signals[1:]:
+        if signal.size != first.size:
+            raise NotEqualError(first.size, signal.size)
+        if not np.isclose(signal.sample, first.sample):
+            raise BadInputError(
+                f"Samples of signals are different: {first.sample} and "
+                f"{signal.sample}.")
+
+    return np.stack([signal.y for signal in signals]), first.sample
+
+
+def _get_power_densities(
+    signals: Sequence[Signal],
+    nperseg: int,
+    hop: Optional[int],
+    window: Any,
+    nfft: Optional[int],
+) -> Tuple[ArrayAxis, np.ndarray]:
+    x, sample = _stack(signals)
+    return Config.power_spectral_density_method(
+        x, sample, nperseg, hop, window, nfft)
+
+
+def get_power_spectral_densities(
+    signals: Sequence[Signal],
+    nperseg: int = 256,
+    hop: Optional[int] = None,
+    window: Any = "hann",
+    nfft: Optional[int] = None,
+) -> List[Relation]:
+    '''Get power spectral densities of signals averaged by Welch's method.
+
+    Signals are calculated together in one call of
+    `Config.power_spectral_density_method`. Each result has its own copy of
+    the frequency axis.
+
+    Args:
+        signals (Sequence[Signal]): signals with the same sample and size.
+
+        nperseg (int, optional): length of each segment. Defaults to 256.
+
+        hop (int, optional): number of samples between the starts of
+            neighbouring segments. If None, then `nperseg // 2`.
+            Defaults to None.
+
+        window (Any, optional): window, any value accepted by
+            `scipy.signal.get_window`. Defaults to "hann".
+
+        nfft (int, optional): length of FFT. If None, then equal to
+            `nperseg`. Defaults to None.
+
+    Raises:
+        NotEqualError: raise exception if sizes of signals are different.
+        BadInputError: raise exception if samples of signals are different,
+            there are no signals or hop is not from 1 to nperseg.
+
+    Returns:
+        List[Relation]: power spectral density of each signal.
+    '''
+    frequency, densities = _get_power_densities(
+        signals, nperseg, hop, window, nfft)
+    return [Relation(frequency.copy(), density) for density in densities]
+
+
+def get_cross_spectral_densities(
+    signals: Sequence[Signal],
+    reference: Signal,
+    nperseg: int = 256,
+    hop: Optional[int] = None,
+    window: Any = "hann",
+    nfft: Optional[int] = None,
+) -> List[Spectrum]:
+    '''Get cross spectral densities of signals and reference signal.
+
+    The cross spectral density of each signal with the reference
+    (`Signal.get_cross_spectral_density`) is averaged by Welch's method.
+    Signals are calculated together in one call of
+    `Config.cross_spectral_density_method`.
+
+    Args:
+        signals (Sequence[Signal]): signals with the same sample and size.
+
+        reference (Signal): reference signal with the same sample and size.
+
+        nperseg (int, optional): length of each segment. Defaults to 256.
+
+        hop (int, optional): number of samples between the starts of
+            neighbouring segments. If None, then `nperseg // 2`.
+            Defaults to None.
+
+        window (Any, optional): window, any value accepted by
+            `scipy.signal.get_window`. Defaults to "hann".
+
+        nfft (int, optional): length of FFT. If None, then equal to
+            `nperseg`. Defaults to None.
+
+    Raises:
+        NotEqualError: raise exception if sizes of signals are different.
+        BadInputError: raise exception if samples of signals are different,
+            there are no signals or hop is not from 1 to nperseg.
+
+    Returns:
+        List[Spectrum]: cross spectral density of each signal.
+    '''
+    x, sample = _stack(signals)
+    y, _ = _stack([signals[0], reference])
+    frequency, densities = Config.cross_spectral_density_method(
+        x, y[1], sample, nperseg, hop, window, nfft)
+    return [Spectrum(frequency.copy(), density) for density in densities]
+
+
+def get_mean_power_spectral_density(
+    signals: Sequence[Signal],
+    nperseg: int = 256,
+    hop: Optional[int] = None,
+    window: Any = "hann",
+    nfft: Optional[int] = None,
+) -> Relation:
+    '''Get power spectral density averaged over signals and segments.
+
+    Args:
+        signals (Sequence[Signal]): signals with the same sample and size.
+
+        nperseg (int, optional): length of each segment. Defaults to 256.
+
+        hop (int, optional): number of samples between the starts of
+            neighbouring segments. If None, then `nperseg // 2`.
+            Defaults to None.
+
+        window (Any, optional): window, any value accepted by
+            `scipy.signal.get_window`. Defaults to "hann".
+
+        nfft (int, optional): length of FFT. If None, then equal to
+            `nperseg`. Defaults to None.
+
+    Raises:
+        NotEqualError: raise exception if sizes of signals are different.
+        BadInputError: raise exception if samples of signals are different,
+            there are no signals or hop is not from 1 to nperseg.
+
+    Returns:
+        Relation: mean power spectral density.
+    '''
+    frequency, densities = _get_power_densities(
+        signals, nperseg, hop, window, nfft)
+    return Relation(frequency, densities.mean(axis=0))
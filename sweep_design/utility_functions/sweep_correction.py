@@ -1,9 +1,12 @@
+from typing import Optional
+
 from ..signal import Signal
 from .emd_analyze import get_IMFs_emd
-from .a_t import tukey_a_t
+from .a_t import window_a_t
 
 
-def correct_sweep(signal: Signal, start_window: float = None) -> Signal:
+def correct_sweep(signal: Signal, start_window: float = None,
+                  low_frequency: Optional[float] = None) -> Signal:
     '''Apply correction to sweep signal.
 
     Using the EMD to subtract the last IMF from the displacement and
@@ -18,20 +21,34 @@ def correct_sweep(signal: Signal, start_window: float = None) -> Signal:
             reduce the deviation from zero. If None, then window is not applied.
             Defaults to None.
 
+        low_frequency (float, optional): If None, then displacement is
+            calculated by cumulative integration. Otherwise, integration and
+            differentiation are performed in the frequency domain
+            (`Signal.spectral_integrate`, `Signal.spectral_diff`) with
+            suppression of frequencies below `low_frequency`, and the time
+            axis of the result is equal to the time axis of the signal.
+            Defaults to None.
+
     Returns:
         Relation: corrected sweep signal.
     '''
 
-    displacement = signal.integrate().integrate()
+    if low_frequency is None:
+        displacement = signal.integrate().integrate()
+    else:
+        displacement = signal.spectral_integrate(2, low_frequency)
     x = displacement.x.array
 
     IMFs = get_IMFs_emd(displacement)
     if start_window is not None:
-        window = tukey_a_t(x, start_window, "left")
+        window = window_a_t(x, start_window, "left")
         new_displacement = IMFs[0] * Signal(x, window)
     else:
         new_displacement = IMFs[0]
 
-    signal = new_displacement.diff().diff()
+    if low_frequency is None:
+        signal = new_displacement.diff().diff()
+    else:
+        signal = new_displacement.spectral_diff(2)
 
     return signal
@@ -0,0 +1,85 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from sweep_design import persistence
+from sweep_design.axis import ArrayAxis
+from sweep_design.exc import BadInputError
+from sweep_design.relation import Relation
+from sweep_design.signal import Signal
+from sweep_design.sweep import Sweep
+
+
+class TestPersistence(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, "data.swd")
+        time = ArrayAxis(0., 4.999, 0.001)
+        self.sweep = Sweep(
+            time, np.sin(2 * np.pi * (5 + 2 * time.array) * time.array),
+            a_prior_signal=Signal(ArrayAxis(0., 1., 0.5), [1., 2., 3.]))
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_save_load_sweep(self):
+        persistence.save(self.filename, self.sweep)
+
+        header = persistence.read_header(self.filename)
+        self.assertEqual(header["version"], persistence.FORMAT_VERSION)
+        self.assertEqual(header["type"], "Sweep")
+        self.assertEqual(header["x"]["size"], self.sweep.size)
+        for section in header["sections"].values():
+            self.assertEqual(section["offset"] % 64, 0)
+
+        sweep = persistence.load(self.filename)
+        self.assertIsInstance(sweep, Sweep)
+        self.assertTrue(sweep.is_memmap)
+        self.assertEqual(sweep.end, self.sweep.end)
+        self.assertEqual(sweep.sample, self.sweep.sample)
+        assert_array_equal(sweep.y, self.sweep.y)
+        assert_array_equal(sweep.frequency_time.y, self.sweep.frequency_time.y)
+        assert_array_equal(sweep.amplitude_time.y, self.sweep.amplitude_time.y)
+        assert_array_equal(sweep.spectrogram.spectrogram,
+                           self.sweep.spectrogram.spectrogram)
+        self.assertEqual(sweep.spectrogram.time.start,
+                         self.sweep.spectrogram.time.start)
+        assert_array_equal(sweep.a_prior_signal.y, [1., 2., 3.])
+
+        spectrogram = persistence.load_section(self.filename, "spectrogram",
+                                               mmap_mode=None)
+        self.assertNotIsInstance(spectrogram, np.memmap)
+        assert_array_equal(spectrogram, self.sweep.spectrogram.spectrogram)
+        del sweep
+
+    def test_save_load_relation(self):
+        spectrum = self.sweep.get_spectrum()
+        persistence.save(self.filename, spectrum)
+        loaded = persistence.load(self.filename, mmap_mode=None)
+        self.assertIs(type(loaded), type(spectrum))
+        self.assertFalse(loaded.is_memmap)
+        assert_array_equal(loaded.y, spectrum.y)
+
+        persistence.save(self.filename, self.sweep, artifacts=None)
+        self.assertEqual(
+            list(persistence.read_header(self.filename)["sections"]), ["y"])
+
+        persistence.save(self.filename, Relation([0, 1, 2], [1, 2, 3]))
+        self.assertIs(type(persistence.load(self.filename)), Relation)
+
+        with self.assertRaises(BadInputError):
+            persistence.save(self.filename, self.sweep, artifacts=["unknown"])
+        with self.assertRaises(BadInputError):
+            persistence.load(self.filename, artifacts=["unknown"])
+
+        with self.assertRaises(BadInputError):
+            persistence.load_section(self.filename, "spectrogram")
+
+        with open(self.filename, "wb") as file:
+            np.save(file, [1, 2, 3])
+        with self.assertRaises(BadInputError):
+            persistence.load(self.filename)
@@ -1,16 +1,25 @@
 import unittest
 
+import numpy as np
+from numpy.testing import assert_array_equal
+
 from sweep_design.axis import ArrayAxis
+from scipy.signal import max_len_seq
+
 from sweep_design.prepared_sweeps.code_m_sequence import (
-    get_m_sequence_code, get_relation_m_sequence)
+    get_gold_codes, get_kasami_codes, get_m_sequence_code,
+    get_m_sequence_from_state, get_m_sequence_phases,
+    get_relation_m_sequence)
 from sweep_design.prepared_sweeps.code_zinger import (get_code_zinger,
+                                                      get_code_zinger_array,
                                                       get_code_zinger_relation)
 from sweep_design.prepared_sweeps.dwell_sweep import get_dwell_sweep
 from sweep_design.prepared_sweeps.linear_sweep import get_linear_sweep
 from sweep_design.prepared_sweeps.pseudorandom_shuffle import get_shuffle
 from sweep_design.prepared_sweeps.sweep_from_code import (
-    get_code_sweep_segments, get_convolution_sweep_and_code)
+    convolve_code, get_code_sweep_segments, get_convolution_sweep_and_code)
 from sweep_design.relation import Relation
+from sweep_design.signal import Signal
 from sweep_design.sweep import Sweep
 
 
@@ -37,6 +46,12 @@ class TestPreparedSweep(unittest.TestCase):
         shuffle_sweep = get_shuffle(time, 5, 100, 0.5, time_tapper=2)
         self.assertIsInstance(shuffle_sweep, Sweep)
 
+        first_sweep = get_shuffle(
+            time, 5, 100, 0.5, generator=np.random.default_rng(7))
+        second_sweep = get_shuffle(
+            time, 5, 100, 0.5, generator=np.random.default_rng(7))
+        assert_array_equal(first_sweep.y, second_sweep.y)
+
     def test_m_sequence_code_sweep(self):
         m_sequence = get_m_sequence_code(5)
         m_sequence_full = get_m_sequence_code(5, is_full=True)
@@ -65,6 +80,111 @@ class TestPreparedSweep(unittest.TestCase):
             m_sequence, linear_sweep)
         self.assertIsInstance(corr_sweep_relation, Sweep)
 
+    def test_code_sweep_segments_layout(self):
+        time = ArrayAxis(0, 1, 0.01)
+        base_sweep = Relation(get_linear_sweep(time, 5, 20, None))
+
+        result = get_code_sweep_segments([1, -1, 0, 1], base_sweep)
+
+        self.assertEqual(result.start, 0)
+        self.assertAlmostEqual(result.end, 4 * base_sweep.end + 0.01)
+        self.assertEqual(result.size, 4 * base_sweep.size - 2)
+
+        size = base_sweep.size
+        expected = np.zeros(result.size)
+        for offset, v in [(0, 1), (size, -1), (3 * size - 2, 1)]:
+            expected[offset:offset + size] += v * base_sweep.y
+        assert_array_equal(result.y, expected)
+
+    def test_convolve_code(self):
+        base = np.random.default_rng(0).normal(size=200)
+
+        sparse_code = np.zeros(300)
+        sparse_code[[0, 50, 120, 299]] = [1, -1, 1, -1]
+        dense_code = np.random.default_rng(1).choice([-1, 0, 1], 300)
+
+        for code in [sparse_code, dense_code, [1, -1, 0, 1]]:
+            with self.subTest("Test of convolution with code", code=code):
+                np.testing.assert_array_almost_equal(
+                    convolve_code(code, base), np.convolve(code, base))
+
+    def test_convolution_sweep_and_code_layout(self):
+        for end, code in [(1, [1, -1, 0, 1, 1]), (2, [1, -1, 0, 1, 1]),
+                          (1, np.random.default_rng(2).choice([-1, 0, 1], 150))]:
+            with self.subTest(end=end, size=len(code)):
+                base_sweep = get_linear_sweep(ArrayAxis(0, end, 0.01), 5, 20, None)
+                code_relation = Relation(
+                    ArrayAxis(0, (len(code) - 1) * 0.01, 0.01), code)
+
+                # The implementation of version 0.3.1.
+                expected = Sweep.convolve(code_relation, base_sweep)[
+                    None:code_relation.size * base_sweep.sample].shift(
+                        base_sweep.end)
+
+                for result in (
+                        get_convolution_sweep_and_code(code, base_sweep),
+                        get_convolution_sweep_and_code(code_relation, base_sweep)):
+                    self.assertEqual(result.size, expected.size)
+                    self.assertAlmostEqual(result.start, expected.start)
+                    self.assertAlmostEqual(result.end, expected.end)
+                    np.testing.assert_array_almost_equal(result.y, expected.y)
+
+    def test_full_convolution_sweep_and_code(self):
+        time = ArrayAxis(0, 1, 0.01)
+        base_sweep = get_linear_sweep(time, 5, 20, None)
+        code = [1, -1, 0, 1, 1]
+
+        result = get_convolution_sweep_and_code(code, base_sweep, is_full=True)
+
+        self.assertEqual(result.start, 0)
+        self.assertEqual(result.size, base_sweep.size + len(code) - 1)
+        np.testing.assert_array_almost_equal(
+            result.y, np.convolve(code, base_sweep.y))
+
+        code_relation = Relation(ArrayAxis(0.5, 0.54, 0.01), code)
+        result = get_convolution_sweep_and_code(
+            code_relation, base_sweep, is_full=True)
+
+        self.assertEqual(result.start, 0.5)
+        np.testing.assert_array_almost_equal(
+            result.y, np.convolve(code, base_sweep.y))
+
+        code_relation = Relation(ArrayAxis(0., 0.12, 0.03), code)
+        result = get_convolution_sweep_and_code(
+            code_relation, base_sweep, is_full=True)
+
+        held_code = np.repeat(code, 3)[:13]
+        np.testing.assert_array_almost_equal(
+            result.y, np.convolve(held_code, base_sweep.y))
+
+    def test_m_sequence_library(self):
+        state = np.array([1, 0, 1, 1, 0, 0, 1])
+        assert_array_equal(get_m_sequence_from_state(state),
+                           max_len_seq(7, state=state)[0])
+
+        relation = get_relation_m_sequence(
+            ArrayAxis(0, 1.26, 0.01), state, is_full=True)
+        assert_array_equal(relation.y, max_len_seq(7, state=state)[0])
+
+        phases = get_m_sequence_phases(5, [0, 3])
+        assert_array_equal(phases[1], np.roll(phases[0], -3))
+
+        first = get_m_sequence_code(100, generator=np.random.default_rng(3))
+        second = get_m_sequence_code(100, generator=np.random.default_rng(3))
+        assert_array_equal(first, second)
+
+        gold_codes = get_gold_codes(5)
+        self.assertEqual(gold_codes.shape, (33, 31))
+        assert_array_equal(get_gold_codes(5, [4]), gold_codes[6:7])
+
+        bipolar = 2.0 * gold_codes[[0, 1, 10]] - 1
+        for u, v in [(0, 1), (0, 2), (1, 2)]:
+            correlation = np.real(np.fft.ifft(
+                np.fft.fft(bipolar[u]) * np.conj(np.fft.fft(bipolar[v]))))
+            self.assertTrue(set(np.round(correlation)) <= {-9, -1, 7})
+
+        self.assertEqual(get_kasami_codes(6).shape, (8, 63))
+
     def test_code_zinger(self):
 
         code_zinger = get_code_zinger([-1, -1, -1, 1])
@@ -76,6 +196,20 @@ class TestPreparedSweep(unittest.TestCase):
                     zinger_code_time, [-1, -1, -1, 1]
                 ), periods=2)
 
+        self.assertEqual(code_zinger_relation.start, 0)
+        self.assertAlmostEqual(code_zinger_relation.end, 0.07)
+        assert_array_equal(code_zinger_relation.y, [-1, -1, -1, 1] * 2)
+
+        code_zinger_signal = get_code_zinger_relation(
+            Signal(zinger_code_time, [-1, -1, -1, 1]), periods=3)
+        self.assertIsInstance(code_zinger_signal, Signal)
+        assert_array_equal(code_zinger_signal.y, [-1, -1, -1, 1] * 3)
+
+        phases = get_code_zinger_array([-1, -1, -1, 1], 2, [0, 1, 3])
+        assert_array_equal(phases, [[-1, -1, -1, 1, -1, -1, -1, 1],
+                                    [-1, -1, 1, -1, -1, -1, 1, -1],
+                                    [1, -1, -1, -1, 1, -1, -1, -1]])
+
         time = ArrayAxis(0, 10, 0.01)
         linear_sweep = get_linear_sweep(time, 5, 95, 1)
 
@@ -1,4 +1,8 @@
 from typing import Union
+import copy
+import os
+import pickle
+import tempfile
 import unittest
 
 import numpy as np
@@ -6,6 +10,8 @@ from numpy.testing import assert_array_equal, assert_array_almost_equal
 
 from sweep_design.relation import Relation
 from sweep_design.axis import ArrayAxis
+from sweep_design.config.base_config import Config
+from sweep_design.core import MathOperation
 from sweep_design.help_types import Number
 from sweep_design.exc import NotEqualError, BadInputError, TypeFuncError
 
@@ -101,6 +107,151 @@ class WrapperTestRelation:
         def test_get_norm(self):
             sample_rate = self.relation.get_norm()
             self.assertIsInstance(sample_rate, float)
+            x, y = self.relation.get_data()
+            self.assertAlmostEqual(sample_rate,
+                                   np.trapz(y**2, x) / self.relation.sample)
+
+        def test_reductions(self):
+            x, y = self.relation.get_data()
+            duration = x[-1] - x[0]
+            energy = np.trapz(y**2, x)
+
+            self.assertAlmostEqual(self.relation.get_energy(), energy)
+            self.assertAlmostEqual(self.relation.get_l2_norm(), np.sqrt(energy))
+            self.assertAlmostEqual(self.relation.get_rms(),
+                                   np.sqrt(energy / duration))
+            self.assertAlmostEqual(self.relation.get_mean(),
+                                   np.trapz(y, x) / duration)
+            self.assertEqual(self.relation.get_peak(), 123.)
+
+            self.relation.y.setflags(write=False)
+            energy = self.relation.get_energy()
+            self.assertIn(("energy", 0, 0.5, 0.1), self.relation._reductions)
+            self.assertEqual(self.relation.get_energy(), energy)
+
+            self.relation.end = 1.0
+            self.relation.sample = 0.2
+            self.assertAlmostEqual(self.relation.get_energy(), 2 * energy)
+
+        def test_precision(self):
+            self.assertEqual(self.relation.precision, "double")
+            single = self.relation.astype("single")
+            self.assertIsInstance(single, self.relation_class)
+            self.assertEqual(single.precision, "single")
+            self.assertEqual(single.y.dtype, np.float32)
+            assert_array_almost_equal(single.y, self.relation.y, decimal=5)
+            self.assertFalse(np.shares_memory(
+                self.relation.astype("double").y, self.relation.y))
+
+            self.assertEqual((single * 2.5 + 1).y.dtype, np.float32)
+            self.assertEqual((single + single).y.dtype, np.float32)
+            self.assertEqual((single + self.relation).precision, "double")
+            self.assertEqual(
+                single.interpolate_extrapolate(ArrayAxis(0., 0.5, 0.05)).precision,
+                "single")
+            self.assertEqual(single.integrate().precision, "single")
+            self.assertEqual(single.diff().precision, "single")
+
+            try:
+                Config.precision = "single"
+                relation = self.relation_class([0., 1., 2.], [1, 2, 3])
+                self.assertEqual(relation.y.dtype, np.float32)
+                self.assertEqual((self.simple_relation * 2).y.dtype,
+                                 np.float32)
+                self.assertEqual(Relation([0., 1.], [1j, 2.]).y.dtype,
+                                 np.complex64)
+                double = self.relation.astype("double")
+                self.assertEqual(double.y.dtype, np.float64)
+                self.assertEqual((double * 2).y.dtype, np.float32)
+                relation = self.relation_class(
+                    self.x_axis, self.relation.y, precision="double")
+                self.assertEqual(relation.y.dtype, np.float64)
+            finally:
+                Config.precision = None
+
+        def test_no_copy(self):
+            y = np.arange(6, dtype=float)
+            relation = self.relation_class(self.x_axis, y, copy=False)
+            self.assertIs(relation.y, y)
+            self.assertIsNot(self.relation_class(self.x_axis, y).y, y)
+
+        def test_memmap(self):
+            with tempfile.TemporaryDirectory() as directory:
+                filename = os.path.join(directory, "y.npy")
+                np.save(filename, self.relation.y)
+
+                relation = self.relation_class.from_npy(self.x_axis, filename)
+                self.assertIsInstance(relation, self.relation_class)
+                self.assertTrue(relation.is_memmap)
+                self.assertFalse(self.relation.is_memmap)
+                assert_array_equal(relation.y, self.relation.y)
+                self.assertEqual(relation.get_peak(), 123.)
+
+                result = relation.operate(
+                    self.simple_relation, MathOperation.SUB,
+                    out=os.path.join(directory, "result.npy"), chunk_size=4)
+                self.assertTrue(result.is_memmap)
+                assert_array_almost_equal(
+                    result.y, self.relation.y - self.simple_relation.y)
+                assert_array_almost_equal(
+                    np.load(os.path.join(directory, "result.npy")), result.y)
+
+                result = relation.operate(2, MathOperation.POW, chunk_size=4)
+                self.assertFalse(result.is_memmap)
+                assert_array_almost_equal(result.y, self.relation.y**2)
+
+                result = relation.map_chunks(np.abs, chunk_size=5)
+                assert_array_almost_equal(result.y, np.abs(self.relation.y))
+
+                with self.assertRaises(NotEqualError):
+                    relation.operate(self.relation_class([0, 1], [1, 2]),
+                                     MathOperation.ADD)
+
+                del relation, result
+
+        def test_slots(self):
+            self.assertFalse(hasattr(self.relation, "__dict__"))
+            self.assertFalse(hasattr(self.relation.x, "__dict__"))
+
+            relation = copy.copy(self.relation)
+            self.assertIsInstance(relation, self.relation_class)
+            assert_array_equal(relation.y, self.relation.y)
+
+            # Methods of `Config` are taken when they are called.
+            math_operation = Config.math_operation
+            try:
+                Config.math_operation = lambda y1, y2, operation: \
+                    math_operation(y1, y2, operation) * 0
+                assert_array_equal((self.relation + 1).y,
+                                   np.zeros(self.relation.size))
+            finally:
+                Config.math_operation = math_operation
+
+        def test_pickle(self):
+            self.relation.get_energy()
+            self.relation.x.array
+
+            buffers = []
+            data = pickle.dumps(self.relation, protocol=5,
+                                buffer_callback=buffers.append)
+            relation = pickle.loads(data, buffers=buffers)
+
+            self.assertIsInstance(relation, self.relation_class)
+            self.assertGreaterEqual(len(buffers), 1)
+            self.assertIsNone(relation.x._array)
+            self.assertEqual(relation._reductions, {})
+            assert_array_equal(relation.array, self.relation.array)
+            assert_array_equal(relation.y, self.relation.y)
+
+            math_operation = Config.math_operation
+            try:
+                Config.math_operation = lambda y1, y2, operation: \
+                    math_operation(y1, y2, operation)
+                relation = pickle.loads(pickle.dumps(
+                    self.relation_class(self.x_axis, self.relation.y)))
+                assert_array_equal((relation + 1).y, self.relation.y + 1)
+            finally:
+                Config.math_operation = math_operation
 
         def test_get_data(self):
             x, y = self.relation.get_data()
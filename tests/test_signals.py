@@ -1,9 +1,12 @@
 import numpy as np
-from numpy.testing import assert_array_equal
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+from scipy.signal import csd, welch
 
 from sweep_design.spectrum import Spectrum
 from sweep_design.axis import ArrayAxis
-from sweep_design.exc import ConvertingError, TypeFuncError
+from sweep_design.config.base_config import Config
+from sweep_design.exc import (
+    BadInputError, ConvertingError, NotEqualError, TypeFuncError)
 from sweep_design.relation import Relation
 from sweep_design.signal import Signal
 
@@ -94,6 +97,181 @@ class WrapperTestSignal:
             shift2 = delta.shift(10 * dt)
             self.assertEqual(shift2[10 * dt][1], 1)
 
+        def test_spectral_diff_integrate(self):
+            time = ArrayAxis(0, 1 - 0.001, 0.001)
+            omega = 2 * np.pi * 5
+            signal = self.relation_class(time, np.sin(omega * time.array))
+
+            diff_signal = signal.spectral_diff()
+            self.assertIsInstance(diff_signal, self.relation_class)
+            self.assertEqual(diff_signal.size, signal.size)
+            assert_array_almost_equal(
+                diff_signal.y, omega * np.cos(omega * time.array))
+
+            integrated = signal.spectral_integrate()
+            self.assertIsInstance(integrated, self.relation_class)
+            self.assertEqual(integrated.start, signal.start)
+            self.assertEqual(integrated.size, signal.size)
+            assert_array_almost_equal(
+                integrated.y, -np.cos(omega * time.array) / omega)
+
+            assert_array_almost_equal(
+                signal.spectral_integrate(2, 0.1).spectral_diff(2).y,
+                signal.y, decimal=3)
+
+        def test_get_band_spectrum(self):
+            for time in [ArrayAxis(0., 0.999, 0.001),
+                         ArrayAxis(-0.2, 0.799, 0.001)]:
+                signal = self.relation_class(
+                    time, np.random.default_rng(1).normal(size=time.size))
+                spectrum = signal.get_spectrum()
+
+                band = signal.get_band_spectrum(2., 120.)
+                self.assertAlmostEqual(band.start, 2.)
+                self.assertAlmostEqual(band.end, 120.)
+                self.assertEqual(band.size, 119)
+                assert_array_almost_equal(band.y, spectrum.y[2:121])
+
+            time = ArrayAxis(0.3, 1.299, 0.001)
+            signal = self.relation_class(time, signal.y)
+            band = signal.get_band_spectrum(10., 11., 0.01)
+            direct = np.exp(-2j * np.pi * np.outer(band.array, time.array)) \
+                @ signal.y
+            assert_array_almost_equal(band.y, direct)
+
+        def test_get_sparse_spectrum(self):
+            time = ArrayAxis(-0.2, 0.799, 0.001)
+            signal = self.relation_class(
+                time, np.random.default_rng(2).normal(size=time.size))
+
+            sparse = signal.get_sparse_spectrum([50., 150., 400., 100.])
+            assert_array_equal(sparse.frequency, [50., 150., 400., 100.])
+            assert_array_almost_equal(
+                sparse.amplitude,
+                signal.get_spectrum().y[[50, 150, 400, 100]])
+
+            sparse = signal.get_sparse_spectrum(ArrayAxis(10.5, 11.5, 0.5))
+            direct = np.exp(
+                -2j * np.pi * np.outer(sparse.frequency, time.array)) \
+                @ signal.y
+            assert_array_almost_equal(sparse.amplitude, direct)
+
+            sparse_spectrum = sparse.to_spectrum()
+            self.assertEqual(sparse_spectrum.start, 10.5)
+            self.assertEqual(sparse_spectrum.sample, 0.5)
+            assert_array_almost_equal(sparse_spectrum.y, direct)
+
+            for frequency in ([50., 60., 157.], [150., 100., 50.]):
+                with self.assertRaises(BadInputError):
+                    signal.get_sparse_spectrum(frequency).to_spectrum()
+
+        def test_single_precision_spectrum(self):
+            time = ArrayAxis(-0.2, 0.799, 0.001)
+            y = np.random.default_rng(6).normal(size=time.size)
+            signal = self.relation_class(time, y.astype(np.float32))
+
+            spectrum = signal.get_spectrum()
+            self.assertEqual(spectrum.y.dtype, np.complex64)
+            expected = self.relation_class(time, y).get_spectrum()
+            assert_array_almost_equal(spectrum.array, expected.array)
+            np.testing.assert_allclose(spectrum.y, expected.y, atol=1e-4)
+
+            restored = spectrum.get_signal()
+            self.assertEqual(restored.y.dtype, np.float32)
+            np.testing.assert_allclose(restored.y, y, atol=1e-5)
+
+            band = signal.get_band_spectrum(10., 20., 0.5)
+            self.assertEqual(band.y.dtype, np.complex64)
+            np.testing.assert_allclose(
+                band.y, self.relation_class(time, y).get_band_spectrum(
+                    10., 20., 0.5).y, atol=1e-4)
+            self.assertEqual(
+                signal.get_sparse_spectrum([50., 150.]).amplitude.dtype,
+                np.complex64)
+            self.assertEqual(
+                signal.get_power_spectral_density(100).y.dtype, np.float32)
+            self.assertEqual(
+                signal.get_cross_spectral_density(signal * 2, 100).y.dtype,
+                np.complex64)
+
+        def test_get_spectral_density(self):
+            time = ArrayAxis(0, 0.999, 0.001)
+            rng = np.random.default_rng(4)
+            signal = self.relation_class(time, rng.normal(size=time.size))
+            other = self.relation_class(time, rng.normal(size=time.size))
+
+            psd = signal.get_power_spectral_density(nperseg=128, hop=32)
+            frequency, expected = welch(
+                signal.y, fs=1000, nperseg=128, noverlap=96)
+            self.assertIsInstance(psd, Relation)
+            assert_array_almost_equal(psd.array, frequency)
+            assert_array_almost_equal(psd.y, expected)
+
+            density = signal.get_cross_spectral_density(other, nperseg=128)
+            frequency, expected = csd(signal.y, other.y, fs=1000, nperseg=128)
+            self.assertIsInstance(density, Spectrum)
+            assert_array_almost_equal(density.array, frequency)
+            assert_array_almost_equal(density.y, expected)
+
+            with self.assertRaises(NotEqualError):
+                signal.get_cross_spectral_density(
+                    self.relation_class(time.array[:-1], other.y[:-1]))
+
+            for hop in (0, -1, 129):
+                with self.subTest(hop=hop):
+                    with self.assertRaises(BadInputError):
+                        signal.get_power_spectral_density(nperseg=128, hop=hop)
+                    with self.assertRaises(BadInputError):
+                        signal.get_cross_spectral_density(
+                            other, nperseg=128, hop=hop)
+
 
 class TestSignal(WrapperTestSignal.BaseTestSignal):
-    pass
+
+    def test_block_correlate(self):
+        rng = np.random.default_rng(7)
+        record = Signal(ArrayAxis(0, 4.999, 0.001), rng.normal(size=5000))
+        reference = Signal(ArrayAxis(0, 0.299, 0.001), rng.normal(size=300))
+
+        result = record.block_correlate(reference, block_size=700)
+        expected = Signal.correlate(record, reference)
+        self.assertEqual(result.start, 0.)
+        self.assertAlmostEqual(result.end, record.end)
+        assert_array_almost_equal(result.y, expected.y[record.size - 1:])
+
+        result = record.astype("single").block_correlate(
+            reference.astype("single"))
+        self.assertEqual(result.precision, "single")
+        np.testing.assert_allclose(
+            result.y, expected.y[record.size - 1:], atol=1e-3)
+
+        with self.assertRaises(BadInputError):
+            reference.block_correlate(record)
+
+    def test_sparse_spectrum_batch(self):
+        time = ArrayAxis(0, 0.99, 0.01)
+        data = np.random.default_rng(3).normal(size=(4, time.size))
+        frequency = np.array([3., 7.25, 20.])
+
+        result = Config.sparse_spectrum_method(
+            data, time.sample, time.start, frequency, chunk_size=16)
+
+        self.assertEqual(result.shape, (4, 3))
+        for row, expected in zip(data, result):
+            assert_array_almost_equal(
+                Config.sparse_spectrum_method(
+                    row, time.sample, time.start, frequency), expected)
+        assert_array_almost_equal(
+            result[:, 0], np.fft.rfft(data, axis=-1)[:, 3])
+
+    def test_spectral_derivative_batch(self):
+        time = ArrayAxis(0, 1, 0.01)
+        data = np.vstack((np.sin(2 * np.pi * 3 * time.array),
+                          np.cos(2 * np.pi * 7 * time.array)))
+
+        result = Config.spectral_derivative_method(data, time.sample, -2, 0.5)
+
+        self.assertEqual(result.shape, data.shape)
+        for row, expected in zip(data, result):
+            assert_array_almost_equal(
+                Signal(time, row).spectral_integrate(2, 0.5).y, expected)
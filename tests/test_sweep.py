@@ -1,6 +1,14 @@
 
-from sweep_design.axis import ArrayAxis
+import numpy as np
+from numpy.testing import assert_array_almost_equal, assert_array_equal
 
+from sweep_design.axis import ArrayAxis
+from sweep_design.config.sweep_config import SweepConfig
+from sweep_design.defaults.hilbert import StreamingHilbert
+from sweep_design.defaults.stft import STFTSpectrogram
+from sweep_design.defaults.sweep_methods import get_a_t, get_f_t, get_spectrogram
+from sweep_design.exc import BadInputError
+from sweep_design.spectrogram import Spectrogram, SpectrogramPyramid
 from sweep_design.sweep import Sweep
 from .test_signals import WrapperTestSignal
 
@@ -18,3 +26,112 @@ class TestSweep(WrapperTestSignal.BaseTestSignal):
         self.x_axis_2 = ArrayAxis(start=0, end=0.6, sample=0.1)
         self.simple_second_relation = self.relation_class(self.x_axis_2,
                                                           [10, 20, 30, 40, 50, 60, 70])
+
+    def test_stft_spectrogram(self):
+        time = ArrayAxis(0., 20., 0.002)
+        sweep = Sweep(time, np.sin(2 * np.pi * (5 + 2 * time.array) * time.array))
+
+        time_, frequency, image = get_spectrogram(sweep)
+        assert_array_almost_equal(sweep.spectrogram.time.array, time_)
+        assert_array_almost_equal(sweep.spectrogram.frequency.array, frequency)
+        assert_array_almost_equal(sweep.spectrogram.spectrogram, image)
+
+        engine = STFTSpectrogram(nperseg=128, hop=32, window="hann", nfft=512,
+                                 scaling="magnitude", dtype=np.float32,
+                                 chunk_size=50)
+        spectrogram = engine(sweep)
+        self.assertEqual(spectrogram.spectrogram.dtype, np.float32)
+        self.assertEqual(spectrogram.spectrogram.shape,
+                         (spectrogram.frequency.size, spectrogram.time.size))
+        self.assertAlmostEqual(spectrogram.frequency.sample, 500 / 512)
+        self.assertAlmostEqual(spectrogram.time.sample, 32 * 0.002)
+
+        chunks = list(engine.iter_chunks(sweep))
+        self.assertEqual(len(chunks), int(np.ceil(spectrogram.time.size / 50)))
+        assert_array_equal(
+            np.concatenate([chunk.spectrogram for chunk in chunks], axis=1),
+            spectrogram.spectrogram)
+        self.assertAlmostEqual(chunks[1].time.start,
+                               spectrogram.time.array[50])
+
+        db = STFTSpectrogram(scaling="db")(sweep).spectrogram
+        assert_array_almost_equal(10**(db / 10), image)
+
+        for hop in [0, -1, 257]:
+            with self.assertRaises(BadInputError):
+                STFTSpectrogram(hop=hop)
+
+    def test_streaming_hilbert(self):
+        time = ArrayAxis(0., 20., 0.001)
+        y = np.sin(2 * np.pi * (5 + 2 * time.array) * time.array)
+        sweep = Sweep(time, y)
+
+        analyzer = StreamingHilbert(block_size=2 * time.size)
+        assert_array_almost_equal(analyzer.get_f_t(sweep).y, get_f_t(sweep).y)
+        assert_array_almost_equal(analyzer.get_a_t(sweep).y, get_a_t(sweep).y)
+
+        analyzer = StreamingHilbert(block_size=3000, overlap=2000,
+                                    decimation=4)
+        frequency_time, amplitude_time = analyzer(sweep)
+        assert_array_almost_equal(frequency_time.array, time.array[::4])
+        inner = slice(500, -500)
+        expected = 5 + 4 * (time.array[::4] - time.sample / 2)
+        np.testing.assert_allclose(
+            frequency_time.y[inner], expected[inner], atol=0.05)
+        np.testing.assert_allclose(amplitude_time.y[inner], 1., atol=0.01)
+
+        chunks = list(analyzer.iter_chunks(sweep))
+        self.assertEqual(len(chunks), 7)
+        assert_array_equal(
+            np.concatenate([chunk.frequency for chunk in chunks]),
+            frequency_time.y)
+        self.assertAlmostEqual(chunks[1].time.start, 3.)
+
+        get_f_t_default = SweepConfig.get_f_t
+        try:
+            SweepConfig.get_f_t = analyzer.get_f_t
+            self.assertEqual(Sweep(time, y).frequency_time.size,
+                             frequency_time.size)
+        finally:
+            SweepConfig.get_f_t = get_f_t_default
+
+    def test_passed_spectrogram(self):
+        time, frequency, image = get_spectrogram(self.relation)
+        sweep = Sweep(self.x_axis, self.relation.y,
+                      spectrogram=(time, frequency, image))
+        self.assertIsInstance(sweep.spectrogram, Spectrogram)
+        self.assertEqual(sweep.spectrogram.time.size, 2)
+        assert_array_equal(sweep.spectrogram.spectrogram[:, :1], image)
+
+        with self.assertRaises(BadInputError):
+            Sweep(self.x_axis, self.relation.y,
+                  spectrogram=(time, frequency, image[0]))
+
+    def test_spectrogram_pyramid(self):
+        image = np.arange(40 * 1000, dtype=float).reshape(40, 1000)
+        spectrogram = Spectrogram(ArrayAxis(0., 99.9, 0.1),
+                                  ArrayAxis(0., 39., 1.), image)
+
+        pyramid = SpectrogramPyramid(spectrogram, factor=2, min_size=30)
+
+        self.assertEqual([level.spectrogram.shape for level in pyramid.levels],
+                         [(40, 1000), (20, 500), (20, 250), (20, 125),
+                          (20, 63), (20, 32), (20, 16)])
+        level = pyramid.get_level(1)
+        self.assertEqual(level.spectrogram[0, 0], image[:2, :2].mean())
+        self.assertAlmostEqual(level.time.start, 0.05)
+        self.assertAlmostEqual(level.time.sample, 0.2)
+        self.assertAlmostEqual(level.frequency.end, 38.5)
+        self.assertEqual(level.frequency.size, 20)
+
+        region = pyramid.get_region(10., 20., 5., 15., width=40, height=5)
+        self.assertEqual(region.time.size, 50)
+        self.assertEqual(region.frequency.size, 5)
+        self.assertEqual(region.spectrogram.shape, (5, 50))
+        self.assertTrue(np.shares_memory(region.spectrogram,
+                                         pyramid.get_level(1).spectrogram))
+        self.assertAlmostEqual(region.frequency.start, 6.5)
+        self.assertAlmostEqual(region.time.start, 10.05)
+
+        region = pyramid.get_region(10., 20.)
+        assert_array_equal(region.spectrogram, image[:, 100:201])
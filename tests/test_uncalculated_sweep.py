@@ -1,8 +1,13 @@
 import unittest
 
-from sweep_design.defaults.sweep_methods import InterpolateArray
+import numpy as np
+
+from sweep_design.defaults.sweep_methods import (InterpolateArray,
+                                                 clear_a_prior_cache)
+from sweep_design.config.base_config import Config
 from sweep_design.exc import BadInputError
 from sweep_design.relation import Relation
+from sweep_design.signal import Signal
 from sweep_design.sweep import Sweep
 from sweep_design.uncalculated_sweep import UncalculatedSweep, ApriorUncalculatedSweep
 from sweep_design.axis import ArrayAxis
@@ -64,3 +69,71 @@ class TestUncalculatedSweep(unittest.TestCase):
                                 continue
 
                             self.check_creation(time, f_t, a_t, second_time)
+
+    def test_interpolate_array_memo(self):
+        interpolate = InterpolateArray([0, 1, 3, 4], [0., 2., 6., 4.])
+        time = ArrayAxis(1., 9., 1.)
+
+        result = interpolate(time)
+
+        np.testing.assert_array_almost_equal(
+            result, [0., 1., 2., 3., 4., 5., 6., 5., 4.])
+        self.assertFalse(result.flags.writeable)
+        self.assertIs(interpolate(ArrayAxis(1., 9., 1.)), result)
+        self.assertIsNot(interpolate(ArrayAxis(1., 9., 0.5)), result)
+
+        interpolate_extrapolate_method = Config.interpolate_extrapolate_method
+        try:
+            Config.interpolate_extrapolate_method = \
+                lambda x, y: lambda new_x: np.zeros(new_x.size)
+            zero = interpolate(ArrayAxis(1., 9., 1.))
+        finally:
+            Config.interpolate_extrapolate_method = \
+                interpolate_extrapolate_method
+        np.testing.assert_array_equal(zero, np.zeros(9))
+        self.assertIs(interpolate(ArrayAxis(1., 9., 1.)), result)
+
+
+class TestApriorUncalculatedSweep(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_a_prior_cache()
+        time = ArrayAxis(0., 2., 0.01)
+        self.a_prior_signal = Signal(
+            time, np.sin(2 * np.pi * 20 * time.array) * np.exp(-time.array))
+
+    def test_shared_analysis(self):
+        first = ApriorUncalculatedSweep(None, self.a_prior_signal)
+        copy_signal = Signal(self.a_prior_signal.x.copy(),
+                             self.a_prior_signal.y.copy())
+        second = ApriorUncalculatedSweep(None, copy_signal)
+
+        self.assertIs(first._frequency_time, second._frequency_time)
+        self.assertIs(first._amplitude_time, second._amplitude_time)
+        self.assertEqual(first._a_prior_norm,
+                         self.a_prior_signal.get_norm())
+
+        other = ApriorUncalculatedSweep(None, self.a_prior_signal * 2)
+        self.assertIsNot(first._frequency_time, other._frequency_time)
+
+        sweep = first(ArrayAxis(0., 5., 0.01))
+        self.assertAlmostEqual(sweep.get_norm(),
+                               self.a_prior_signal.get_norm())
+        self.assertIs(sweep.a_prior_signal, self.a_prior_signal)
+
+    def test_analysis_depends_on_config(self):
+        first = ApriorUncalculatedSweep(None, self.a_prior_signal)
+        try:
+            Config.precision = "single"
+            single = ApriorUncalculatedSweep(None, self.a_prior_signal)
+        finally:
+            Config.precision = None
+        self.assertIsNot(first._frequency_time, single._frequency_time)
+
+        a_prior_spectrum = self.a_prior_signal.get_spectrum()
+        first = ApriorUncalculatedSweep(None, a_prior_spectrum)
+        second = ApriorUncalculatedSweep(None, a_prior_spectrum)
+        self.assertIs(first._frequency_time, second._frequency_time)
+        self.assertIsNot(first._a_prior_signal, second._a_prior_signal)
+
+        second._a_prior_signal.y[:] = 0
+        self.assertNotEqual(np.abs(first._a_prior_signal.y).max(), 0)
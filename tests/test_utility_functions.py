@@ -1,16 +1,50 @@
 import unittest
+from multiprocessing import Pool
 
 import numpy as np
+from scipy.signal import csd, welch
 
 from sweep_design.axis import ArrayAxis
+from sweep_design.exc import BadInputError
 from sweep_design.spectrum import Spectrum
 from sweep_design.signal import Signal
-from sweep_design.utility_functions.ftat_functions import proportional_freq2time, dwell
+from sweep_design.utility_functions.ftat_functions import proportional_freq2time, dwell, dwell_batch
 from sweep_design.utility_functions.emd_analyze import get_IMFs_ceemdan, get_IMFs_emd
+from sweep_design.utility_functions.ceemdan_pool import (
+    CEEMDANPool, get_IMFs_ceemdan_pool)
 from sweep_design.utility_functions.f_t import f_t_linear_array, f_t_linear_function
-from sweep_design.utility_functions.a_t import tukey_a_t
+from sweep_design.utility_functions.a_t import tukey_a_t, window_a_t
 from sweep_design.utility_functions.sweep_correction import correct_sweep
 from sweep_design.utility_functions.source_sweep_correction import get_correction_for_source
+from sweep_design.utility_functions.spectral_density import (
+    get_cross_spectral_densities, get_mean_power_spectral_density,
+    get_power_spectral_densities)
+from sweep_design.utility_functions.batch_source_correction import (
+    SourceParameters, get_corrections_for_sources)
+from sweep_design.utility_functions.shared_signals import (
+    SharedSignals, attach_signals)
+
+
+def _correlate_shared(infos):
+    record, reference, out = attach_signals(*infos)
+    out.y[:] = record.block_correlate(reference).y
+    return float(record.y.sum())
+
+
+def _dwell_cumprod(spectrum, f_start, f_end, fc):
+    f, a_f = spectrum.select_data(
+        f_start, f_end).get_amp_spectrum().get_data()
+    f_c = fc if fc else f[0]
+    freq = f[f <= f_c]
+    freq_ratio = np.divide(freq[1:], freq[:-1], out=np.ones_like(freq[1:]),
+                           where=freq[:-1] != 0)
+    dur = np.cumprod(1 / (freq_ratio**4))
+    n_t = np.append([0.0], dur * a_f[f <= f_c][:-1] ** 2).cumsum()
+    n_t2 = np.append(n_t[-1], dur[-1] * (a_f[f > f_c] ** 2)).cumsum()
+    n_t = np.append(n_t, n_t2[1:])
+    a_t = np.cumprod(np.append([1.0], freq_ratio**2))
+    a_t = np.append(a_t, [a_t[-1]] * (len(a_f) - len(a_t)))
+    return n_t, f, a_t
 
 
 class TestUtilityFunctions(unittest.TestCase):
@@ -32,6 +66,81 @@ class TestUtilityFunctions(unittest.TestCase):
                 self.assertIsInstance(result[1], np.ndarray)
                 self.assertIsInstance(result[2], np.ndarray)
 
+    def test_dwell_batch(self):
+        spectrum = Spectrum(ArrayAxis(0, 50, 0.5),
+                            np.linspace(1, 2, 101))
+        f_start = [0, 6, None, 2.2]
+        f_central = [1, 10, 3, None]
+        f_end = [5, 40, None, 30]
+
+        results = dwell_batch(spectrum, f_start, f_central, f_end)
+
+        self.assertEqual(len(results), 4)
+        for result, params in zip(results, zip(f_start, f_end, f_central)):
+            expected = dwell(*params)(spectrum)
+            for array, expected_array in zip(result, expected):
+                np.testing.assert_array_equal(array, expected_array)
+
+        # The cumulative products of the original implementation.
+        for result, params in zip(results[:3], zip(f_start, f_end, f_central)):
+            expected = _dwell_cumprod(spectrum, *params)
+            for array, expected_array in zip(result, expected):
+                np.testing.assert_array_almost_equal(array, expected_array)
+
+        # Without the central frequency the envelope is constant.
+        n_t, f, a_t = results[3]
+        a_f = spectrum.select_data(2.2, 30).get_amp_spectrum().y
+        np.testing.assert_array_equal(a_t, np.ones(f.size))
+        np.testing.assert_array_almost_equal(
+            n_t, np.append(0.0, np.cumsum(a_f[1:] ** 2)))
+
+        n_t, f, a_t = results[1]
+        self.assertEqual(f[0], 6)
+        self.assertEqual(f[-1], 40)
+        self.assertEqual(n_t[0], 0)
+        self.assertTrue(np.all(np.diff(n_t) > 0))
+        np.testing.assert_array_almost_equal(a_t[f <= 10], (f[f <= 10] / 6)**2)
+        np.testing.assert_array_equal(a_t[f > 10], a_t[f <= 10][-1])
+
+    def test_spectral_densities(self):
+        time = ArrayAxis(0, 0.999, 0.001)
+        data = np.random.default_rng(5).normal(size=(3, time.size))
+        signals = [Signal(time, y) for y in data]
+
+        densities = get_power_spectral_densities(signals, nperseg=100)
+        _, expected = welch(data, fs=1000, nperseg=100)
+        self.assertEqual(len(densities), 3)
+        for density, expected_density in zip(densities, expected):
+            np.testing.assert_array_almost_equal(density.y, expected_density)
+        self.assertIsNot(densities[0].x, densities[1].x)
+        densities[0].x.start = 1.0
+        self.assertEqual(densities[1].x.start, 0.0)
+
+        mean = get_mean_power_spectral_density(signals, nperseg=100)
+        np.testing.assert_array_almost_equal(mean.y, expected.mean(axis=0))
+
+        densities = get_cross_spectral_densities(
+            signals[1:], signals[0], nperseg=100, hop=25)
+        _, expected = csd(data[1:], data[0], fs=1000, nperseg=100,
+                          noverlap=75)
+        for density, expected_density in zip(densities, expected):
+            np.testing.assert_array_almost_equal(density.y, expected_density)
+
+        with self.assertRaises(BadInputError):
+            get_power_spectral_densities(
+                signals + [Signal(ArrayAxis(0, 1.998, 0.002), data[0])])
+
+        for hop in (0, -1, 101):
+            with self.subTest(hop=hop):
+                with self.assertRaises(BadInputError):
+                    get_power_spectral_densities(signals, nperseg=100, hop=hop)
+                with self.assertRaises(BadInputError):
+                    get_mean_power_spectral_density(
+                        signals, nperseg=100, hop=hop)
+                with self.assertRaises(BadInputError):
+                    get_cross_spectral_densities(
+                        signals[1:], signals[0], nperseg=100, hop=hop)
+
     def test_emd_analyze(self):
 
         get_emd_functions = [get_IMFs_emd, get_IMFs_ceemdan]
@@ -45,6 +154,69 @@ class TestUtilityFunctions(unittest.TestCase):
 
                 self.assertGreater(len(emd_result), 0)
 
+    def test_ceemdan_pool(self):
+        time_axis = ArrayAxis(0, 1, 0.005)
+        signal = Signal(time_axis,
+                        np.sin(2 * np.pi * 5 * time_axis.array) +
+                        0.5 * np.sin(2 * np.pi * 40 * time_axis.array))
+
+        with CEEMDANPool(trials=6, seed=1, processes=1) as ceemdan:
+            imfs_one = ceemdan(signal)
+
+        with CEEMDANPool(trials=6, seed=1, processes=2) as ceemdan:
+            imfs_two = ceemdan(signal)
+            imfs_repeat = ceemdan(signal)
+
+        self.assertGreater(len(imfs_one), 1)
+        self.assertEqual(len(imfs_one), len(imfs_two))
+        for imf_one, imf_two, imf_repeat in zip(
+                imfs_one, imfs_two, imfs_repeat):
+            self.assertIsInstance(imf_one, Signal)
+            np.testing.assert_array_equal(imf_one.y, imf_two.y)
+            np.testing.assert_array_equal(imf_one.y, imf_repeat.y)
+
+        np.testing.assert_array_almost_equal(
+            np.sum([k.y for k in imfs_one], axis=0), signal.y)
+
+        imfs_limited = get_IMFs_ceemdan_pool(
+            signal, trials=6, seed=1, processes=1, max_imf=1)
+        self.assertLess(len(imfs_limited), len(imfs_one))
+        np.testing.assert_array_almost_equal(
+            np.sum([k.y for k in imfs_limited], axis=0), signal.y)
+
+    def test_shared_signals(self):
+        time = ArrayAxis(0., 0.999, 0.001)
+        records = [Signal(time, np.random.default_rng(i).normal(size=1000))
+                   for i in range(3)]
+        reference = Signal(ArrayAxis(0., 0.099, 0.001), np.hanning(100))
+
+        with SharedSignals(records + [reference]) as shared, \
+                SharedSignals.empty(time, 3) as out:
+            for info in shared.infos:
+                self.assertEqual(info.offset % 64, 0)
+            signals = shared.signals
+            self.assertIsInstance(signals[0], Signal)
+            self.assertEqual(signals[0].end, time.end)
+            self.assertEqual(signals[0].sample, time.sample)
+            np.testing.assert_array_equal(signals[1].y, records[1].y)
+            del signals
+
+            tasks = [(info, shared.infos[-1], out_info)
+                     for info, out_info in zip(shared.infos, out.infos)]
+            with Pool(2) as pool:
+                sums = pool.map(_correlate_shared, tasks)
+
+            for record, total, result in zip(records, sums, out.signals):
+                self.assertAlmostEqual(total, record.y.sum())
+                np.testing.assert_array_almost_equal(
+                    result.y, record.block_correlate(reference).y)
+            del result
+
+        with self.assertRaises(BadInputError):
+            shared.signals
+        with self.assertRaises(BadInputError):
+            SharedSignals([])
+
     def test_linear_functions(self):
         time_axis = ArrayAxis(0, 10, 0.1)
         func = f_t_linear_function(0, 10, 5, 95)
@@ -80,6 +252,32 @@ class TestUtilityFunctions(unittest.TestCase):
         self.assertEqual(left_result[-1], 0)
         self.assertEqual(left_result[int(left_result.size / 2)], 1)
 
+        left_result[:] = 0
+        np.testing.assert_array_equal(
+            tukey_a_t(time_axis.array, 1, "both"),
+            window_a_t(time_axis.array, 1, "both"))
+        self.assertFalse(window_a_t(time_axis.array, 1, "both").flags.writeable)
+        self.assertIs(window_a_t(time_axis.array, 1, "both"),
+                      window_a_t(time_axis.array, 1, "both"))
+
+    def test_window_a_t(self):
+        time_axis = ArrayAxis(0, 10, 0.1)
+
+        for kind in ["tukey", "hann", "blackman", "cosine"]:
+            with self.subTest("Test of taper window", kind=kind):
+                window = window_a_t(time_axis.array, 1, "both", kind)
+
+                self.assertEqual(window.size, time_axis.size)
+                self.assertLess(window[0], 0.1)
+                self.assertLess(window[-1], 0.1)
+                self.assertEqual(window[int(window.size / 2)], 1)
+
+                left = window_a_t(time_axis.array, 1, "left", kind)
+                right = window_a_t(time_axis.array, 1, "right", kind)
+
+                np.testing.assert_array_equal(left, right[::-1])
+                self.assertEqual(left[-1], 1)
+
     def test_sweep_correction(self):
         time_axis = ArrayAxis(0, 10, 0.1)
 
@@ -93,6 +291,11 @@ class TestUtilityFunctions(unittest.TestCase):
 
         self.assertIsInstance(new_signal_with_window, Signal)
 
+        spectral_signal = correct_sweep(signal, 1., low_frequency=0.1)
+
+        self.assertIsInstance(spectral_signal, Signal)
+        self.assertEqual(spectral_signal.size, signal.size)
+
     def test_sweep_correction_source(self):
 
         time_axis = ArrayAxis(0, 10, 0.1)
@@ -105,3 +308,46 @@ class TestUtilityFunctions(unittest.TestCase):
 
         correct_sweep_with_params = get_correction_for_source(
             signal * 120, 100, 0.01, 0.7, 10, 0.05, lambda x: x)
+
+        self.assertIsInstance(correct_sweep_with_params, Signal)
+
+        spectral_correct_sweep = get_correction_for_source(
+            signal * 120, 100, 0.01, 0.7, 10, 0.05, lambda x: x, 0.05)
+
+        self.assertIsInstance(spectral_correct_sweep, Signal)
+        self.assertEqual(spectral_correct_sweep.size, signal.size)
+
+    def test_batch_sweep_correction_source(self):
+
+        time_axis = ArrayAxis(0, 10, 0.1)
+
+        signals = [
+            Signal(time_axis, np.sin(2 * np.pi * time_axis.array)) * 120,
+            Signal(time_axis, np.sin(3 * np.pi * time_axis.array)) * 120
+        ]
+        parameters = [
+            SourceParameters(100, 0.01, 0.7, 3, 0.05),
+            SourceParameters(reaction_mass=50),
+        ]
+
+        results = list(get_corrections_for_sources(
+            signals, parameters, processes=2, max_pending=2))
+
+        self.assertEqual(len(results), 4)
+        self.assertEqual(
+            sorted((k.signal_index, k.parameters_index) for k in results),
+            [(0, 0), (0, 1), (1, 0), (1, 1)])
+
+        for result in results:
+            self.assertIsInstance(result.signal, Signal)
+            self.assertGreaterEqual(result.time, 0)
+
+            expected = get_correction_for_source(
+                signals[result.signal_index],
+                *parameters[result.parameters_index])
+            np.testing.assert_array_almost_equal(result.signal.y, expected.y)
+
+            if parameters[result.parameters_index].limits is None:
+                self.assertEqual(result.iterations, 0)
+            else:
+                self.assertGreater(result.iterations, 0)